@@ -0,0 +1,48 @@
+"""
+Throughput of TransactionService.process_batch for settled columnar
+batches of increasing size over a fixed set of accounts.
+
+    python -m benchmarks.batch_transfer_benchmark --accounts 10000 --rows 2000 20000 200000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--accounts', type=int, default=10_000)
+    parser.add_argument('--rows', type=int, nargs='+', default=[2_000, 20_000, 200_000])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    account_service = AccountService()
+    transaction_service = TransactionService(account_service)
+    numbers = [
+        account_service.create_account(f'C{i}', initial_balance=1_000_000_000.0).account_number
+        for i in range(args.accounts)
+    ]
+    rng = np.random.default_rng(args.seed)
+
+    for rows in args.rows:
+        src = rng.integers(0, args.accounts, rows)
+        dst = (src + rng.integers(1, args.accounts, rows)) % args.accounts
+        from_accounts = [numbers[i] for i in src.tolist()]
+        to_accounts = [numbers[i] for i in dst.tolist()]
+        amounts = rng.uniform(1, 100, rows)
+
+        start = time.perf_counter()
+        result = transaction_service.process_batch(from_accounts, to_accounts, amounts)
+        elapsed = time.perf_counter() - start
+        print(
+            f'rows={rows:<8} {rows / elapsed:>10,.0f} rows/s  {elapsed:6.2f}s'
+            f'  completed={result["completed"]}'
+        )
+
+
+if __name__ == '__main__':
+    main()
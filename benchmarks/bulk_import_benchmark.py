@@ -0,0 +1,66 @@
+"""
+End-to-end bulk user import: generate a CSV of synthetic users (with a
+share of invalid and duplicate rows) and import it. Logins hash inline;
+the import hashes on its own pool of --workers processes.
+
+    python -m benchmarks.bulk_import_benchmark --users 500000 --scrypt-n 16384
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.services.authentication_service import AuthenticationService
+from src.services.bulk_import_service import BulkImportService
+from src.services.registration_service import RegistrationService
+
+
+def write_users(path, count):
+    with open(path, 'w', newline='', encoding='utf-8') as target:
+        writer = csv.writer(target)
+        writer.writerow(['username', 'password', 'email'])
+        for i in range(count):
+            if i % 100 == 99:
+                writer.writerow([f'u{i}', 'short', f'bad-email-{i}'])
+            elif i % 100 == 98:
+                writer.writerow([f'user{i - 1}', 'Passw0rd!x', f'dup{i}@example.com'])
+            else:
+                writer.writerow([f'user{i}', f'Passw0rd!{i}', f'user{i}@example.com'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--scrypt-n', type=int, default=2 ** 14)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--batch-size', type=int, default=2000)
+    args = parser.parse_args()
+
+    hasher = PasswordHasher(SCRYPT, {'n': args.scrypt_n, 'r': 8, 'p': 1})
+    auth_service = AuthenticationService(password_hasher=hasher)
+    importer = BulkImportService(
+        RegistrationService(auth_service),
+        batch_size=args.batch_size,
+        hash_workers=args.workers
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'users.csv')
+        report = os.path.join(directory, 'errors.csv')
+        write_users(source, args.users)
+
+        start = time.perf_counter()
+        result = importer.import_file(source, error_report_path=report)
+        elapsed = time.perf_counter() - start
+
+    print(
+        f'{result["rows"]:,} rows  imported={result["imported"]:,}  failed={result["failed"]:,}'
+        f'  {elapsed:.1f}s  ({result["rows"] / elapsed:,.0f} rows/s,'
+        f' scrypt n={args.scrypt_n}, pool workers={importer.password_hasher.workers})'
+    )
+
+
+if __name__ == '__main__':
+    main()
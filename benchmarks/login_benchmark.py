@@ -0,0 +1,82 @@
+"""
+Login throughput and latency for a burst of concurrent authentications
+(e.g. market open) at different KDF cost settings and pool sizes.
+
+    python -m benchmarks.login_benchmark --users 200 --threads 64 --workers 0 2 4
+"""
+import argparse
+import os
+import secrets
+import threading
+import time
+
+from src.algorithms.encryption_utils import PBKDF2, SCRYPT, PasswordHasher
+from src.core.user import User
+from src.services.authentication_service import AuthenticationService
+
+COST_SETTINGS = (
+    ('scrypt n=2^12', SCRYPT, {'n': 2 ** 12, 'r': 8, 'p': 1}),
+    ('scrypt n=2^14', SCRYPT, {'n': 2 ** 14, 'r': 8, 'p': 1}),
+    ('pbkdf2 100k', PBKDF2, {'iterations': 100_000}),
+)
+
+
+def run(label, algorithm, parameters, workers, users, threads):
+    hasher = PasswordHasher(algorithm, parameters, workers=workers)
+    service = AuthenticationService(password_hasher=hasher)
+
+    names = [f'user{i}' for i in range(users)]
+    salts = [secrets.token_hex(16) for _ in names]
+    hashes = hasher.hash_many(names, salts)
+    for name, salt, password_hash in zip(names, salts, hashes):
+        service.restore_user(User(username=name, password_hash=password_hash, salt=salt))
+
+    latencies = []
+    lock = threading.Lock()
+    start_gate = threading.Barrier(threads + 1)
+
+    def worker(offset):
+        start_gate.wait()
+        for name in names[offset::threads]:
+            began = time.perf_counter()
+            assert service.authenticate(name, name) is not None
+            elapsed = time.perf_counter() - began
+            with lock:
+                latencies.append(elapsed)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for thread in pool:
+        thread.start()
+    start_gate.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    hasher.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(
+        f'{label:<14} workers={workers:<3} {users / elapsed:>8,.1f} logins/s'
+        f'  p50={p50:>8.1f} ms  p99={p99:>8.1f} ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument(
+        '--workers', type=int, nargs='+',
+        default=sorted({0, 2, os.cpu_count() or 1})
+    )
+    args = parser.parse_args()
+
+    for label, algorithm, parameters in COST_SETTINGS:
+        for workers in args.workers:
+            run(label, algorithm, parameters, workers, args.users, args.threads)
+
+
+if __name__ == '__main__':
+    main()
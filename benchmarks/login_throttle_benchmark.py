@@ -0,0 +1,93 @@
+"""
+Legitimate login latency while a credential-stuffing attack runs, with
+login throttling off and on.
+
+    python -m benchmarks.login_throttle_benchmark --duration 5 --attackers 8
+"""
+import argparse
+import os
+import secrets
+import threading
+import time
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.core.user import User
+from src.services.authentication_service import AuthenticationService
+
+
+def run(label, throttling, users, attackers, attack_rate, duration, legit_interval):
+    hasher = PasswordHasher(SCRYPT, {'n': 2 ** 12, 'r': 8, 'p': 1}, workers=os.cpu_count())
+    service = AuthenticationService(password_hasher=hasher, login_throttling=throttling)
+
+    names = [f'user{i}' for i in range(users)]
+    salts = [secrets.token_hex(16) for _ in names]
+    for name, salt, password_hash in zip(names, salts, hasher.hash_many(names, salts)):
+        service.restore_user(User(username=name, password_hash=password_hash, salt=salt))
+
+    stop = threading.Event()
+    latencies = []
+    failures = []
+
+    def legitimate(offset):
+        # Each real user logs in once, from their own client
+        for name in names[offset::2]:
+            if stop.is_set():
+                return
+            began = time.perf_counter()
+            if service.authenticate(name, name, client_id=f'client-{name}') is None:
+                failures.append(name)
+            latencies.append(time.perf_counter() - began)
+            time.sleep(legit_interval)
+
+    def attacker(worker_id):
+        # Stuffs guesses for every username from a handful of clients
+        attempt = 0
+        while not stop.is_set():
+            name = names[attempt % len(names)]
+            service.authenticate(name, secrets.token_hex(4), client_id=f'bot-{worker_id}')
+            attempt += 1
+            time.sleep(1 / attack_rate)
+
+    threads = [threading.Thread(target=attacker, args=(i,)) for i in range(attackers)]
+    legit = [threading.Thread(target=legitimate, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)  # Let the attack build up first
+    for thread in legit:
+        thread.start()
+
+    time.sleep(duration)
+    stop.set()
+    for thread in threads + legit:
+        thread.join()
+    hasher.close()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else float('nan')
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000 if latencies else float('nan')
+    stats = service.login_stats()
+    print(
+        f'{label:<14} legit logins={len(latencies):<5} p50={p50:>8.1f} ms  p99={p99:>8.1f} ms'
+        f'  locked out={len(failures):<4} served={stats["served"]:<7} throttled={stats["throttled"]}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--attackers', type=int, default=8)
+    parser.add_argument('--attack-rate', type=float, default=100.0,
+                        help='attempts per second per attacker')
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--legit-interval', type=float, default=0.02)
+    args = parser.parse_args()
+
+    for label, throttling in (('no throttle', False), ('throttled', True)):
+        run(
+            label, throttling, args.users, args.attackers, args.attack_rate,
+            args.duration, args.legit_interval
+        )
+
+
+if __name__ == '__main__':
+    main()
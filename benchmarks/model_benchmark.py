@@ -0,0 +1,109 @@
+"""
+Memory and construction cost of the domain models: the previous layout
+(per-instance __dict__, uuid4-derived IDs) against the current slotted
+dataclasses with generator-issued IDs.
+
+    python -m benchmarks.model_benchmark --objects 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from src.core.account import Account
+from src.core.id_generator import ACCOUNT_IDS, TRANSACTION_IDS
+from src.core.transaction import Transaction
+
+
+@dataclass
+class LegacyAccount:
+    account_number: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    customer_id: str = None
+    account_type: str = 'Savings'
+    balance: float = 0.0
+    created_at: datetime = field(default_factory=datetime.now)
+    is_active: bool = True
+    overdraft_limit: float = 0.0
+
+
+@dataclass
+class LegacyTransaction:
+    transaction_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    from_account: Optional[str] = None
+    to_account: Optional[str] = None
+    amount: float = 0.0
+    transaction_type: str = 'TRANSFER'
+    timestamp: datetime = field(default_factory=datetime.now)
+    status: str = 'PENDING'
+
+
+def measure(label, count, build):
+    """
+    Construction rate (untraced run) and retained bytes and allocation
+    blocks per object (traced run)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    objects = build(count)
+    elapsed = time.perf_counter() - start
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(count)
+    retained, _ = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    del objects
+
+    print(
+        f'{label:<36} {count / elapsed:>12,.0f} objects/s'
+        f'  {retained / count:>7.1f} B/object  {blocks / count:>5.2f} blocks/object'
+    )
+
+
+def preallocated(generator, build):
+    """
+    Reserve the IDs up front (included in the measurement) and then build
+    """
+    def run(count):
+        generator.preallocate(count)
+        return build(count)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--objects', type=int, default=1_000_000)
+    args = parser.parse_args()
+    count = args.objects
+
+    build_account = lambda n: [
+        Account(customer_id='C1', balance=float(i)) for i in range(n)
+    ]
+    build_transaction = lambda n: [
+        Transaction(from_account='A', to_account='B', amount=float(i))
+        for i in range(n)
+    ]
+
+    measure('legacy Account', count, lambda n: [
+        LegacyAccount(customer_id='C1', balance=float(i)) for i in range(n)
+    ])
+    measure('slotted Account', count, build_account)
+    measure('slotted Account (preallocated)', count,
+            preallocated(ACCOUNT_IDS, build_account))
+
+    measure('legacy Transaction', count, lambda n: [
+        LegacyTransaction(from_account='A', to_account='B', amount=float(i))
+        for i in range(n)
+    ])
+    measure('slotted Transaction', count, build_transaction)
+    measure('slotted Transaction (preallocated)', count,
+            preallocated(TRANSACTION_IDS, build_transaction))
+
+if __name__ == '__main__':
+    main()
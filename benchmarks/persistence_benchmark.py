@@ -0,0 +1,74 @@
+"""
+Write throughput and recovery time of the persistence layer.
+
+    python -m benchmarks.persistence_benchmark --accounts 1000000
+"""
+import argparse
+import tempfile
+import time
+
+from src.services.account_service import AccountService
+from src.services.authentication_service import AuthenticationService
+from src.storage.persistence_manager import PersistenceManager
+
+
+def timed(label, count, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    rate = f'{count / elapsed:,.0f}/s' if count else ''
+    print(f'{label:<32} {elapsed:8.2f}s  {rate}')
+    return result
+
+
+def run(accounts: int, data_dir: str, fsync: bool) -> None:
+    account_service = AccountService()
+    manager = PersistenceManager(data_dir, fsync=fsync)
+    manager.attach(account_service, AuthenticationService())
+
+    created = timed(
+        'create accounts (logged)', accounts,
+        lambda: [
+            account_service.create_account(f'C{i % (accounts // 3 + 1)}', initial_balance=100.0)
+            for i in range(accounts)
+        ]
+    )
+    numbers = [account.account_number for account in created]
+
+    timed(
+        'deposits (logged)', accounts,
+        lambda: [account_service.deposit(number, 10.0) for number in numbers]
+    )
+    timed('snapshot', accounts, manager.snapshot)
+
+    tail = numbers[:max(1, accounts // 10)]
+    timed(
+        'log tail deposits', len(tail),
+        lambda: [account_service.deposit(number, 1.0) for number in tail]
+    )
+    manager.close()
+
+    recovered = AccountService()
+    recovery = PersistenceManager(data_dir, fsync=fsync)
+    recovery.attach(recovered, AuthenticationService())
+    stats = timed('recovery (snapshot + tail)', accounts, recovery.recover)
+    recovery.close()
+    print(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--accounts', type=int, default=1_000_000)
+    parser.add_argument('--data-dir', default=None)
+    parser.add_argument('--no-fsync', action='store_true')
+    args = parser.parse_args()
+
+    if args.data_dir:
+        run(args.accounts, args.data_dir, not args.no_fsync)
+    else:
+        with tempfile.TemporaryDirectory() as data_dir:
+            run(args.accounts, data_dir, not args.no_fsync)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Streaming ring detection throughput on a synthetic transfer feed with
+planted round-tripping rings, against re-running a graph DFS for every
+transfer, plus the cost of a full strongly connected components pass.
+
+    python -m benchmarks.ring_detection_benchmark --accounts 50000 --transfers 200000
+"""
+import argparse
+import random
+import time
+
+from src.data_structures.graph import Graph
+from src.data_structures.ring_detector import RingDetector
+
+
+def build_feed(accounts, transfers, ring_every, rate, seed):
+    rng = random.Random(seed)
+    names = [f'{i:014x}' for i in range(accounts)]
+    feed = []
+    planted = 0
+    now = 0.0
+    while len(feed) < transfers:
+        now += 1.0 / rate
+        if ring_every and len(feed) % ring_every == 0:
+            ring = rng.sample(names, rng.randint(2, 4))
+            for source, target in zip(ring, ring[1:] + ring[:1]):
+                feed.append((source, target, 100.0, now))
+                now += 1.0 / rate
+            planted += 1
+        else:
+            feed.append((rng.choice(names), rng.choice(names), rng.uniform(1, 500), now))
+    return feed, planted
+
+
+def run_detector(feed, window, max_length):
+    detector = RingDetector(window=window, max_length=max_length, max_alerts=len(feed))
+    start = time.perf_counter()
+    for source, target, amount, timestamp in feed:
+        detector.add_transfer(source, target, amount, None, timestamp)
+    return time.perf_counter() - start, detector
+
+
+def run_dfs(feed, sample):
+    # Preload all but the last sample transfers, then time those
+    graph = Graph()
+    for source, target, amount, _ in feed[:-sample]:
+        graph.add_edge(source, target, amount)
+    hits = 0
+    start = time.perf_counter()
+    for source, target, amount, _ in feed[-sample:]:
+        graph.add_edge(source, target, amount)
+        if source in graph.depth_first_search(target):
+            hits += 1
+    return time.perf_counter() - start, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--accounts', type=int, default=50000)
+    parser.add_argument('--transfers', type=int, default=200000)
+    parser.add_argument('--rate', type=float, default=500.0, help='transfers per second')
+    parser.add_argument('--window', type=float, default=60.0, help='seconds')
+    parser.add_argument('--max-length', type=int, default=4)
+    parser.add_argument('--ring-every', type=int, default=1000)
+    parser.add_argument('--dfs-sample', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    feed, planted = build_feed(args.accounts, args.transfers, args.ring_every, args.rate, args.seed)
+
+    elapsed, detector = run_detector(feed, args.window, args.max_length)
+    stats = detector.stats()
+    print(f'detector: {len(feed) / elapsed:,.0f} transfers/s '
+          f'({elapsed / len(feed) * 1e6:.1f} us each), '
+          f'{stats["rings_found"]} rings ({planted} planted), '
+          f'{stats["edges_in_window"]} edges in window, '
+          f'{stats["truncated_searches"]} truncated searches')
+
+    sample = min(args.dfs_sample, len(feed))
+    elapsed, hits = run_dfs(feed, sample)
+    print(f'dfs per transfer: {sample / elapsed:,.0f} transfers/s '
+          f'({elapsed / sample * 1e6:.1f} us each) over the last {sample} transfers, '
+          f'{hits} cycles')
+
+    graph = Graph()
+    graph.add_edges(*zip(*((s, t, a) for s, t, a, _ in feed)))
+    start = time.perf_counter()
+    components = graph.strongly_connected_components(min_size=2)
+    elapsed = time.perf_counter() - start
+    largest = max((len(c) for c in components), default=0)
+    print(f'scc pass: {elapsed * 1000:.0f} ms over {len(graph.vertices)} accounts, '
+          f'{len(components)} cyclic components (largest {largest})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Throughput of TransactionService.transfer for uncontended (disjoint
+account pairs per thread) and contended (all threads on a few hot
+accounts) workloads.
+
+    python -m benchmarks.transfer_benchmark --threads 8 --transfers 200000
+"""
+import argparse
+import threading
+import time
+
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def run_workload(label, threads, transfers, pick_pair):
+    account_service = AccountService()
+    transaction_service = TransactionService(account_service)
+    accounts = [
+        account_service.create_account(f'C{i}', initial_balance=1_000_000.0).account_number
+        for i in range(max(threads * 2, 8))
+    ]
+    per_thread = transfers // threads
+    failures = []
+
+    def worker(worker_id):
+        failed = 0
+        for i in range(per_thread):
+            source, target = pick_pair(accounts, worker_id, i)
+            if transaction_service.transfer(source, target, 1.0).status != 'COMPLETED':
+                failed += 1
+        failures.append(failed)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    total = sum(account_service.find_account(a).balance for a in accounts)
+    assert total == 1_000_000.0 * len(accounts), 'money was created or lost'
+    print(
+        f'{label:<12} threads={threads:<3} {per_thread * threads / elapsed:>10,.0f} transfers/s'
+        f'  failed={sum(failures)}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--transfers', type=int, default=200_000)
+    args = parser.parse_args()
+
+    for threads in sorted({1, args.threads}):
+        run_workload(
+            'uncontended', threads, args.transfers,
+            lambda accounts, t, i: (accounts[2 * t + i % 2], accounts[2 * t + 1 - i % 2])
+        )
+        run_workload(
+            'contended', threads, args.transfers,
+            lambda accounts, t, i: (accounts[i % 2], accounts[(i + 1) % 2 + 2])
+            if i % 4 < 2 else (accounts[(i + 1) % 2 + 2], accounts[i % 2])
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+"""
+Repository-root conftest: pytest puts this directory on sys.path, so
+tests import the application as ``src.*`` just like main.py does.
+"""
@@ -1,11 +1,11 @@
 import streamlit as st
-from src.services.account_service import AccountService
+from src.services.service_container import get_container
 
 def account_management():
     st.title("Account Management")
 
-    # Initialize account service
-    account_service = AccountService()
+    # Resolve the shared account service
+    account_service = get_container().account_service
 
     # Verify user is logged in
     if 'username' not in st.session_state:
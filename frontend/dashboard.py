@@ -1,5 +1,5 @@
 import streamlit as st
-from src.services.account_service import AccountService
+from src.services.service_container import get_container
 
 def dashboard():
     # Verify user is logged in
@@ -10,8 +10,8 @@ def dashboard():
     # Display personalized welcome
     st.title(f"Welcome, {st.session_state['username']}")
 
-    # Initialize account service
-    account_service = AccountService()
+    # Resolve the shared account service
+    account_service = get_container().account_service
     
     # Fetch user accounts
     try:
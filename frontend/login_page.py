@@ -1,5 +1,28 @@
+import os
+
 import streamlit as st
-from src.services.authentication_service import AuthenticationService
+from src.services.authentication_service import AuthenticationService, login_client_id
+
+# Reverse proxies whose X-Forwarded-For header may be believed
+TRUSTED_PROXIES = frozenset(
+    proxy.strip()
+    for proxy in os.environ.get('BANKING_TRUSTED_PROXIES', '').split(',')
+    if proxy.strip()
+)
+
+def client_identifier() -> str:
+    """
+    Login limiter key for this request: the remote address (resolved
+    through trusted proxies), or one shared anonymous key when Streamlit
+    does not expose it
+    """
+    context = getattr(st, 'context', None)
+    headers = getattr(context, 'headers', None) or {}
+    return login_client_id(
+        getattr(context, 'ip_address', None),
+        headers.get('X-Forwarded-For'),
+        TRUSTED_PROXIES
+    )
 
 def render_login_page(auth_service: AuthenticationService):
     """
@@ -14,11 +37,14 @@ def render_login_page(auth_service: AuthenticationService):
 
         if login_button:
             # Attempt authentication
-            user = auth_service.authenticate(username, password)
+            user = auth_service.authenticate(username, password, client_identifier())
             
             if user:
-                # Successful login
+                # Successful login; later reruns check the token instead
+                # of re-hashing the password
                 st.session_state['logged_in'] = True
+                st.session_state['username'] = user.username
+                st.session_state['session_token'] = auth_service.issue_session(user)
                 st.success("Login Successful!")
                 st.experimental_rerun()
             else:
@@ -1,13 +1,13 @@
 import streamlit as st
-from src.services.transaction_service import TransactionService
-from src.services.account_service import AccountService
+from src.services.service_container import get_container
 
 def transaction_page():
     st.title("Transfer Funds")
 
-    # Initialize services
-    account_service = AccountService()
-    transaction_service = TransactionService()
+    # Resolve the shared services
+    container = get_container()
+    account_service = container.account_service
+    transaction_service = container.transaction_service
 
     # Verify user is logged in
     if 'username' not in st.session_state:
@@ -62,7 +62,7 @@ def transaction_page():
             )
 
             # Handle transfer result
-            if result:
+            if result.status == 'COMPLETED':
                 st.success("Transaction Successful!")
                 # Optional: Clear input fields after successful transfer
                 st.session_state['from_account'] = None
@@ -1,6 +1,5 @@
 import streamlit as st
-from src.services.authentication_service import AuthenticationService
-from src.services.registration_service import RegistrationService
+from src.services.service_container import get_container
 
 class BankingApp:
     def __init__(self):
@@ -11,9 +10,10 @@ class BankingApp:
             layout="wide"
         )
 
-        # Initialize services
-        self.auth_service = AuthenticationService()
-        self.registration_service = RegistrationService(self.auth_service)
+        # Resolve process-wide services shared across reruns and sessions
+        container = get_container()
+        self.auth_service = container.auth_service
+        self.registration_service = container.registration_service
 
     def run(self):
         # Import pages here to avoid circular imports
@@ -27,6 +27,13 @@ class BankingApp:
         if 'logged_in' not in st.session_state:
             st.session_state['logged_in'] = False
 
+        # Expired or revoked sessions fall back to the login page
+        if st.session_state['logged_in'] and self.auth_service.validate_session(
+            st.session_state.get('session_token')
+        ) is None:
+            self._clear_session()
+            st.warning("Your session has expired. Please log in again.")
+
         if not st.session_state['logged_in']:
             # Show login or registration page
             page = st.sidebar.selectbox(
@@ -64,9 +71,17 @@ class BankingApp:
         """
         Logout user and reset session state
         """
-        st.session_state['logged_in'] = False
+        token = st.session_state.get('session_token')
+        if token:
+            self.auth_service.revoke_session(token)
+        self._clear_session()
         st.experimental_rerun()
 
+    def _clear_session(self):
+        st.session_state['logged_in'] = False
+        st.session_state.pop('session_token', None)
+        st.session_state.pop('username', None)
+
 def main():
     """
     Entry point for the banking application
@@ -1,26 +1,283 @@
+import atexit
 import hashlib
 import hmac
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+SCRYPT = 'scrypt'
+PBKDF2 = 'pbkdf2_sha256'
+
+DEFAULT_PARAMETERS = {
+    SCRYPT: {'n': 2 ** 14, 'r': 8, 'p': 1},
+    PBKDF2: {'iterations': 600_000}
+}
+
+
+def _derive(password: str, salt: str, algorithm: str, parameters: Dict[str, int]) -> str:
+    """
+    Run the KDF and return the encoded hash (algorithm$parameters$digest)
+    """
+    if algorithm == SCRYPT:
+        n, r, p = parameters['n'], parameters['r'], parameters['p']
+        digest = hashlib.scrypt(
+            password.encode(), salt=salt.encode(), n=n, r=r, p=p,
+            maxmem=256 * n * r * p + (1 << 20), dklen=32
+        )
+    elif algorithm == PBKDF2:
+        digest = hashlib.pbkdf2_hmac(
+            'sha256', password.encode(), salt.encode(), parameters['iterations']
+        )
+    else:
+        raise ValueError(f'Unknown password hashing algorithm: {algorithm}')
+
+    encoded_parameters = ','.join(f'{name}={value}' for name, value in sorted(parameters.items()))
+    return f'{algorithm}${encoded_parameters}${digest.hex()}'
+
+
+def _verify(password: str, stored_hash: str, salt: str) -> bool:
+    parsed = EncryptionUtils.parse_hash(stored_hash)
+    if parsed is None:
+        computed_hash = EncryptionUtils.legacy_hash_password(password, salt)
+    else:
+        algorithm, parameters, _ = parsed
+        computed_hash = _derive(password, salt, algorithm, parameters)
+    return hmac.compare_digest(computed_hash, stored_hash)
+
+
+def _derive_many(batch: Sequence[Tuple[str, str]], algorithm: str, parameters: Dict[str, int]) -> List[str]:
+    return [_derive(password, salt, algorithm, parameters) for password, salt in batch]
+
 
 class EncryptionUtils:
     @staticmethod
-    def hash_password(password: str, salt: str) -> str:
+    def hash_password(
+        password: str,
+        salt: str,
+        algorithm: str = SCRYPT,
+        parameters: Optional[Dict[str, int]] = None
+    ) -> str:
+        """
+        Secure password hashing with a memory-hard KDF
+
+        Returns:
+            str: Encoded hash carrying the algorithm and its cost parameters
+        """
+        return _derive(
+            password, salt, algorithm, parameters or DEFAULT_PARAMETERS[algorithm]
+        )
+
+    @staticmethod
+    def legacy_hash_password(password: str, salt: str) -> str:
         """
-        Secure password hashing with HMAC
+        Single-round HMAC-SHA256, kept only to verify old hashes
         """
         return hmac.new(
-            salt.encode(), 
-            password.encode(), 
+            salt.encode(),
+            password.encode(),
             hashlib.sha256
         ).hexdigest()
 
+    @staticmethod
+    def parse_hash(stored_hash: str) -> Optional[Tuple[str, Dict[str, int], str]]:
+        """
+        Split an encoded hash into (algorithm, parameters, digest);
+        None for legacy HMAC hashes
+        """
+        parts = stored_hash.split('$')
+        if len(parts) != 3:
+            return None
+
+        algorithm, encoded_parameters, digest = parts
+        try:
+            parameters = {
+                name: int(value)
+                for name, value in (item.split('=') for item in encoded_parameters.split(','))
+            }
+        except ValueError:
+            return None
+        return algorithm, parameters, digest
+
     @staticmethod
     def verify_password(
-        input_password: str, 
-        stored_hash: str, 
+        input_password: str,
+        stored_hash: str,
         salt: str
     ) -> bool:
         """
-        Verify password against stored hash
+        Verify password against stored hash (encoded or legacy)
+        """
+        return _verify(input_password, stored_hash, salt)
+
+
+_pool = None
+_pool_users = 0
+_pool_lock = threading.Lock()
+
+
+def _acquire_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    The module's shared KDF process pool, started on first use
+    """
+    global _pool, _pool_users
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_users += 1
+        return _pool
+
+
+def _release_pool(wait: bool = True) -> None:
+    """
+    Drop one user of the shared pool, stopping it after the last
+    """
+    global _pool, _pool_users
+    with _pool_lock:
+        _pool_users -= 1
+        if _pool_users > 0 or _pool is None:
+            return
+        pool, _pool = _pool, None
+    pool.shutdown(wait=wait)
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    """
+    Stop the shared pool regardless of users (registered with atexit)
+    """
+    global _pool, _pool_users
+    with _pool_lock:
+        pool, _pool, _pool_users = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_pool)
+
+
+class PasswordHasher:
+    """
+    Password hashing and verification.
+
+    By default the KDF runs inline on the calling thread. With workers > 0
+    it runs in a process pool shared by every hasher in the process
+    (sized by whichever starts it first), so a login storm neither holds
+    the GIL nor stalls the thread serving the page; callers simply wait
+    on the result. close() releases the pool, which stops once no hasher
+    uses it, and at the latest at interpreter exit. Hashes record their
+    algorithm and cost, so needs_rehash() can tell when a stored hash was
+    made with weaker settings than the current ones.
+    """
+
+    def __init__(
+        self,
+        algorithm: str = SCRYPT,
+        parameters: Optional[Dict[str, int]] = None,
+        workers: int = 0
+    ):
+        if algorithm not in DEFAULT_PARAMETERS:
+            raise ValueError(f'Unknown password hashing algorithm: {algorithm}')
+
+        self.algorithm = algorithm
+        self.parameters = dict(parameters or DEFAULT_PARAMETERS[algorithm])
+        self.workers = workers
+
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = _acquire_pool(self.workers)
+        return self._pool
+
+    def _submit(self, function, *args) -> Future:
+        pool = self._executor()
+        if pool is not None:
+            return pool.submit(function, *args)
+
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def submit_hash(self, password: str, salt: str) -> Future:
+        return self._submit(_derive, password, salt, self.algorithm, self.parameters)
+
+    def submit_verify(self, password: str, stored_hash: str, salt: str) -> Future:
+        return self._submit(_verify, password, stored_hash, salt)
+
+    def hash(self, password: str, salt: str) -> str:
+        """
+        Encoded hash of password using the current settings
+        """
+        return self.submit_hash(password, salt).result()
+
+    def verify(self, password: str, stored_hash: str, salt: str) -> bool:
+        """
+        Constant-time check of password against an encoded or legacy hash
+        """
+        return self.submit_verify(password, stored_hash, salt).result()
+
+    def submit_many(
+        self,
+        passwords: Sequence[str],
+        salts: Sequence[str],
+        chunk_size: int = 16
+    ) -> List[Future]:
+        """
+        Start hashing many passwords; each future yields the encoded hashes
+        of one chunk of chunk_size consecutive passwords
+        """
+        if len(passwords) != len(salts):
+            raise ValueError('passwords and salts must have the same length')
+
+        pairs = list(zip(passwords, salts))
+        return [
+            self._submit(_derive_many, pairs[i:i + chunk_size], self.algorithm, self.parameters)
+            for i in range(0, len(pairs), chunk_size)
+        ]
+
+    def hash_many(
+        self,
+        passwords: Sequence[str],
+        salts: Sequence[str],
+        chunk_size: int = 16
+    ) -> List[str]:
+        """
+        Hash many passwords, spreading chunks across the pool
+
+        Args:
+            passwords (Sequence[str]): Plain-text passwords
+            salts (Sequence[str]): One salt per password
+            chunk_size (int): Passwords per pool task
+
+        Returns:
+            List[str]: Encoded hashes in input order
+        """
+        futures = self.submit_many(passwords, salts, chunk_size)
+        return [encoded for future in futures for encoded in future.result()]
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """
+        True if the hash is legacy or uses other algorithm or cost settings
+        """
+        parsed = EncryptionUtils.parse_hash(stored_hash)
+        if parsed is None:
+            return True
+        algorithm, parameters, _ = parsed
+        return algorithm != self.algorithm or parameters != self.parameters
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Release the shared pool; later calls hash through it again
         """
-        computed_hash = EncryptionUtils.hash_password(input_password, salt)
-        return hmac.compare_digest(computed_hash, stored_hash)
\ No newline at end of file
+        with self._lock:
+            if self._pool is not None:
+                self._pool = None
+                _release_pool(wait)
@@ -1,4 +1,10 @@
-from typing import List, Any, Optional
+import bisect
+from typing import List, Any, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
 
 class SearchAlgorithms:
     @staticmethod
@@ -19,18 +25,25 @@ class SearchAlgorithms:
         return None
 
     @staticmethod
-    def binary_search(arr: List[Any], target: Any) -> Optional[int]:
+    def binary_search(
+        arr: List[Any],
+        target: Any,
+        lo: int = 0,
+        hi: Optional[int] = None
+    ) -> Optional[int]:
         """
         Perform binary search on a sorted array
         
         Args:
             arr (List[Any]): Sorted input array
             target (Any): Element to find
+            lo (int): First index of the search window
+            hi (Optional[int]): End (exclusive) of the search window
         
         Returns:
             Optional[int]: Index of target if found, None otherwise
         """
-        left, right = 0, len(arr) - 1
+        left, right = lo, (len(arr) if hi is None else hi) - 1
 
         while left <= right:
             mid = (left + right) // 2
@@ -56,6 +69,9 @@ class SearchAlgorithms:
         Returns:
             Optional[int]: Index of target if found, None otherwise
         """
+        if not arr:
+            return None
+
         if arr[0] == target:
             return 0
 
@@ -64,10 +80,12 @@ class SearchAlgorithms:
         while i < len(arr) and arr[i] <= target:
             i *= 2
 
-        # Perform binary search in found range
+        # Binary search in [i // 2, min(i + 1, n)) without copying a slice
         return SearchAlgorithms.binary_search(
-            arr[:min(i, len(arr))], 
-            target
+            arr,
+            target,
+            i // 2,
+            min(i + 1, len(arr))
         )
 
     @staticmethod
@@ -135,4 +153,165 @@ class SearchAlgorithms:
             else:
                 right = pos - 1
 
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def lower_bound(
+        arr: Sequence[Any],
+        target: Any,
+        lo: int = 0,
+        hi: Optional[int] = None
+    ) -> int:
+        """
+        First index whose element is not less than target
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            target (Any): Value to locate
+            lo (int): First index of the search window
+            hi (Optional[int]): End (exclusive) of the search window
+        
+        Returns:
+            int: Insertion point to the left of equal elements
+        """
+        return bisect.bisect_left(arr, target, lo, len(arr) if hi is None else hi)
+
+    @staticmethod
+    def upper_bound(
+        arr: Sequence[Any],
+        target: Any,
+        lo: int = 0,
+        hi: Optional[int] = None
+    ) -> int:
+        """
+        First index whose element is greater than target
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            target (Any): Value to locate
+            lo (int): First index of the search window
+            hi (Optional[int]): End (exclusive) of the search window
+        
+        Returns:
+            int: Insertion point to the right of equal elements
+        """
+        return bisect.bisect_right(arr, target, lo, len(arr) if hi is None else hi)
+
+    @staticmethod
+    def equal_range(arr: Sequence[Any], low: Any, high: Any) -> range:
+        """
+        Indices of elements with low <= element <= high
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            low (Any): Smallest value to include
+            high (Any): Largest value to include
+        
+        Returns:
+            range: Matching index range (possibly empty)
+        """
+        start = SearchAlgorithms.lower_bound(arr, low)
+        return range(start, SearchAlgorithms.upper_bound(arr, high, start))
+
+    @staticmethod
+    def _as_array(values: Sequence[Any]):
+        """
+        NumPy view of a column, or None when NumPy cannot represent it
+        """
+        if np is None:
+            return None
+
+        array = values if isinstance(values, np.ndarray) else np.asarray(values)
+        return None if array.dtype.kind == 'O' else array
+
+    @staticmethod
+    def _is_sorted(values: Sequence[Any]) -> bool:
+        return all(values[i] <= values[i + 1] for i in range(len(values) - 1))
+
+    @staticmethod
+    def batch_lower_bound(arr: Sequence[Any], targets: Sequence[Any]):
+        """
+        lower_bound for many targets at once
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            targets (Sequence[Any]): Values to locate, in any order
+        
+        Returns:
+            Insertion points (int64 ndarray when NumPy is used, else list)
+        """
+        return SearchAlgorithms._batch_bound(arr, targets, 'left')
+
+    @staticmethod
+    def batch_upper_bound(arr: Sequence[Any], targets: Sequence[Any]):
+        """
+        upper_bound for many targets at once
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            targets (Sequence[Any]): Values to locate, in any order
+        
+        Returns:
+            Insertion points (int64 ndarray when NumPy is used, else list)
+        """
+        return SearchAlgorithms._batch_bound(arr, targets, 'right')
+
+    @staticmethod
+    def _batch_bound(arr: Sequence[Any], targets: Sequence[Any], side: str):
+        haystack = SearchAlgorithms._as_array(arr)
+        needles = SearchAlgorithms._as_array(targets)
+        if haystack is not None and needles is not None:
+            try:
+                return np.searchsorted(haystack, needles, side=side)
+            except TypeError:
+                pass  # Incomparable dtypes, e.g. strings against numbers
+
+        n, m = len(arr), len(targets)
+        bisector = bisect.bisect_left if side == 'left' else bisect.bisect_right
+
+        # A linear merge beats m binary searches only for dense, sorted targets
+        if m * max(n.bit_length(), 1) <= n + m or not SearchAlgorithms._is_sorted(targets):
+            return [bisector(arr, target) for target in targets]
+
+        positions = []
+        i = 0
+        for target in targets:
+            if side == 'left':
+                while i < n and arr[i] < target:
+                    i += 1
+            else:
+                while i < n and not target < arr[i]:
+                    i += 1
+            positions.append(i)
+        return positions
+
+    @staticmethod
+    def batch_search(arr: Sequence[Any], targets: Sequence[Any]):
+        """
+        Exact-match binary search for many targets at once
+        
+        Args:
+            arr (Sequence[Any]): Sorted input array
+            targets (Sequence[Any]): Elements to find, in any order
+        
+        Returns:
+            Index of each target, -1 where absent (int64 ndarray when NumPy
+            is used, else list)
+        """
+        positions = SearchAlgorithms.batch_lower_bound(arr, targets)
+        n = len(arr)
+
+        if np is not None and isinstance(positions, np.ndarray):
+            if n == 0:
+                return np.full(len(positions), -1, dtype=np.int64)
+
+            haystack = SearchAlgorithms._as_array(arr)
+            needles = SearchAlgorithms._as_array(targets)
+            clipped = np.minimum(positions, n - 1)
+            found = (positions < n) & (haystack[clipped] == needles)
+            return np.where(found, positions, -1)
+
+        return [
+            i if i < n and arr[i] == target else -1
+            for i, target in zip(positions, targets)
+        ]
\ No newline at end of file
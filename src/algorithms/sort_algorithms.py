@@ -1,4 +1,12 @@
-from typing import List, Any
+from datetime import datetime
+from typing import List, Any, Callable, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is optional
+    np = None
+
+KeyFunc = Optional[Callable[[Any], Any]]
 
 class SortAlgorithms:
     @staticmethod
@@ -43,24 +51,85 @@ class SortAlgorithms:
         return arr
 
     @staticmethod
-    def merge_sort(arr: List[Any]) -> List[Any]:
+    def _decorate(arr: List[Any], key: KeyFunc) -> List[Any]:
         """
-        Perform merge sort
-        
+        Compute sort keys once per element
+        """
+        return list(arr) if key is None else [key(item) for item in arr]
+
+    @staticmethod
+    def merge_sort(
+        arr: List[Any],
+        key: KeyFunc = None,
+        reverse: bool = False
+    ) -> List[Any]:
+        """
+        Perform a stable bottom-up merge sort
+
+        Keys are computed once and runs of an index permutation are merged
+        back and forth between two buffers, so no per-level lists are built.
+
         Args:
             arr (List[Any]): Input array to sort
-        
+            key (Callable): Optional key function
+            reverse (bool): Sort in descending order
+
         Returns:
             List[Any]: Sorted array
         """
-        if len(arr) <= 1:
-            return arr
+        n = len(arr)
+        if n <= 1:
+            return list(arr)
 
-        mid = len(arr) // 2
-        left = SortAlgorithms.merge_sort(arr[:mid])
-        right = SortAlgorithms.merge_sort(arr[mid:])
+        keys = SortAlgorithms._decorate(arr, key)
+        source = list(range(n))
+        target = [0] * n
 
-        return SortAlgorithms._merge(left, right)
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = min(lo + width, n)
+                hi = min(lo + 2 * width, n)
+                SortAlgorithms._merge_runs(
+                    keys, source, target, lo, mid, hi, reverse
+                )
+            source, target = target, source
+            width *= 2
+
+        return [arr[i] for i in source]
+
+    @staticmethod
+    def _merge_runs(
+        keys: List[Any],
+        source: List[int],
+        target: List[int],
+        lo: int,
+        mid: int,
+        hi: int,
+        reverse: bool
+    ) -> None:
+        """
+        Merge source[lo:mid] and source[mid:hi] into target[lo:hi]
+        """
+        i, j, k = lo, mid, lo
+
+        while i < mid and j < hi:
+            left, right = source[i], source[j]
+            # Taking from the left run on ties keeps the sort stable
+            if reverse:
+                take_left = not keys[left] < keys[right]
+            else:
+                take_left = not keys[right] < keys[left]
+
+            if take_left:
+                target[k] = left
+                i += 1
+            else:
+                target[k] = right
+                j += 1
+            k += 1
+
+        target[k:hi] = source[i:mid] if i < mid else source[j:hi]
 
     @staticmethod
     def _merge(left: List[Any], right: List[Any]) -> List[Any]:
@@ -90,27 +159,70 @@ class SortAlgorithms:
         return result
 
     @staticmethod
-    def quick_sort(arr: List[Any]) -> List[Any]:
+    def quick_sort(
+        arr: List[Any],
+        key: KeyFunc = None,
+        reverse: bool = False
+    ) -> List[Any]:
         """
-        Perform quick sort
-        
+        Perform an in-place, iterative three-way quick sort
+
         Args:
             arr (List[Any]): Input array to sort
-        
+            key (Callable): Optional key function
+            reverse (bool): Sort in descending order
+
         Returns:
             List[Any]: Sorted array
         """
-        if len(arr) <= 1:
-            return arr
+        n = len(arr)
+        if n <= 1:
+            return list(arr)
+
+        keys = SortAlgorithms._decorate(arr, key)
+        perm = list(range(n))
+        stack = [(0, n - 1)]
+
+        def before(a, b):
+            return keys[b] < keys[a] if reverse else keys[a] < keys[b]
+
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+
+            # Median-of-three pivot guards against sorted inputs
+            mid = (lo + hi) // 2
+            candidates = sorted(
+                (perm[lo], perm[mid], perm[hi]),
+                key=keys.__getitem__,
+                reverse=reverse
+            )
+            pivot = candidates[1]
+
+            # Dutch national flag partition: [< pivot | == pivot | > pivot]
+            lt, i, gt = lo, lo, hi
+            while i <= gt:
+                current = perm[i]
+                if before(current, pivot):
+                    perm[lt], perm[i] = perm[i], perm[lt]
+                    lt += 1
+                    i += 1
+                elif before(pivot, current):
+                    perm[gt], perm[i] = perm[i], perm[gt]
+                    gt -= 1
+                else:
+                    i += 1
 
-        pivot = arr[len(arr) // 2]
-        left = [x for x in arr if x < pivot]
-        middle = [x for x in arr if x == pivot]
-        right = [x for x in arr if x > pivot]
+            # Handle the smaller side first to bound the stack depth
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi))
+                stack.append((lo, lt - 1))
+            else:
+                stack.append((lo, lt - 1))
+                stack.append((gt + 1, hi))
 
-        return (SortAlgorithms.quick_sort(left) + 
-                middle + 
-                SortAlgorithms.quick_sort(right))
+        return [arr[i] for i in perm]
 
     @staticmethod
     def heap_sort(arr: List[Any]) -> List[Any]:
@@ -124,18 +236,167 @@ class SortAlgorithms:
             List[Any]: Sorted array
         """
         def heapify(arr, n, i):
-            largest = i
-            left = 2 * i + 1
-            right = 2 * i + 2
+            # Sift down iteratively
+            while True:
+                largest = i
+                left = 2 * i + 1
+                right = 2 * i + 2
+
+                if left < n and arr[left] > arr[largest]:
+                    largest = left
 
-            if left < n and arr[left] > arr[largest]:
-                largest = left
+                if right < n and arr[right] > arr[largest]:
+                    largest = right
 
-            if right < n and arr[right] > arr[largest]:
-                largest = right
+                if largest == i:
+                    return
 
-            if largest != i:
                 arr[i], arr[largest] = arr[largest], arr[i]
-                heapify(arr, n, largest)
+                i = largest
+
+        n = len(arr)
+        for i in range(n // 2 - 1, -1, -1):
+            heapify(arr, n, i)
+
+        for end in range(n - 1, 0, -1):
+            arr[0], arr[end] = arr[end], arr[0]
+            heapify(arr, end, 0)
+
+        return arr
+
+    @staticmethod
+    def _as_numeric_array(values: Sequence[Any]):
+        """
+        Convert a column to a NumPy array if it is purely numeric or
+        datetime, otherwise return None
+        """
+        if np is None:
+            return None
 
-        
\ No newline at end of file
+        if isinstance(values, np.ndarray):
+            return values if values.dtype.kind in 'iufM' else None
+
+        if not len(values):
+            return None
+
+        first = values[0]
+        try:
+            if isinstance(first, datetime):
+                return np.array(values, dtype='datetime64[us]')
+            if isinstance(first, (int, float)) and not isinstance(first, bool):
+                array = np.asarray(values)
+                return array if array.dtype.kind in 'iuf' else None
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+        return None
+
+    @staticmethod
+    def argsort(
+        values: Sequence[Any],
+        reverse: bool = False
+    ) -> Union[List[int], 'np.ndarray']:
+        """
+        Stable permutation that sorts values
+
+        Numeric and datetime columns use NumPy's stable argsort; anything
+        else falls back to Timsort over the indices.
+
+        Args:
+            values (Sequence[Any]): Column of sort keys
+            reverse (bool): Sort in descending order
+
+        Returns:
+            Indices in sorted order; an int64 ndarray when NumPy was used
+        """
+        array = SortAlgorithms._as_numeric_array(values)
+
+        if array is not None:
+            if not reverse:
+                return np.argsort(array, kind='stable')
+
+            # Sort the reversed column and flip back: descending but stable
+            n = len(array)
+            return (n - 1 - np.argsort(array[::-1], kind='stable'))[::-1]
+
+        return sorted(
+            range(len(values)),
+            key=values.__getitem__,
+            reverse=reverse
+        )
+
+    @staticmethod
+    def multi_argsort(
+        columns: Sequence[Sequence[Any]],
+        reverse: Union[bool, Sequence[bool]] = False
+    ) -> Union[List[int], 'np.ndarray']:
+        """
+        Stable permutation for a multi-column sort
+
+        Args:
+            columns: Parallel key columns, most significant first
+            reverse: One flag for all columns or one flag per column
+
+        Returns:
+            Indices in sorted order
+        """
+        if isinstance(reverse, bool):
+            reverse = [reverse] * len(columns)
+
+        arrays = [SortAlgorithms._as_numeric_array(column) for column in columns]
+        if not any(reverse) and arrays and all(a is not None for a in arrays):
+            return np.lexsort(arrays[::-1])
+
+        # Least significant column first; each pass is a stable sort
+        perm = None
+        for column, descending in reversed(list(zip(columns, reverse))):
+            if perm is None:
+                perm = SortAlgorithms.argsort(column, descending)
+            else:
+                gathered = SortAlgorithms.apply_permutation(column, perm)
+                perm = SortAlgorithms.apply_permutation(
+                    perm, SortAlgorithms.argsort(gathered, descending)
+                )
+
+        return perm if perm is not None else []
+
+    @staticmethod
+    def apply_permutation(values: Sequence[Any], perm) -> Sequence[Any]:
+        """
+        Reorder a column by a permutation from argsort
+
+        Args:
+            values (Sequence[Any]): Column to reorder
+            perm: Indices as returned by argsort
+
+        Returns:
+            Reordered column (ndarray in, ndarray out; list otherwise)
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            return values[np.asarray(perm)]
+
+        if np is not None and isinstance(perm, np.ndarray):
+            perm = perm.tolist()
+
+        return [values[i] for i in perm]
+
+    @staticmethod
+    def sort_by(
+        arr: Sequence[Any],
+        key: KeyFunc = None,
+        reverse: bool = False
+    ) -> List[Any]:
+        """
+        Stable key-aware sort; keys are computed exactly once
+
+        Args:
+            arr (Sequence[Any]): Items to sort
+            key (Callable): Optional key function
+            reverse (bool): Sort in descending order
+
+        Returns:
+            List[Any]: Sorted items
+        """
+        keys = SortAlgorithms._decorate(arr, key)
+        perm = SortAlgorithms.argsort(keys, reverse)
+        return list(SortAlgorithms.apply_permutation(arr, perm))
\ No newline at end of file
@@ -1,11 +1,15 @@
-from typing import Union, List
+from typing import ClassVar, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-import uuid
+from src.core.id_generator import ACCOUNT_IDS
 
-@dataclass
+@dataclass(slots=True)
 class Account:
-    account_number: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    DETAIL_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'account_number', 'account_type', 'balance', 'created_at', 'is_active'
+    )
+
+    account_number: str = field(default_factory=ACCOUNT_IDS.next_id)
     customer_id: str = None
     account_type: str = 'Savings'
     balance: float = 0.0
@@ -26,7 +30,8 @@ class Account:
         if amount <= 0:
             return False
         
-        self.balance += amount
+        # Amounts are whole cents; rounding keeps float drift out of the balance
+        self.balance = round(self.balance + amount, 2)
         return True
 
     def withdraw(self, amount: float) -> bool:
@@ -43,8 +48,8 @@ class Account:
             return False
         
         # Check if withdrawal is possible with overdraft
-        if self.balance + self.overdraft_limit >= amount:
-            self.balance -= amount
+        if round(self.balance + self.overdraft_limit, 2) >= amount:
+            self.balance = round(self.balance - amount, 2)
             return True
         
         return False
@@ -79,4 +84,19 @@ class Account:
             'balance': self.balance,
             'created_at': self.created_at,
             'is_active': self.is_active
-        }
\ No newline at end of file
+        }
+
+    def as_tuple(self) -> tuple:
+        """
+        Account details as a tuple ordered like DETAIL_FIELDS
+        
+        Returns:
+            tuple: Account details
+        """
+        return (
+            self.account_number,
+            self.account_type,
+            self.balance,
+            self.created_at,
+            self.is_active
+        )
\ No newline at end of file
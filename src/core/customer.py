@@ -1,11 +1,11 @@
 from typing import List, Optional
 from dataclasses import dataclass, field
-import uuid
 from datetime import datetime
+from src.core.id_generator import CUSTOMER_IDS
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
-    customer_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    customer_id: str = field(default_factory=CUSTOMER_IDS.next_id)
     first_name: str = None
     last_name: str = None
     email: str = None
@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import deque
+from typing import Iterable, List
+
+
+class IdGenerator:
+    """
+    Monotonic, collision-checked identifier source.
+
+    IDs are fixed-width hex renderings of a counter seeded from the
+    current time in milliseconds (shifted to leave room for bursts), so
+    they sort by creation order and stay unique across restarts. Any IDs
+    loaded from storage can be passed to observe() so the counter never
+    re-issues them. preallocate() formats a block of IDs ahead of time to
+    take the work off hot construction paths.
+    """
+
+    def __init__(self, prefix: str = '', width: int = 14, burst_bits: int = 10):
+        self.prefix = prefix
+        self.width = width
+        self._next = int(time.time() * 1000) << burst_bits
+        self._limit = 16 ** width
+        self._pool = deque()
+        self._lock = threading.Lock()
+
+    def _take(self, count: int) -> int:
+        with self._lock:
+            start = self._next
+            self._next += count
+        if self._next > self._limit:
+            raise OverflowError('ID space exhausted; increase width')
+        return start
+
+    def _format(self, value: int) -> str:
+        return f'{self.prefix}{value:0{self.width}x}'
+
+    def next_id(self) -> str:
+        """
+        Next unused ID, served from the preallocated pool when available
+        """
+        try:
+            return self._pool.popleft()
+        except IndexError:
+            return self._format(self._take(1))
+
+    def preallocate(self, count: int) -> None:
+        """
+        Reserve and pre-format count IDs for later next_id() calls
+        """
+        start = self._take(count)
+        self._pool.extend(self._format(value) for value in range(start, start + count))
+
+    def reserve(self, count: int) -> int:
+        """
+        Reserve count consecutive IDs without formatting them
+
+        Returns:
+            int: Counter value of the first one; format(start + i) renders
+            the i-th
+        """
+        return self._take(count)
+
+    def format(self, value: int) -> str:
+        return self._format(value)
+
+    def allocate_block(self, count: int) -> List[str]:
+        """
+        Reserve count consecutive IDs and return them
+        """
+        start = self._take(count)
+        return [self._format(value) for value in range(start, start + count)]
+
+    def observe(self, ids: Iterable[str]) -> None:
+        """
+        Move the counter past existing IDs so none can be issued again
+        """
+        highest = -1
+        for identifier in ids:
+            if not identifier.startswith(self.prefix):
+                continue
+            try:
+                highest = max(highest, int(identifier[len(self.prefix):], 16))
+            except ValueError:
+                continue
+
+        with self._lock:
+            if highest >= self._next:
+                self._next = highest + 1
+                # Pooled IDs may now collide with observed ones
+                self._pool.clear()
+
+
+ACCOUNT_IDS = IdGenerator()
+CUSTOMER_IDS = IdGenerator()
+TRANSACTION_IDS = IdGenerator()
+USER_IDS = IdGenerator()
@@ -1,11 +1,16 @@
-from typing import Optional
+from typing import ClassVar, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-import uuid
+from src.core.id_generator import TRANSACTION_IDS
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
-    transaction_id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    DETAIL_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'transaction_id', 'from_account', 'to_account', 'amount',
+        'transaction_type', 'timestamp', 'status'
+    )
+
+    transaction_id: str = field(default_factory=TRANSACTION_IDS.next_id)
     from_account: Optional[str] = None
     to_account: Optional[str] = None
     amount: float = 0.0
@@ -44,6 +49,23 @@ class Transaction:
             'status': self.status
         }
 
+    def as_tuple(self) -> tuple:
+        """
+        Transaction details as a tuple ordered like DETAIL_FIELDS
+        
+        Returns:
+            tuple: Transaction details
+        """
+        return (
+            self.transaction_id,
+            self.from_account,
+            self.to_account,
+            self.amount,
+            self.transaction_type,
+            self.timestamp,
+            self.status
+        )
+
     @classmethod
     def create_transaction(
         cls, 
@@ -1,13 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
-import uuid
+from src.core.id_generator import USER_IDS
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User model representing authentication details
     """
-    user_id: str = str(uuid.uuid4())
+    user_id: str = field(default_factory=USER_IDS.next_id)
     username: str = ''
     password_hash: str = ''
     salt: str = ''
@@ -22,8 +23,7 @@ class User:
         Initialize default values if not provided
         """
         if not self.user_id:
-            self.user_id = str(uuid.uuid4())
+            self.user_id = USER_IDS.next_id()
         
         if not self.created_at:
-            from datetime import datetime
             self.created_at = datetime.now().isoformat()
\ No newline at end of file
@@ -0,0 +1,441 @@
+import sys
+import threading
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.id_generator import ACCOUNT_IDS
+from src.data_structures.hash_table import HashTable
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+_EPOCH = datetime(1970, 1, 1)
+_CENT = Decimal('0.01')
+
+
+def parse_amount(amount) -> Decimal:
+    """
+    Money amount rounded half-up to the cent
+
+    Floats are read through their shortest repr, so 0.285 means 0.285 and
+    not the binary value just below it.
+
+    Raises:
+        ValueError: If amount is not a finite number
+    """
+    try:
+        value = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    except InvalidOperation:
+        raise ValueError(f'Invalid amount: {amount!r}') from None
+    if not value.is_finite():
+        raise ValueError(f'Invalid amount: {amount!r}')
+    return value.quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def to_cents(amount) -> int:
+    return int(parse_amount(amount) * 100)
+
+
+def amounts_to_cents(amounts) -> np.ndarray:
+    """
+    to_cents over an array of amounts, vectorised
+
+    Away from a half-cent tie, floor(x * 100 + 0.5) already is the
+    half-up cent rounding of x's repr; only values within float error of
+    a tie (or too large to scale exactly) go through to_cents. Non-finite
+    values map to 0.
+
+    Returns:
+        np.ndarray: int64 cents
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    finite = np.isfinite(amounts)
+    scaled = np.where(finite, amounts, 0.0) * 100
+    magnitude = np.abs(scaled)
+    exact = magnitude < 2.0 ** 52
+    cents = np.floor(np.where(exact, scaled, 0.0) + 0.5).astype(np.int64)
+
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= magnitude * 1e-12 + 1e-9
+    for row in np.flatnonzero(finite & (near_tie | ~exact)).tolist():
+        cents[row] = to_cents(float(amounts[row]))
+    return cents
+
+
+def interest_cents(balance_cents, rate: float) -> np.ndarray:
+    """
+    Interest on positive int64 cent balances, rounded half-up to the cent
+
+    The one rounding rule for interest, shared by object and columnar
+    storage so both credit the same amount to the same balance.
+    """
+    balance_cents = np.asarray(balance_cents, dtype=np.int64)
+    return np.floor(balance_cents * rate + 0.5).astype(np.int64)
+
+
+class AccountRow:
+    """
+    Lightweight Account view over one row of a ColumnarAccountStore.
+
+    Exposes the same attributes and methods as Account, but the data lives
+    in the store's columns and all balance arithmetic is done in integer
+    cents.
+    """
+
+    __slots__ = ('_store', '_chunk', '_offset', 'row')
+
+    def __init__(self, store: 'ColumnarAccountStore', row: int):
+        self._store = store
+        self._chunk = row >> CHUNK_BITS
+        self._offset = row & CHUNK_MASK
+        self.row = row
+
+    @property
+    def account_number(self) -> str:
+        return self._store.account_numbers[self.row]
+
+    @property
+    def customer_id(self) -> str:
+        return self._store.customer_ids[self.row]
+
+    @property
+    def account_type(self) -> str:
+        store = self._store
+        return store.type_names[store.type_codes[self._chunk][self._offset]]
+
+    @property
+    def balance_cents(self) -> int:
+        return int(self._store.balance_cents[self._chunk][self._offset])
+
+    @property
+    def balance(self) -> float:
+        return self.balance_cents / 100
+
+    @balance.setter
+    def balance(self, amount: float) -> None:
+        self._store.balance_cents[self._chunk][self._offset] = to_cents(amount)
+
+    @property
+    def overdraft_limit(self) -> float:
+        return int(self._store.overdraft_cents[self._chunk][self._offset]) / 100
+
+    @overdraft_limit.setter
+    def overdraft_limit(self, amount: float) -> None:
+        self._store.overdraft_cents[self._chunk][self._offset] = to_cents(amount)
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self._store.active[self._chunk][self._offset])
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self._store.active[self._chunk][self._offset] = value
+
+    @property
+    def created_at(self) -> datetime:
+        micros = int(self._store.created_us[self._chunk][self._offset])
+        return _EPOCH + timedelta(microseconds=micros)
+
+    def deposit(self, amount: float) -> bool:
+        """
+        Deposit money into the account
+
+        Args:
+            amount (float): Amount to deposit
+
+        Returns:
+            bool: True if deposit successful, False otherwise
+        """
+        cents = to_cents(amount)
+        if cents <= 0:
+            return False
+
+        self._store.balance_cents[self._chunk][self._offset] += cents
+        return True
+
+    def withdraw(self, amount: float) -> bool:
+        """
+        Withdraw money from the account
+
+        Args:
+            amount (float): Amount to withdraw
+
+        Returns:
+            bool: True if withdrawal successful, False otherwise
+        """
+        cents = to_cents(amount)
+        if cents <= 0:
+            return False
+
+        store, chunk, offset = self._store, self._chunk, self._offset
+        if store.balance_cents[chunk][offset] + store.overdraft_cents[chunk][offset] >= cents:
+            store.balance_cents[chunk][offset] -= cents
+            return True
+
+        return False
+
+    def transfer(self, target_account, amount: float) -> bool:
+        """
+        Transfer money to another account
+
+        Args:
+            target_account: Destination account
+            amount (float): Amount to transfer
+
+        Returns:
+            bool: True if transfer successful, False otherwise
+        """
+        if self.withdraw(amount):
+            target_account.deposit(amount)
+            return True
+
+        return False
+
+    def get_account_details(self) -> dict:
+        """
+        Get account details
+
+        Returns:
+            dict: Account details
+        """
+        return {
+            'account_number': self.account_number,
+            'account_type': self.account_type,
+            'balance': self.balance,
+            'created_at': self.created_at,
+            'is_active': self.is_active
+        }
+
+    def as_tuple(self) -> tuple:
+        """
+        Account details as a tuple ordered like Account.DETAIL_FIELDS
+        """
+        return (
+            self.account_number,
+            self.account_type,
+            self.balance,
+            self.created_at,
+            self.is_active
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f'AccountRow(account_number={self.account_number!r}, '
+            f'customer_id={self.customer_id!r}, '
+            f'account_type={self.account_type!r}, balance={self.balance!r})'
+        )
+
+
+class ColumnarAccountStore:
+    """
+    Struct-of-arrays account storage.
+
+    Balances and overdraft limits are int64 cents, account types are
+    interned to small integer codes, and an account-number index maps to
+    row numbers. Columns grow in fixed-size chunks that are never
+    reallocated, so row views stay valid while the store grows and
+    whole-book operations run as NumPy kernels chunk by chunk.
+    """
+
+    def __init__(self):
+        self.account_numbers: List[str] = []
+        self.customer_ids: List[str] = []
+        self.type_names: List[str] = []
+        self.type_ids: Dict[str, int] = {}
+        self.index = HashTable()
+
+        self.balance_cents: List[np.ndarray] = []
+        self.overdraft_cents: List[np.ndarray] = []
+        self.type_codes: List[np.ndarray] = []
+        self.active: List[np.ndarray] = []
+        self.created_us: List[np.ndarray] = []
+
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.account_numbers)
+
+    def _add_chunk(self) -> None:
+        self.balance_cents.append(np.zeros(CHUNK_SIZE, dtype=np.int64))
+        self.overdraft_cents.append(np.zeros(CHUNK_SIZE, dtype=np.int64))
+        self.type_codes.append(np.zeros(CHUNK_SIZE, dtype=np.int16))
+        self.active.append(np.zeros(CHUNK_SIZE, dtype=bool))
+        self.created_us.append(np.zeros(CHUNK_SIZE, dtype=np.int64))
+
+    def _type_code(self, account_type: str) -> int:
+        code = self.type_ids.get(account_type)
+        if code is None:
+            code = self.type_ids[account_type] = len(self.type_names)
+            self.type_names.append(account_type)
+        return code
+
+    def create(
+        self,
+        account_number: Optional[str] = None,
+        customer_id: Optional[str] = None,
+        account_type: str = 'Savings',
+        balance: float = 0.0,
+        created_at: Optional[datetime] = None,
+        is_active: bool = True,
+        overdraft_limit: float = 0.0
+    ) -> AccountRow:
+        """
+        Append an account row and return its view
+        """
+        created_at = created_at or datetime.now()
+        if account_number is None:
+            account_number = ACCOUNT_IDS.next_id()
+
+        with self._lock:
+            if self.index.contains(account_number):
+                raise ValueError(f'Duplicate account number: {account_number}')
+
+            row = len(self.account_numbers)
+            if row >> CHUNK_BITS == len(self.balance_cents):
+                self._add_chunk()
+
+            chunk, offset = row >> CHUNK_BITS, row & CHUNK_MASK
+            self.balance_cents[chunk][offset] = to_cents(balance)
+            self.overdraft_cents[chunk][offset] = to_cents(overdraft_limit)
+            self.type_codes[chunk][offset] = self._type_code(account_type)
+            self.active[chunk][offset] = is_active
+            self.created_us[chunk][offset] = (created_at - _EPOCH) // timedelta(microseconds=1)
+
+            self.customer_ids.append(
+                sys.intern(customer_id) if isinstance(customer_id, str) else customer_id
+            )
+            self.account_numbers.append(account_number)
+            self.index.insert(account_number, row)
+
+        return AccountRow(self, row)
+
+    def get(self, account_number: str) -> Optional[AccountRow]:
+        row = self.index.get(account_number, None)
+        return None if row is None else AccountRow(self, row)
+
+    def _chunks(self, *columns):
+        """
+        Yield the filled prefix of every chunk of the given columns
+        """
+        remaining = len(self)
+        for chunk_columns in zip(*columns):
+            if remaining <= 0:
+                return
+            filled = min(remaining, CHUNK_SIZE)
+            yield tuple(column[:filled] for column in chunk_columns)
+            remaining -= filled
+
+    def _mask(self, codes, active, account_type, active_only):
+        mask = np.ones(len(codes), dtype=bool)
+        if account_type is not None:
+            mask &= codes == self.type_ids.get(account_type, -1)
+        if active_only:
+            mask &= active
+        return mask
+
+    def total_balance(
+        self,
+        account_type: Optional[str] = None,
+        active_only: bool = False
+    ) -> float:
+        """
+        Sum of balances, optionally filtered by type and status
+        """
+        total = 0
+        for balances, codes, active in self._chunks(
+            self.balance_cents, self.type_codes, self.active
+        ):
+            mask = self._mask(codes, active, account_type, active_only)
+            total += int(balances[mask].sum())
+        return total / 100
+
+    def apply_interest(
+        self,
+        rate: float,
+        account_type: Optional[str] = None,
+        collect_balances: bool = False
+    ) -> Tuple[float, Dict[str, float]]:
+        """
+        Credit interest (rounded to the cent) to active, positive balances
+
+        The caller must hold a write barrier and log the run;
+        AccountService.apply_interest does both.
+
+        Args:
+            rate (float): Interest rate, e.g. 0.01 for 1%
+            account_type (Optional[str]): Only credit this account type
+            collect_balances (bool): Also return the resulting balance of
+                every credited account, for the log record
+
+        Returns:
+            Tuple[float, Dict[str, float]]: Total interest paid, and account
+            number -> new balance (empty unless collect_balances)
+        """
+        paid = 0
+        credited = {}
+        for chunk, (balances, codes, active) in enumerate(self._chunks(
+            self.balance_cents, self.type_codes, self.active
+        )):
+            mask = self._mask(codes, active, account_type, True) & (balances > 0)
+            interest = interest_cents(balances[mask], rate)
+            balances[mask] += interest
+            paid += int(interest.sum())
+
+            if collect_balances:
+                base = chunk << CHUNK_BITS
+                for offset, cents in zip(
+                    np.flatnonzero(mask).tolist(), balances[mask].tolist()
+                ):
+                    credited[self.account_numbers[base + offset]] = cents / 100
+        return paid / 100, credited
+
+    def _gather_cents(self, account_numbers: Iterable[str]) -> np.ndarray:
+        rows = np.fromiter(
+            (self.index.get(number) for number in account_numbers),
+            dtype=np.int64
+        )
+        chunks = rows >> CHUNK_BITS
+        cents = np.empty(len(rows), dtype=np.int64)
+        for chunk in np.unique(chunks):
+            selected = chunks == chunk
+            cents[selected] = self.balance_cents[chunk][rows[selected] & CHUNK_MASK]
+        return cents
+
+    def balances(self, account_numbers: Iterable[str]) -> np.ndarray:
+        """
+        Balances (in currency units) for many accounts at once
+        """
+        return self._gather_cents(account_numbers) / 100
+
+    def reconcile(self, expected: Dict[str, float]) -> Dict[str, float]:
+        """
+        Compare stored balances with an external ledger
+
+        Returns:
+            Dict[str, float]: Account number -> stored minus expected, for
+            every account that does not match to the cent
+        """
+        numbers = list(expected)
+        stored = self._gather_cents(numbers)
+        wanted = np.fromiter(
+            (to_cents(expected[number]) for number in numbers),
+            dtype=np.int64, count=len(numbers)
+        )
+        differences = stored - wanted
+        return {
+            numbers[i]: int(differences[i]) / 100
+            for i in np.flatnonzero(differences)
+        }
+
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for column in (
+                self.balance_cents, self.overdraft_cents,
+                self.type_codes, self.active, self.created_us
+            )
+            for array in column
+        )
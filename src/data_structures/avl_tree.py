@@ -1,3 +1,6 @@
+from operator import itemgetter
+
+
 class AVLNode:
     def __init__(self, key, value=None):
         self.key = key
@@ -9,6 +12,13 @@ class AVLNode:
 class AVLTree:
     def __init__(self):
         self.root = None
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return self.keys()
 
     def height(self, node):
         return node.height if node else 0
@@ -78,6 +88,124 @@ class AVLTree:
 
     def insert_key(self, key, value=None):
         self.root = self.insert(self.root, key, value)
+        self.size += 1
+
+    def update_key(self, key, value):
+        """
+        Replace the value stored under key, inserting it if missing
+        """
+        node = self.find(key)
+        if node is None:
+            self.insert_key(key, value)
+        else:
+            node.value = value
+
+    def bulk_update(self, items):
+        """
+        Insert or replace many (key, value) pairs; later pairs win on
+        duplicate keys
+
+        Small batches are inserted one by one. Large ones are merged with
+        the existing in-order contents and the tree is rebuilt perfectly
+        balanced in O(n + m), which beats m separate O(log n) inserts.
+        """
+        batch = []
+        for key, value in sorted(items, key=itemgetter(0)):
+            if batch and not batch[-1][0] < key:
+                batch[-1] = (key, value)
+            else:
+                batch.append((key, value))
+
+        if not batch:
+            return
+
+        if len(batch) * max(1, self.size.bit_length()) <= self.size:
+            for key, value in batch:
+                self.update_key(key, value)
+            return
+
+        merged = self._merge_items(self.items(), batch)
+        self.root = self._build_balanced(merged, 0, len(merged))
+        self.size = len(merged)
+
+    @staticmethod
+    def _merge_items(existing, batch):
+        """
+        Merge two key-sorted pair streams; batch values replace existing ones
+        """
+        merged = []
+        batch_iter = iter(batch)
+        pending = next(batch_iter, None)
+
+        for key, value in existing:
+            while pending is not None and pending[0] < key:
+                merged.append(pending)
+                pending = next(batch_iter, None)
+            if pending is not None and not key < pending[0]:
+                merged.append(pending)
+                pending = next(batch_iter, None)
+            else:
+                merged.append((key, value))
+
+        if pending is not None:
+            merged.append(pending)
+            merged.extend(batch_iter)
+        return merged
+
+    def _build_balanced(self, items, lo, hi):
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        node = AVLNode(*items[mid])
+        node.left = self._build_balanced(items, lo, mid)
+        node.right = self._build_balanced(items, mid + 1, hi)
+        # Midpoint splits give a complete-height subtree of hi - lo nodes
+        node.height = (hi - lo).bit_length()
+        return node
+
+    def delete(self, root, key):
+        if not root:
+            return root
+
+        if key < root.key:
+            root.left = self.delete(root.left, key)
+        elif root.key < key:
+            root.right = self.delete(root.right, key)
+        else:
+            if not root.left:
+                return root.right
+            if not root.right:
+                return root.left
+
+            # Replace with in-order successor
+            successor = root.right
+            while successor.left:
+                successor = successor.left
+            root.key, root.value = successor.key, successor.value
+            root.right = self.delete(root.right, successor.key)
+
+        self.update_height(root)
+        balance = self.balance_factor(root)
+
+        if balance > 1:
+            if self.balance_factor(root.left) < 0:
+                root.left = self.rotate_left(root.left)
+            return self.rotate_right(root)
+
+        if balance < -1:
+            if self.balance_factor(root.right) > 0:
+                root.right = self.rotate_right(root.right)
+            return self.rotate_left(root)
+
+        return root
+
+    def delete_key(self, key):
+        if self.find(key) is None:
+            return False
+        self.root = self.delete(self.root, key)
+        self.size -= 1
+        return True
 
     def search(self, root, key):
         if not root or root.key == key:
@@ -89,4 +217,108 @@ class AVLTree:
         return self.search(root.right, key)
 
     def find(self, key):
-        return self.search(self.root, key)
\ No newline at end of file
+        node = self.root
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def _iter_nodes_from(self, lo=None):
+        """
+        Iterative in-order traversal yielding nodes with key >= lo
+        """
+        stack = []
+        node = self.root
+
+        # Seed the stack with the path to the first key >= lo
+        while node:
+            if lo is not None and node.key < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+
+        while stack:
+            node = stack.pop()
+            yield node
+
+            node = node.right
+            while node:
+                stack.append(node)
+                node = node.left
+
+    def nodes(self):
+        return self._iter_nodes_from()
+
+    def keys(self):
+        return (node.key for node in self._iter_nodes_from())
+
+    def values(self):
+        return (node.value for node in self._iter_nodes_from())
+
+    def items(self):
+        return ((node.key, node.value) for node in self._iter_nodes_from())
+
+    def range(self, lo=None, hi=None):
+        """
+        Lazily yield (key, value) pairs with lo <= key < hi in key order
+        """
+        for node in self._iter_nodes_from(lo):
+            if hi is not None and not node.key < hi:
+                return
+            yield node.key, node.value
+
+    def prefix(self, prefix):
+        """
+        Lazily yield (key, value) pairs whose string key starts with prefix
+        """
+        for node in self._iter_nodes_from(prefix):
+            if not node.key.startswith(prefix):
+                return
+            yield node.key, node.value
+
+    def successor(self, key):
+        """
+        Node with the smallest key strictly greater than key, or None
+        """
+        node, best = self.root, None
+        while node:
+            if key < node.key:
+                best = node
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def predecessor(self, key):
+        """
+        Node with the largest key strictly smaller than key, or None
+        """
+        node, best = self.root, None
+        while node:
+            if node.key < key:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def min_node(self):
+        node = self.root
+        while node and node.left:
+            node = node.left
+        return node
+
+    def max_node(self):
+        node = self.root
+        while node and node.right:
+            node = node.right
+        return node
+
+    def scan(self, predicate):
+        """
+        Lazily yield values satisfying predicate, in key order
+        """
+        return (
+            node.value for node in self._iter_nodes_from()
+            if predicate(node.value)
+        )
\ No newline at end of file
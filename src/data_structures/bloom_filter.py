@@ -0,0 +1,238 @@
+import hashlib
+import json
+import math
+import threading
+import zlib
+from typing import Dict, List
+
+
+def _hash_pair(key) -> tuple:
+    """
+    Two independent 64-bit hashes of key, stable across processes
+    """
+    digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter sized for a target false-positive rate.
+
+    Bit positions come from double hashing of a BLAKE2b digest
+    rather than hash(), so a filter saved by one process is valid in
+    another.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def _positions(self, hashes):
+        h1, h2 = hashes
+        bit_count = self.bit_count
+        return [(h1 + i * h2) % bit_count for i in range(self.hash_count)]
+
+    def contains_hashes(self, hashes) -> bool:
+        # Probe lazily: most absent keys fail on the first bit or two
+        h1, h2 = hashes
+        bits, bit_count = self.bits, self.bit_count
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def add_hashes(self, hashes) -> None:
+        bits = self.bits
+        for position in self._positions(hashes):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key) -> bool:
+        return self.contains_hashes(_hash_pair(key))
+
+    def fill_ratio(self) -> float:
+        set_bits = int.from_bytes(self.bits, 'little').bit_count()
+        return set_bits / self.bit_count
+
+    def false_positive_rate(self) -> float:
+        """
+        Current false-positive probability estimated from the bits set
+        """
+        return self.fill_ratio() ** self.hash_count
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows with its contents.
+
+    Keys go into the newest stage until it reaches capacity; then a stage
+    growth times larger with a tightening times smaller error rate is
+    added. The compound false-positive rate stays below
+    error_rate / (1 - tightening) however many keys arrive. A negative
+    answer is definite and costs O(k) bit probes per stage.
+
+    Lookups may count as checks; record_false_positive() lets the owner
+    report positives that the authoritative store then missed, so the
+    observed false-positive rate can be compared with the estimate.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 65536,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5
+    ):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters: List[BloomFilter] = []
+
+        self.checks = 0
+        self.negatives = 0
+        self.false_positives = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(stage.count for stage in self.filters)
+
+    def _contains(self, hashes) -> bool:
+        return any(stage.contains_hashes(hashes) for stage in self.filters)
+
+    def __contains__(self, key) -> bool:
+        return self._contains(_hash_pair(key))
+
+    def might_contain(self, key) -> bool:
+        """
+        Membership test that also updates the check counters
+        """
+        present = self._contains(_hash_pair(key))
+        self.checks += 1
+        if not present:
+            self.negatives += 1
+        return present
+
+    def record_false_positive(self) -> None:
+        self.false_positives += 1
+
+    def add(self, key) -> bool:
+        """
+        Add key
+
+        Returns:
+            bool: False if the key was (probably) present already
+        """
+        hashes = _hash_pair(key)
+        with self._lock:
+            if self._contains(hashes):
+                return False
+
+            if not self.filters or self.filters[-1].count >= self.filters[-1].capacity:
+                stage = len(self.filters)
+                self.filters.append(BloomFilter(
+                    self.initial_capacity * self.growth ** stage,
+                    self.error_rate * self.tightening ** stage
+                ))
+            self.filters[-1].add_hashes(hashes)
+            return True
+
+    def update(self, keys) -> None:
+        for key in keys:
+            self.add(key)
+
+    def merge(self, other: 'ScalableBloomFilter') -> None:
+        """
+        Add every key of other, a filter built with the same settings
+
+        Stage i of both filters has the same geometry, so the union is a
+        bitwise OR stage by stage. Stage counts are summed: keys present in
+        both are counted twice, which only makes a stage fill up sooner.
+
+        Raises:
+            ValueError: If the filters were built with different settings
+        """
+        settings = ('initial_capacity', 'error_rate', 'growth', 'tightening')
+        if any(getattr(self, name) != getattr(other, name) for name in settings):
+            raise ValueError('Cannot merge Bloom filters with different settings')
+
+        with self._lock:
+            for stage, theirs in enumerate(other.filters):
+                if stage == len(self.filters):
+                    self.filters.append(BloomFilter(theirs.capacity, theirs.error_rate))
+                ours = self.filters[stage]
+                merged = int.from_bytes(ours.bits, 'little') | int.from_bytes(theirs.bits, 'little')
+                ours.bits[:] = merged.to_bytes(len(ours.bits), 'little')
+                ours.count += theirs.count
+
+    def false_positive_rate(self) -> float:
+        """
+        Estimated probability that an absent key tests positive
+        """
+        miss = 1.0
+        for stage in self.filters:
+            miss *= 1 - stage.false_positive_rate()
+        return 1 - miss
+
+    def stats(self) -> Dict:
+        absent_checks = self.negatives + self.false_positives
+        return {
+            'items': len(self),
+            'stages': len(self.filters),
+            'bytes': sum(len(stage.bits) for stage in self.filters),
+            'estimated_fp_rate': self.false_positive_rate(),
+            'checks': self.checks,
+            'negatives': self.negatives,
+            'false_positives': self.false_positives,
+            'observed_fp_rate': self.false_positives / absent_checks if absent_checks else 0.0
+        }
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialise as a JSON header line followed by each stage's bits
+        """
+        with self._lock:
+            payload = b''.join(bytes(stage.bits) for stage in self.filters)
+            header = {
+                'initial_capacity': self.initial_capacity,
+                'error_rate': self.error_rate,
+                'growth': self.growth,
+                'tightening': self.tightening,
+                'counts': [stage.count for stage in self.filters],
+                'crc': zlib.crc32(payload)
+            }
+        return json.dumps(header).encode() + b'\n' + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ScalableBloomFilter':
+        header_line, _, payload = data.partition(b'\n')
+        header = json.loads(header_line)
+        if zlib.crc32(payload) != header['crc']:
+            raise ValueError('Corrupt Bloom filter image')
+
+        bloom = cls(
+            header['initial_capacity'],
+            header['error_rate'],
+            header['growth'],
+            header['tightening']
+        )
+        offset = 0
+        for stage, count in enumerate(header['counts']):
+            bloom_stage = BloomFilter(
+                bloom.initial_capacity * bloom.growth ** stage,
+                bloom.error_rate * bloom.tightening ** stage
+            )
+            size = len(bloom_stage.bits)
+            bloom_stage.bits[:] = payload[offset:offset + size]
+            bloom_stage.count = count
+            offset += size
+            bloom.filters.append(bloom_stage)
+
+        if offset != len(payload):
+            raise ValueError('Bloom filter image does not match its header')
+        return bloom
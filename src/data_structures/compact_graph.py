@@ -0,0 +1,246 @@
+import numpy as np
+
+
+class CompactGraph:
+    """
+    Frozen CSR (compressed sparse row) snapshot of a Graph.
+
+    Vertices are interned to dense integer ids. Edges of vertex i occupy
+    neighbors[offsets[i]:offsets[i + 1]] with matching weights, so the
+    whole adjacency costs a few bytes per edge instead of a Python tuple.
+    """
+
+    def __init__(self, vertices, offsets, neighbors, weights):
+        self.vertices = list(vertices)
+        self.vertex_ids = {vertex: i for i, vertex in enumerate(self.vertices)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, sources, targets, weights=None, vertices=None):
+        """
+        Build a CSR graph from parallel edge columns
+
+        Args:
+            sources: Source vertex of each edge
+            targets: Target vertex of each edge
+            weights: Optional edge weights (default 1.0)
+            vertices: Optional extra vertices without edges
+
+        Returns:
+            CompactGraph: Frozen graph
+        """
+        vertex_ids = {}
+        for vertex in vertices or ():
+            vertex_ids.setdefault(vertex, len(vertex_ids))
+
+        src = np.fromiter(
+            (vertex_ids.setdefault(v, len(vertex_ids)) for v in sources),
+            dtype=np.int64
+        )
+        dst = np.fromiter(
+            (vertex_ids.setdefault(v, len(vertex_ids)) for v in targets),
+            dtype=np.int64,
+            count=len(src)
+        )
+        if weights is None:
+            weight_array = np.ones(len(src), dtype=np.float64)
+        else:
+            weight_array = np.asarray(weights, dtype=np.float64)
+
+        vertex_count = len(vertex_ids)
+        order = np.argsort(src, kind='stable')
+        counts = np.bincount(src, minlength=vertex_count)
+
+        offsets = np.zeros(vertex_count + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+
+        # Narrow id arrays when they fit to halve the per-edge footprint
+        id_dtype = np.int32 if vertex_count < 2 ** 31 else np.int64
+
+        return cls(
+            vertex_ids,
+            offsets,
+            dst[order].astype(id_dtype),
+            weight_array[order]
+        )
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Compact an adjacency-list Graph into CSR form
+        """
+        sources, targets, weights = [], [], []
+        for u, edges in graph.graph.items():
+            for v, weight in edges:
+                sources.append(u)
+                targets.append(v)
+                weights.append(weight)
+
+        return cls.from_edges(sources, targets, weights, graph.vertices)
+
+    @property
+    def vertex_count(self):
+        return len(self.vertices)
+
+    @property
+    def edge_count(self):
+        return len(self.neighbors)
+
+    def nbytes(self):
+        return self.offsets.nbytes + self.neighbors.nbytes + self.weights.nbytes
+
+    def _ids(self, vertices):
+        return np.fromiter(
+            (self.vertex_ids[v] for v in vertices if v in self.vertex_ids),
+            dtype=np.int64
+        )
+
+    def get_neighbors(self, vertex):
+        vertex_id = self.vertex_ids.get(vertex)
+        if vertex_id is None:
+            return []
+
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return [
+            (self.vertices[v], float(w))
+            for v, w in zip(self.neighbors[start:end], self.weights[start:end])
+        ]
+
+    def _expand(self, frontier):
+        """
+        All out-neighbour ids of a frontier, gathered without a Python loop
+        """
+        starts = self.offsets[frontier]
+        lengths = self.offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+
+        # Position k of the output reads neighbors[starts[j] + (k - first_k_of_j)]
+        shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        return self.neighbors[shifts + np.arange(total)]
+
+    def bfs_levels(self, start, max_depth=None):
+        """
+        Frontier-based breadth-first search
+
+        Returns:
+            numpy.ndarray: Hop distance per vertex id (-1 if unreachable)
+        """
+        levels = np.full(self.vertex_count, -1, dtype=np.int64)
+        frontier = self._ids([start])
+        if len(frontier) == 0:
+            return levels
+
+        levels[frontier] = 0
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            candidates = self._expand(frontier)
+            candidates = candidates[levels[candidates] < 0]
+            frontier = np.unique(candidates)
+
+            depth += 1
+            levels[frontier] = depth
+
+        return levels
+
+    def breadth_first_search(self, start):
+        levels = self.bfs_levels(start)
+        return {self.vertices[i] for i in np.flatnonzero(levels >= 0)}
+
+    def is_reachable(self, start, target):
+        """
+        True if target can be reached from start along directed edges
+        """
+        target_id = self.vertex_ids.get(target)
+        if target_id is None or start not in self.vertex_ids:
+            return False
+
+        visited = np.zeros(self.vertex_count, dtype=bool)
+        frontier = self._ids([start])
+        visited[frontier] = True
+
+        while len(frontier):
+            if visited[target_id]:
+                return True
+            candidates = self._expand(frontier)
+            frontier = np.unique(candidates[~visited[candidates]])
+            visited[frontier] = True
+
+        return bool(visited[target_id])
+
+    def depth_first_search(self, start):
+        """
+        Iterative depth-first search; returns vertices in visit order
+        """
+        start_id = self.vertex_ids.get(start)
+        if start_id is None:
+            return []
+
+        offsets = self.offsets
+        neighbors = self.neighbors
+        visited = np.zeros(self.vertex_count, dtype=bool)
+        order = []
+        stack = [start_id]
+
+        while stack:
+            vertex = stack.pop()
+            if visited[vertex]:
+                continue
+
+            visited[vertex] = True
+            order.append(self.vertices[vertex])
+
+            # Push in reverse so neighbours are visited in edge order
+            adjacent = neighbors[offsets[vertex]:offsets[vertex + 1]]
+            stack.extend(adjacent[~visited[adjacent]][::-1].tolist())
+
+        return order
+
+    def connected_components(self):
+        """
+        Label weakly connected components by min-label propagation
+        with pointer jumping
+
+        Returns:
+            numpy.ndarray: Component label (smallest member id) per vertex id
+        """
+        labels = np.arange(self.vertex_count, dtype=np.int64)
+        if self.edge_count == 0:
+            return labels
+
+        src = np.repeat(
+            np.arange(self.vertex_count, dtype=np.int64),
+            np.diff(self.offsets)
+        )
+        dst = self.neighbors.astype(np.int64)
+
+        while True:
+            previous = labels.copy()
+            np.minimum.at(labels, src, labels[dst])
+            np.minimum.at(labels, dst, labels[src])
+
+            # Shortcut label chains until every vertex points at a root
+            while True:
+                jumped = labels[labels]
+                if np.array_equal(jumped, labels):
+                    break
+                labels = jumped
+
+            if np.array_equal(labels, previous):
+                return labels
+
+    def component_members(self, vertex, labels=None):
+        """
+        All vertices in the weakly connected component of vertex
+        """
+        vertex_id = self.vertex_ids.get(vertex)
+        if vertex_id is None:
+            return []
+
+        if labels is None:
+            labels = self.connected_components()
+        members = np.flatnonzero(labels == labels[vertex_id])
+        return [self.vertices[i] for i in members]
@@ -1,17 +1,36 @@
-from collections import defaultdict
+import heapq
+from collections import defaultdict, deque
 
 class Graph:
     def __init__(self):
         self.graph = defaultdict(list)
         self.vertices = set()
+        # Bumped once per edge added or removal made, so derived snapshots
+        # can tell whether and by how much they are out of date
+        self.version = 0
+        self.removals = 0
 
     def add_edge(self, u, v, weight=1):
         self.graph[u].append((v, weight))
         self.vertices.add(u)
         self.vertices.add(v)
+        self.version += 1
+
+    def add_edges(self, sources, targets, weights):
+        """
+        Bulk insert parallel columns of edges
+        """
+        graph = self.graph
+        for u, v, weight in zip(sources, targets, weights):
+            graph[u].append((v, weight))
+        self.vertices.update(sources)
+        self.vertices.update(targets)
+        self.version += len(sources)
 
     def remove_edge(self, u, v):
         self.graph[u] = [edge for edge in self.graph[u] if edge[0] != v]
+        self.version += 1
+        self.removals += 1
 
     def has_edge(self, u, v):
         return any(edge[0] == v for edge in self.graph[u])
@@ -19,51 +38,211 @@ class Graph:
     def get_neighbors(self, vertex):
         return self.graph[vertex]
 
-    def dijkstra(self, start):
-        distances = {vertex: float('infinity') for vertex in self.vertices}
-        distances[start] = 0
-        
-        unvisited = list(self.vertices)
-        
-        while unvisited:
-            current = min(unvisited, key=lambda vertex: distances[vertex])
-            
-            if distances[current] == float('infinity'):
+    def multi_source_dijkstra(self, sources, target=None, max_distance=None):
+        """
+        Heap-based Dijkstra with lazy deletion.
+
+        Args:
+            sources: Iterable of start vertices (distance 0)
+            target: Optional vertex; search stops once it is settled
+            max_distance: Optional cutoff; farther vertices are not settled
+
+        Returns:
+            tuple: (distances, predecessors) for every settled vertex
+        """
+        distances = {}
+        predecessors = {}
+        best = {}
+        heap = []
+
+        for source in sources:
+            if source not in best:
+                best[source] = 0
+                predecessors[source] = None
+                heap.append((0, source))
+        heapq.heapify(heap)
+
+        while heap:
+            distance, current = heapq.heappop(heap)
+
+            # Skip stale heap entries
+            if current in distances:
+                continue
+
+            distances[current] = distance
+            if current == target:
                 break
-            
-            for neighbor, weight in self.graph[current]:
-                distance = distances[current] + weight
-                
-                if distance < distances[neighbor]:
-                    distances[neighbor] = distance
-            
-            unvisited.remove(current)
-        
+
+            for neighbor, weight in self.graph.get(current, ()):
+                if neighbor in distances:
+                    continue
+
+                candidate = distance + weight
+                if max_distance is not None and candidate > max_distance:
+                    continue
+
+                if candidate < best.get(neighbor, float('infinity')):
+                    best[neighbor] = candidate
+                    predecessors[neighbor] = current
+                    heapq.heappush(heap, (candidate, neighbor))
+
+        predecessors = {
+            vertex: predecessors[vertex] for vertex in distances
+        }
+        return distances, predecessors
+
+    def dijkstra(self, start, target=None, max_distance=None):
+        """
+        Shortest distances from start to every reachable vertex
+        (within max_distance, stopping early at target if given)
+        """
+        distances, _ = self.multi_source_dijkstra(
+            [start], target=target, max_distance=max_distance
+        )
         return distances
 
+    def shortest_path(self, start, target, max_distance=None):
+        """
+        Shortest path between two vertices
+
+        Returns:
+            tuple: (distance, path) or (infinity, []) if unreachable
+        """
+        distances, predecessors = self.multi_source_dijkstra(
+            [start], target=target, max_distance=max_distance
+        )
+        if target not in distances:
+            return float('infinity'), []
+
+        path = []
+        vertex = target
+        while vertex is not None:
+            path.append(vertex)
+            vertex = predecessors[vertex]
+        path.reverse()
+
+        return distances[target], path
+
     def depth_first_search(self, start, visited=None):
         if visited is None:
             visited = set()
-        
-        visited.add(start)
-        
-        for neighbor, _ in self.graph[start]:
-            if neighbor not in visited:
-                self.depth_first_search(neighbor, visited)
-        
+
+        # Explicit stack so long transfer chains cannot hit the recursion limit
+        stack = [start]
+        while stack:
+            vertex = stack.pop()
+            if vertex in visited:
+                continue
+
+            visited.add(vertex)
+            for neighbor, _ in reversed(self.graph.get(vertex, ())):
+                if neighbor not in visited:
+                    stack.append(neighbor)
+
         return visited
 
     def breadth_first_search(self, start):
-        visited = set()
-        queue = [start]
-        visited.add(start)
-        
+        visited = {start}
+        queue = deque([start])
+
         while queue:
-            vertex = queue.pop(0)
-            
-            for neighbor, _ in self.graph[vertex]:
+            vertex = queue.popleft()
+
+            for neighbor, _ in self.graph.get(vertex, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+
+        return visited
+
+    def is_reachable(self, start, target):
+        """
+        Breadth-first search from start that stops once target is seen
+        """
+        if start == target:
+            return start in self.vertices
+
+        visited = {start}
+        queue = deque([start])
+        while queue:
+            for neighbor, _ in self.graph.get(queue.popleft(), ()):
+                if neighbor == target:
+                    return True
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
-        
-        return visited
\ No newline at end of file
+
+        return False
+
+    def strongly_connected_components(self, min_size=1):
+        """
+        Tarjan's algorithm with an explicit stack.
+
+        Args:
+            min_size: Drop components with fewer vertices (2 keeps only
+                groups of accounts that can send money round in a cycle)
+
+        Returns:
+            list: Components as lists of vertices, in reverse topological
+            order of the condensation
+        """
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self.vertices:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            # Each frame holds a vertex and an iterator over its edges
+            work = [(root, iter(self.graph.get(root, ())))]
+
+            while work:
+                vertex, edges = work[-1]
+                descended = False
+                for neighbor, _ in edges:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = counter
+                        counter += 1
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(self.graph.get(neighbor, ()))))
+                        descended = True
+                        break
+                    if neighbor in on_stack and index[neighbor] < lowlink[vertex]:
+                        lowlink[vertex] = index[neighbor]
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[vertex] < lowlink[parent]:
+                        lowlink[parent] = lowlink[vertex]
+
+                if lowlink[vertex] == index[vertex]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == vertex:
+                            break
+                    if len(component) >= min_size:
+                        components.append(component)
+
+        return components
+
+    def compact(self):
+        """
+        Freeze the current edges into a CSR-backed CompactGraph
+        """
+        from src.data_structures.compact_graph import CompactGraph
+        return CompactGraph.from_graph(self)
\ No newline at end of file
@@ -1,40 +1,228 @@
+from array import array
+
+_EMPTY = -1
+_DUMMY = -2
+_MISSING = object()
+_PERTURB_MASK = (1 << 64) - 1
+
+
 class HashTable:
-    def __init__(self, size=100):
-        self.size = size
-        self.table = [[] for _ in range(self.size)]
+    """
+    Compact open-addressing hash table.
+
+    Entries live in dense parallel arrays (hashes, keys, values) in insertion
+    order, while a sparse signed index array maps probe slots to entry
+    positions. Capacity grows and shrinks with the load factor.
+    """
+
+    def __init__(self, size=8, max_load=0.66, min_load=0.1):
+        self.max_load = max_load
+        self.min_load = min_load
+        self._min_size = self._capacity_for(size)
+        self._reset(self._min_size)
+
+    def _reset(self, capacity):
+        self.size = capacity
+        self._mask = capacity - 1
+        self._indices = array('q', [_EMPTY]) * capacity
+        self._hashes = array('q')
+        self._keys = []
+        self._values = []
+        self._used = 0
+        self._filled = 0  # live entries plus dummies in the index
+
+    @staticmethod
+    def _capacity_for(count):
+        capacity = 8
+        while capacity < count:
+            capacity <<= 1
+        return capacity
 
     def _hash_function(self, key):
-        return hash(key) % self.size
+        return hash(key)
+
+    def _lookup(self, key, key_hash):
+        """
+        Probe for key. Returns (slot, entry); entry is -1 when missing and
+        slot is the first reusable slot along the probe sequence.
+        """
+        mask = self._mask
+        indices = self._indices
+        perturb = key_hash & _PERTURB_MASK
+        slot = key_hash & mask
+        free_slot = -1
+
+        while True:
+            entry = indices[slot]
+            if entry == _EMPTY:
+                return (slot if free_slot < 0 else free_slot), -1
+            if entry == _DUMMY:
+                if free_slot < 0:
+                    free_slot = slot
+            elif self._hashes[entry] == key_hash:
+                stored = self._keys[entry]
+                if stored is key or stored == key:
+                    return slot, entry
+
+            perturb >>= 5
+            slot = (slot * 5 + perturb + 1) & mask
+
+    def _resize(self, capacity):
+        hashes = self._hashes
+        keys = self._keys
+        values = self._values
+        live = [i for i in range(len(keys)) if keys[i] is not _MISSING]
+
+        self._reset(capacity)
+        mask = self._mask
+        indices = self._indices
+
+        for i in live:
+            key_hash = hashes[i]
+            perturb = key_hash & _PERTURB_MASK
+            slot = key_hash & mask
+            while indices[slot] != _EMPTY:
+                perturb >>= 5
+                slot = (slot * 5 + perturb + 1) & mask
+
+            indices[slot] = len(self._keys)
+            self._hashes.append(key_hash)
+            self._keys.append(keys[i])
+            self._values.append(values[i])
+
+        self._used = len(live)
+        self._filled = self._used
+
+    def _shrink_if_needed(self):
+        if self.size > self._min_size and self._used < self.size * self.min_load:
+            self._resize(max(self._min_size, self._capacity_for(self._used * 2)))
 
     def insert(self, key, value):
-        index = self._hash_function(key)
-        for item in self.table[index]:
-            if item[0] == key:
-                item[1] = value
-                return
-        self.table[index].append([key, value])
-
-    def get(self, key):
-        index = self._hash_function(key)
-        for item in self.table[index]:
-            if item[0] == key:
-                return item[1]
-        raise KeyError(key)
+        key_hash = self._hash_function(key)
+        slot, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+
+        # Rebuild when the index gets too full or deleted entries pile up
+        # in the dense arrays
+        if (
+            self._filled + 1 > self.size * self.max_load
+            or len(self._keys) >= self.size
+        ):
+            self._resize(
+                max(self._min_size, self._capacity_for((self._used + 1) * 2))
+            )
+            slot, _ = self._lookup(key, key_hash)
+
+        if self._indices[slot] == _EMPTY:
+            self._filled += 1
+
+        self._indices[slot] = len(self._keys)
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self._used += 1
+
+    def get(self, key, default=_MISSING):
+        _, entry = self._lookup(key, self._hash_function(key))
+        if entry >= 0:
+            return self._values[entry]
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def setdefault(self, key, default=None):
+        """
+        Return the value for key, inserting default first if missing
+        """
+        key_hash = self._hash_function(key)
+        _, entry = self._lookup(key, key_hash)
+        if entry >= 0:
+            return self._values[entry]
+        self.insert(key, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        slot, entry = self._lookup(key, self._hash_function(key))
+        if entry < 0:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        value = self._values[entry]
+        self._indices[slot] = _DUMMY
+        self._keys[entry] = _MISSING
+        self._values[entry] = None
+        self._used -= 1
+        self._shrink_if_needed()
+        return value
 
     def remove(self, key):
-        index = self._hash_function(key)
-        for i, item in enumerate(self.table[index]):
-            if item[0] == key:
-                del self.table[index][i]
-                return
-        raise KeyError(key)
+        self.pop(key)
 
     def contains(self, key):
-        index = self._hash_function(key)
-        return any(item[0] == key for item in self.table[index])
+        return self._lookup(key, self._hash_function(key))[1] >= 0
+
+    def update(self, items):
+        """
+        Bulk insert from a mapping or an iterable of (key, value) pairs
+        """
+        if hasattr(items, 'items'):
+            items = items.items()
+        elif not isinstance(items, (list, tuple)):
+            items = list(items)
+
+        # Size the table once up front instead of growing repeatedly
+        needed = self._filled + len(items)
+        if needed > self.size * self.max_load:
+            self._resize(self._capacity_for(int(needed / self.max_load) + 1))
+
+        for key, value in items:
+            self.insert(key, value)
+
+    def clear(self):
+        self._reset(self._min_size)
+
+    def iter_keys(self):
+        return (key for key in self._keys if key is not _MISSING)
+
+    def iter_values(self):
+        keys = self._keys
+        return (
+            value for i, value in enumerate(self._values)
+            if keys[i] is not _MISSING
+        )
+
+    def iter_items(self):
+        return (
+            (key, value) for key, value in zip(self._keys, self._values)
+            if key is not _MISSING
+        )
 
     def keys(self):
-        return [item[0] for sublist in self.table for item in sublist]
+        return list(self.iter_keys())
 
     def values(self):
-        return [item[1] for sublist in self.table for item in sublist]
\ No newline at end of file
+        return list(self.iter_values())
+
+    def items(self):
+        return list(self.iter_items())
+
+    def __len__(self):
+        return self._used
+
+    def __iter__(self):
+        return self.iter_keys()
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __getitem__(self, key):
+        return self.get(key)
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
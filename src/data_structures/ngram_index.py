@@ -0,0 +1,128 @@
+import heapq
+
+from src.data_structures.hash_table import HashTable
+
+# Marks the start of a document so prefix queries have their own grams
+_START = '\x02'
+
+
+class NGramIndex:
+    """
+    Incrementally maintained n-gram (trigram by default) substring index.
+
+    Each document's lowercase text is split into overlapping grams of
+    every length up to n and every gram keeps a posting set of document
+    ids. A query is answered by intersecting the postings of its own
+    n-grams, smallest first, and then verifying the few surviving
+    candidates. A query no longer than n is itself a gram, so its posting
+    is exactly its matches and short queries never scan the documents.
+    """
+
+    def __init__(self, n=3, key_func=None):
+        self.n = n
+        # Optional extractor for callers indexing objects by a field
+        self.key_func = key_func
+        self.postings = HashTable()
+        self.documents = HashTable()
+
+    def __len__(self):
+        return len(self.documents)
+
+    def _grams(self, text):
+        padded = _START + text
+        return {
+            padded[i:i + size]
+            for size in range(1, self.n + 1)
+            for i in range(len(padded) - size + 1)
+        }
+
+    def add(self, doc_id, text):
+        """
+        Index (or re-index) a document's text
+        """
+        if self.documents.contains(doc_id):
+            self.remove(doc_id)
+
+        text = str(text).lower()
+        self.documents.insert(doc_id, text)
+
+        for gram in self._grams(text):
+            posting = self.postings.get(gram, None)
+            if posting is None:
+                posting = set()
+                self.postings.insert(gram, posting)
+            posting.add(doc_id)
+
+    def remove(self, doc_id):
+        text = self.documents.pop(doc_id, None)
+        if text is None:
+            return False
+
+        for gram in self._grams(text):
+            posting = self.postings.get(gram, None)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    self.postings.remove(gram)
+        return True
+
+    def _candidates(self, query, prefix):
+        """
+        Document ids that may match; always a superset of the real matches
+        """
+        pattern = _START + query if prefix else query
+
+        if len(pattern) <= self.n:
+            # A gram of its own: the posting holds exactly the matches
+            return set(self.postings.get(pattern, ()))
+
+        grams = {
+            pattern[i:i + self.n]
+            for i in range(len(pattern) - self.n + 1)
+        }
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram, None)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def search(self, query, limit=None, prefix=False):
+        """
+        Find documents whose text contains (or starts with) query
+
+        Results are ranked exact match first, then prefix matches, then by
+        match position, text length and document id.
+
+        Args:
+            query (str): Substring to look for (case-insensitive)
+            limit (int): Optional maximum number of results
+            prefix (bool): Only match at the start of the text
+
+        Returns:
+            list: Matching document ids, best first
+        """
+        query = str(query).lower()
+        if not query:
+            return []
+
+        documents = self.documents
+        ranked = []
+        for doc_id in self._candidates(query, prefix):
+            text = documents.get(doc_id)
+            position = text.find(query)
+            if position < 0 or (prefix and position > 0):
+                continue
+
+            exactness = 0 if text == query else (1 if position == 0 else 2)
+            ranked.append((exactness, position, len(text), doc_id))
+
+        if limit is not None and limit < len(ranked):
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+
+        return [entry[-1] for entry in ranked]
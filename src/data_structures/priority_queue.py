@@ -1,5 +1,15 @@
 import heapq
 
+
+def _max_key(priority):
+    """
+    Heap key giving max-heap order; tuple priorities compare tier by tier
+    """
+    if isinstance(priority, tuple):
+        return tuple(-part for part in priority)
+    return -priority
+
+
 class PriorityQueue:
     def __init__(self):
         self._queue = []
@@ -7,9 +17,26 @@ class PriorityQueue:
 
     def push(self, item, priority):
         # Use negative priority for max-heap behavior
-        heapq.heappush(self._queue, (-priority, self._index, item))
+        heapq.heappush(self._queue, (_max_key(priority), self._index, item))
         self._index += 1
 
+    def push_many(self, items, priorities):
+        """
+        Push many items at once; large batches are merged with one heapify
+        """
+        entries = [
+            (_max_key(priority), self._index + offset, item)
+            for offset, (item, priority) in enumerate(zip(items, priorities))
+        ]
+        self._index += len(entries)
+
+        if len(entries) > len(self._queue) // 4:
+            self._queue.extend(entries)
+            heapq.heapify(self._queue)
+        else:
+            for entry in entries:
+                heapq.heappush(self._queue, entry)
+
     def pop(self):
         if self.is_empty():
             raise IndexError("Priority queue is empty")
@@ -0,0 +1,188 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from src.data_structures.avl_tree import AVLTree
+from src.data_structures.hash_table import HashTable
+from src.data_structures.secondary_index import SecondaryIndex
+
+
+def normalize(value: Any) -> str:
+    """
+    Case-insensitive string form used for both stored and queried values
+    """
+    return str(value).lower()
+
+
+class QueryPlanner:
+    """
+    Equality queries over objects with optional secondary indexes.
+
+    Criteria are {attribute: value} pairs compared case-insensitively on
+    their string form. Indexed criteria are ordered by posting size; the
+    smallest posting drives the query and every other indexed criterion
+    is intersected by probing its posting for the candidate's primary
+    key. Unindexed criteria are evaluated as a filter on the survivors,
+    and only a query with no indexed criterion scans every object.
+    """
+
+    def __init__(self):
+        self.indexes: Dict[str, SecondaryIndex] = {}
+        # primary key -> (object, {index name: indexed value})
+        self.entries = HashTable()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add_index(self, name: str, key_func: Optional[Callable] = None) -> SecondaryIndex:
+        """
+        Index a (possibly derived) attribute, backfilling current objects
+        """
+        extract = key_func or (lambda obj: getattr(obj, name, ''))
+        index = SecondaryIndex(name, lambda obj: normalize(extract(obj)))
+        self.indexes[name] = index
+
+        for primary_key, (obj, values) in self.entries.iter_items():
+            index.add(primary_key, obj)
+            values[name] = index.key_func(obj)
+        return index
+
+    def add(self, primary_key, obj) -> None:
+        """
+        Index obj, replacing any object stored under the same key
+        """
+        if self.entries.contains(primary_key):
+            self.remove(primary_key)
+
+        values = {}
+        for name, index in self.indexes.items():
+            index.add(primary_key, obj)
+            values[name] = index.key_func(obj)
+        self.entries.insert(primary_key, (obj, values))
+
+    def add_many(self, items) -> None:
+        """
+        Index many (primary_key, obj) pairs, loading each posting with one
+        bulk update instead of an insert per object
+        """
+        grouped = {name: {} for name in self.indexes}
+        # Later pairs win when a key repeats
+        for primary_key, obj in dict(items).items():
+            if self.entries.contains(primary_key):
+                self.remove(primary_key)
+
+            values = {}
+            for name, index in self.indexes.items():
+                value = values[name] = index.key_func(obj)
+                grouped[name].setdefault(value, []).append((primary_key, obj))
+            self.entries.insert(primary_key, (obj, values))
+
+        for name, by_value in grouped.items():
+            postings = self.indexes[name].postings
+            for value, pairs in by_value.items():
+                tree = postings.get(value, None)
+                if tree is None:
+                    tree = AVLTree()
+                    postings.insert(value, tree)
+                tree.bulk_update(pairs)
+
+    def remove(self, primary_key) -> bool:
+        entry = self.entries.pop(primary_key, None)
+        if entry is None:
+            return False
+
+        for name, value in entry[1].items():
+            self.indexes[name].remove(primary_key, value)
+        return True
+
+    def reindex(self, primary_key) -> None:
+        """
+        Refresh an object's postings after its attributes changed
+        """
+        entry = self.entries.get(primary_key, None)
+        if entry is not None:
+            self.add(primary_key, entry[0])
+
+    def plan(self, criteria: Mapping[str, Any]) -> Dict:
+        """
+        Choose how to answer criteria
+
+        Returns:
+            Dict: 'steps' in execution order, each with its operation and
+            estimated row count, plus the overall 'estimated_rows'
+        """
+        indexed, filtered = [], []
+        for attribute, value in criteria.items():
+            wanted = normalize(value)
+            index = self.indexes.get(attribute)
+            if index is None:
+                filtered.append((attribute, wanted))
+            else:
+                indexed.append((index.count(wanted), attribute, wanted))
+
+        # Most selective index first
+        indexed.sort(key=lambda item: item[0])
+
+        steps = []
+        if indexed:
+            count, attribute, wanted = indexed[0]
+            steps.append({'op': 'index_scan', 'index': attribute, 'value': wanted, 'rows': count})
+            for count, attribute, wanted in indexed[1:]:
+                steps.append({'op': 'intersect', 'index': attribute, 'value': wanted, 'rows': count})
+            estimate = indexed[0][0]
+        else:
+            estimate = len(self.entries)
+            steps.append({'op': 'full_scan', 'rows': estimate})
+
+        for attribute, wanted in filtered:
+            steps.append({'op': 'filter', 'attribute': attribute, 'value': wanted})
+
+        return {'steps': steps, 'estimated_rows': estimate}
+
+    def explain(self, criteria: Mapping[str, Any]) -> str:
+        """
+        Human-readable plan, one step per line
+        """
+        lines = []
+        for step in self.plan(criteria)['steps']:
+            if step['op'] == 'filter':
+                lines.append(f"filter {step['attribute']} == {step['value']!r}")
+            elif step['op'] == 'full_scan':
+                lines.append(f"full scan ({step['rows']} rows)")
+            else:
+                lines.append(
+                    f"{step['op'].replace('_', ' ')} {step['index']} == {step['value']!r}"
+                    f" ({step['rows']} rows)"
+                )
+        return '\n'.join(lines)
+
+    def query(self, criteria: Mapping[str, Any]) -> List:
+        """
+        Objects matching every criterion; ordered by primary key when an
+        index drives the query
+        """
+        steps = self.plan(criteria)['steps']
+        driver = steps[0]
+
+        if driver['op'] == 'index_scan':
+            if driver['rows'] == 0:
+                return []
+            candidates = self.indexes[driver['index']].postings.get(driver['value']).items()
+        else:
+            candidates = (
+                (primary_key, obj) for primary_key, (obj, _) in self.entries.iter_items()
+            )
+
+        probes = [
+            self.indexes[step['index']].postings.get(step['value'], None)
+            for step in steps if step['op'] == 'intersect'
+        ]
+        if any(posting is None for posting in probes):
+            return []
+
+        filters = [(step['attribute'], step['value']) for step in steps if step['op'] == 'filter']
+
+        return [
+            obj for primary_key, obj in candidates
+            if all(posting.find(primary_key) is not None for posting in probes)
+            and all(normalize(getattr(obj, attribute, '')) == wanted
+                    for attribute, wanted in filters)
+        ]
@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import Callable, Hashable
+
+from src.data_structures.ttl_cache import TTLCache
+
+
+class TokenBucketLimiter:
+    """
+    Per-key token buckets with bounded memory.
+
+    Each key gets capacity tokens that refill at rate tokens per second;
+    an attempt spends one token or is rejected. A bucket left alone for
+    capacity / rate seconds is full again, which is exactly the state of a
+    bucket that doesn't exist, so buckets live in a TTLCache with that
+    lifetime and idle ones simply expire. max_keys caps memory under a
+    flood of distinct keys.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        max_keys: int = 100000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError('rate must be positive and capacity at least 1')
+
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.buckets = TTLCache(maxsize=max_keys, ttl=capacity / rate, clock=clock)
+        self._lock = threading.Lock()
+
+    def allow(self, key: Hashable, cost: float = 1.0) -> bool:
+        """
+        Spend cost tokens from key's bucket if it holds enough
+
+        Returns:
+            bool: True if the attempt may proceed
+        """
+        now = self.clock()
+        with self._lock:
+            # bucket is [tokens, last_refill]
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = [self.capacity, now]
+            else:
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+
+            allowed = bucket[0] >= cost
+            if allowed:
+                bucket[0] -= cost
+
+            # Re-arm expiry: the bucket is full again after this long
+            self.buckets.set(key, bucket, ttl=(self.capacity - bucket[0]) / self.rate)
+
+        return allowed
+
+    def tokens(self, key: Hashable) -> float:
+        """
+        Tokens currently available to key
+        """
+        bucket = self.buckets.get(key, touch=False)
+        if bucket is None:
+            return self.capacity
+        return min(self.capacity, bucket[0] + (self.clock() - bucket[1]) * self.rate)
+
+    def reset(self, key: Hashable) -> None:
+        self.buckets.pop(key)
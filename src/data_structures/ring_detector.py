@@ -0,0 +1,335 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+class RingDetector:
+    """
+    Streaming detection of round-tripping transfer rings.
+
+    Keeps only the transfers of the last window seconds, grouped per
+    (source, target) pair and reachable from both ends; old edges fall
+    off the front as new ones arrive, so memory tracks the transfer rate,
+    not history. Each new transfer u -> v is checked for time-ordered
+    paths v -> ... -> u of at most max_length - 1 hops inside the window.
+    Together with the new edge, such a path is a ring in which the money
+    returns to where it started.
+
+    The search is local. A bounded reverse BFS from u finds the vertices
+    that can still reach u in the remaining hops, and the forward DFS from
+    v only enters those vertices. Repeated transfers between the same pair
+    are one step of the search (the earliest usable one is taken), so
+    branching is bounded by distinct counterparties. Both phases share a
+    per-transfer expansion budget, so a hub account cannot stall the feed.
+    add_batch() checks a whole settled batch in one pass under a single
+    budget for the batch, so detection cost stays bounded per batch
+    rather than growing with its row count.
+
+    Expiry pops the oldest edges off the front and pair lookups bisect, so
+    edges must be recorded in time order. Transfers without a timestamp
+    are stamped from clock() under the lock; one stamped earlier than the
+    newest edge already recorded is recorded at that newest time.
+    """
+
+    def __init__(
+        self,
+        window: float = 3600.0,
+        max_length: int = 4,
+        max_rings_per_transfer: int = 16,
+        max_expansions: int = 20000,
+        max_batch_expansions: int = 200000,
+        max_alerts: int = 1000,
+        clock: Callable[[], float] = time.time
+    ):
+        if max_length < 2:
+            raise ValueError('max_length must be at least 2')
+        self.window = window
+        self.max_length = max_length
+        self.max_rings_per_transfer = max_rings_per_transfer
+        self.max_expansions = max_expansions
+        self.max_batch_expansions = max_batch_expansions
+        self.clock = clock
+
+        # source -> {target: pair}, target -> {source: pair}; both views
+        # share one list of (timestamp, amount, transaction_id) per pair;
+        # most pairs hold a single transfer, so lists beat deques on memory
+        self.out_edges: Dict = {}
+        self.in_edges: Dict = {}
+        # (timestamp, source, target) in arrival order, for expiry
+        self.edges = deque()
+        self.newest = float('-inf')
+
+        self.alerts = deque(maxlen=max_alerts)
+        self.transfers_seen = 0
+        self.rings_found = 0
+        self.truncated_searches = 0
+        self.unsearched_transfers = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def add_transfer(
+        self,
+        source,
+        target,
+        amount: float,
+        transaction_id: Optional[str] = None,
+        timestamp: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Record a transfer and report the rings it closes
+
+        Args:
+            source, target: Account numbers
+            amount (float): Transfer amount
+            transaction_id (Optional[str]): Carried into ring reports
+            timestamp (Optional[float]): Epoch seconds (default: clock());
+                never earlier than the newest transfer recorded
+
+        Returns:
+            List[Dict]: Newly closed rings (also kept in alerts)
+        """
+        with self._lock:
+            timestamp = self._advance(timestamp)
+            self._insert(source, target, amount, transaction_id, timestamp)
+            if source == target:
+                return []
+
+            rings, _ = self._search(
+                source, target, amount, transaction_id, timestamp, self.max_expansions
+            )
+            self.rings_found += len(rings)
+            self.alerts.extend(rings)
+            return rings
+
+    def add_batch(
+        self,
+        sources: Sequence,
+        targets: Sequence,
+        amounts: Sequence[float],
+        transaction_ids: Optional[Sequence[str]] = None,
+        timestamp: Optional[float] = None,
+        budget: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Record transfers made together and report the rings they close
+
+        Rows are recorded and checked in order, exactly as repeated
+        add_transfer() calls would, but in one pass under one lock and with
+        one expansion budget for the whole batch. Once it is spent the
+        remaining rows are still recorded (so later transfers can close
+        rings through them) without being searched themselves.
+
+        Args:
+            sources, targets: Account numbers, one per row
+            amounts (Sequence[float]): Transfer amounts
+            transaction_ids (Optional[Sequence[str]]): Carried into ring reports
+            timestamp (Optional[float]): Epoch seconds of every row (default:
+                clock()); never earlier than the newest transfer recorded
+            budget (Optional[int]): Expansions for the batch (default:
+                max_batch_expansions)
+
+        Returns:
+            List[Dict]: Newly closed rings (also kept in alerts)
+        """
+        if transaction_ids is None:
+            transaction_ids = [None] * len(amounts)
+        if budget is None:
+            budget = self.max_batch_expansions
+
+        found = []
+        with self._lock:
+            timestamp = self._advance(timestamp)
+            for source, target, amount, transaction_id in zip(
+                    sources, targets, amounts, transaction_ids):
+                self._insert(source, target, amount, transaction_id, timestamp)
+                if source == target:
+                    continue
+                if budget <= 0:
+                    self.unsearched_transfers += 1
+                    continue
+
+                # No single row may take more than a lone transfer would
+                rings, spent = self._search(
+                    source, target, amount, transaction_id, timestamp,
+                    min(budget, self.max_expansions)
+                )
+                budget -= spent
+                found.extend(rings)
+
+            self.rings_found += len(found)
+            self.alerts.extend(found)
+        return found
+
+    def _advance(self, timestamp: Optional[float]) -> float:
+        """
+        Time to record the next transfer at, expiring what it pushes out
+        of the window (caller holds the lock)
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        # Late arrivals join at the newest time so the window stays sorted
+        if timestamp < self.newest:
+            timestamp = self.newest
+        self.newest = timestamp
+        self._expire(timestamp - self.window)
+        return timestamp
+
+    def _insert(self, source, target, amount, transaction_id, timestamp) -> None:
+        self.transfers_seen += 1
+        self.edges.append((timestamp, source, target))
+        targets = self.out_edges.setdefault(source, {})
+        pair = targets.get(target)
+        if pair is None:
+            pair = targets[target] = []
+            self.in_edges.setdefault(target, {})[source] = pair
+        pair.append((timestamp, amount, transaction_id))
+
+    def _expire(self, cutoff: float) -> None:
+        # Pair lists are in arrival order too, so the edge leaving the
+        # global deque is at the front of its pair
+        edges = self.edges
+        while edges and edges[0][0] < cutoff:
+            _, source, target = edges.popleft()
+            targets = self.out_edges[source]
+            pair = targets[target]
+            del pair[0]
+            if pair:
+                continue
+
+            del targets[target]
+            if not targets:
+                del self.out_edges[source]
+            sources = self.in_edges[target]
+            del sources[source]
+            if not sources:
+                del self.in_edges[target]
+
+    def _search(self, source, target, amount, transaction_id, closed_at, allowance):
+        """
+        Rings closed by source -> target, and the expansions spent finding them
+        """
+        # A ring has to leave target along some other edge
+        if not self.out_edges.get(target):
+            return [], 1
+
+        cutoff = closed_at - self.window
+        hops = self.max_length - 1
+        budget = allowance
+
+        # Reverse BFS: fewest hops from each nearby vertex to source
+        distance = {source: 0}
+        frontier = [source]
+        for depth in range(1, hops + 1):
+            following = []
+            for vertex in frontier:
+                for previous, pair in self.in_edges.get(vertex, {}).items():
+                    budget -= 1
+                    if previous not in distance and self._first_after(pair, cutoff, closed_at):
+                        distance[previous] = depth
+                        following.append(previous)
+            frontier = following
+            if not frontier or budget <= 0:
+                break
+
+        if distance.get(target, hops + 1) > hops:
+            return [], allowance - budget
+
+        # Forward DFS from target along time-ordered edges, entering only
+        # vertices that can still reach source within the hop limit
+        rings = []
+        path = [target]
+        on_path = {target, source}
+        path_edges = []
+        work = [iter(self.out_edges.get(target, {}).items())]
+        arrivals = [cutoff]
+
+        while work:
+            if budget <= 0 or len(rings) >= self.max_rings_per_transfer:
+                self.truncated_searches += budget <= 0
+                break
+
+            advanced = False
+            remaining = hops - len(path_edges) - 1
+            for vertex, pair in work[-1]:
+                budget -= 1
+                if vertex != source and (
+                        vertex in on_path or distance.get(vertex, hops + 1) > remaining):
+                    continue
+                edge = self._first_after(pair, arrivals[-1], closed_at)
+                if edge is None:
+                    continue
+
+                if vertex == source:
+                    rings.append(self._ring(
+                        path, path_edges + [edge], source, amount, transaction_id, closed_at
+                    ))
+                    continue
+
+                path.append(vertex)
+                on_path.add(vertex)
+                path_edges.append(edge)
+                arrivals.append(edge[0])
+                work.append(iter(self.out_edges.get(vertex, {}).items()))
+                advanced = True
+                break
+
+            if not advanced:
+                work.pop()
+                arrivals.pop()
+                if path_edges:
+                    path_edges.pop()
+                    on_path.discard(path.pop())
+
+        return rings, allowance - budget
+
+    @staticmethod
+    def _first_after(pair: list, earliest: float, latest: float):
+        """
+        Earliest transfer of a pair in [earliest, latest], or None
+        """
+        if pair[0][0] >= earliest:
+            edge = pair[0]
+        else:
+            position = bisect_left(pair, earliest, key=itemgetter(0))
+            if position == len(pair):
+                return None
+            edge = pair[position]
+        return edge if edge[0] <= latest else None
+
+    @staticmethod
+    def _ring(path, path_edges, source, amount, transaction_id, closed_at) -> Dict:
+        amounts = [edge[1] for edge in path_edges] + [amount]
+        return {
+            'accounts': list(path) + [source],
+            'transactions': [edge[2] for edge in path_edges] + [transaction_id],
+            'amounts': amounts,
+            'volume': sum(amounts),
+            'length': len(amounts),
+            'started_at': path_edges[0][0],
+            'closed_at': closed_at
+        }
+
+    def recent_alerts(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Flagged rings, newest first
+        """
+        with self._lock:
+            alerts = list(reversed(self.alerts))
+        return alerts if limit is None else alerts[:limit]
+
+    def stats(self) -> Dict:
+        return {
+            'window': self.window,
+            'max_length': self.max_length,
+            'edges_in_window': len(self.edges),
+            'accounts_in_window': len(self.out_edges.keys() | self.in_edges.keys()),
+            'transfers_seen': self.transfers_seen,
+            'rings_found': self.rings_found,
+            'truncated_searches': self.truncated_searches,
+            'unsearched_transfers': self.unsearched_transfers
+        }
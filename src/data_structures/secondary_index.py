@@ -0,0 +1,55 @@
+from src.data_structures.avl_tree import AVLTree
+from src.data_structures.hash_table import HashTable
+
+
+class SecondaryIndex:
+    """
+    Maps an attribute value to the objects carrying it, ordered by
+    primary key. Postings are AVL trees so each value can be listed in
+    key order and updated in O(log n).
+    """
+
+    def __init__(self, attribute, key_func=None):
+        self.attribute = attribute
+        self.key_func = key_func or (lambda obj: getattr(obj, attribute))
+        self.postings = HashTable()
+
+    def add(self, primary_key, obj):
+        value = self.key_func(obj)
+        tree = self.postings.get(value, None)
+        if tree is None:
+            tree = AVLTree()
+            self.postings.insert(value, tree)
+        tree.insert_key(primary_key, obj)
+
+    def remove(self, primary_key, value):
+        tree = self.postings.get(value, None)
+        if tree is None or not tree.delete_key(primary_key):
+            return False
+        if not len(tree):
+            self.postings.remove(value)
+        return True
+
+    def reindex(self, primary_key, obj, old_value):
+        """
+        Move obj to its current value's posting after an attribute change
+        """
+        if self.key_func(obj) == old_value:
+            return
+        self.remove(primary_key, old_value)
+        self.add(primary_key, obj)
+
+    def lookup(self, value):
+        tree = self.postings.get(value, None)
+        return tree.values() if tree else iter(())
+
+    def primary_keys(self, value):
+        tree = self.postings.get(value, None)
+        return tree.keys() if tree else iter(())
+
+    def count(self, value):
+        tree = self.postings.get(value, None)
+        return len(tree) if tree else 0
+
+    def distinct_values(self):
+        return self.postings.iter_keys()
@@ -0,0 +1,53 @@
+import threading
+from contextlib import contextmanager
+
+
+class StripedLock:
+    """
+    Fixed pool of locks shared by many keys.
+
+    Each key hashes to one stripe, so memory stays constant no matter how
+    many accounts exist while unrelated keys rarely contend. Multi-key
+    acquisition always takes stripes in ascending index order, which rules
+    out lock-order deadlocks between concurrent callers.
+    """
+
+    def __init__(self, stripes=1024):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __len__(self):
+        return len(self._locks)
+
+    def stripe(self, key):
+        return hash(key) % len(self._locks)
+
+    @contextmanager
+    def hold(self, *keys):
+        """
+        Hold the stripes of all keys for the duration of the block
+        """
+        stripes = sorted({self.stripe(key) for key in keys})
+        acquired = []
+        try:
+            for index in stripes:
+                self._locks[index].acquire()
+                acquired.append(index)
+            yield
+        finally:
+            for index in reversed(acquired):
+                self._locks[index].release()
+
+    @contextmanager
+    def hold_all(self):
+        """
+        Hold every stripe: a write barrier against all keyed writers
+        """
+        acquired = []
+        try:
+            for lock in self._locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
@@ -0,0 +1,195 @@
+import threading
+from bisect import bisect_right
+from datetime import datetime
+
+import numpy as np
+
+from src.core.id_generator import TRANSACTION_IDS
+from src.core.transaction import Transaction
+from src.data_structures.hash_table import HashTable
+
+
+class BatchRecord:
+    """
+    A settled batch kept as its columns; rows become Transaction objects
+    only when history is read. IDs are a reserved consecutive range, so a
+    row renders the same transaction_id every time it is read.
+    """
+
+    __slots__ = ('numbers', 'src', 'dst', 'amounts', 'first_id', 'timestamp', 'status')
+
+    def __init__(self, numbers, src, dst, amounts, status='COMPLETED'):
+        self.numbers = numbers
+        self.src = src
+        self.dst = dst
+        self.amounts = amounts
+        self.first_id = TRANSACTION_IDS.reserve(len(amounts))
+        self.timestamp = datetime.now()
+        self.status = status
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def transaction_ids(self) -> list:
+        return [
+            TRANSACTION_IDS.format(value)
+            for value in range(self.first_id, self.first_id + len(self.amounts))
+        ]
+
+    def transaction(self, row: int) -> Transaction:
+        return Transaction(
+            transaction_id=TRANSACTION_IDS.format(self.first_id + row),
+            from_account=self.numbers[self.src[row]],
+            to_account=self.numbers[self.dst[row]],
+            amount=float(self.amounts[row]),
+            timestamp=self.timestamp,
+            status=self.status
+        )
+
+
+class _AccountLog:
+    """
+    One account's history as chunks: a single Transaction, or a
+    (BatchRecord, rows) slice. ends[i] is the history length through
+    chunk i, so positions map to chunks by bisection.
+    """
+
+    __slots__ = ('chunks', 'ends')
+
+    def __init__(self):
+        self.chunks = []
+        self.ends = []
+
+    def add(self, chunk, size: int) -> None:
+        self.chunks.append(chunk)
+        self.ends.append((self.ends[-1] if self.ends else 0) + size)
+
+    def __len__(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+
+class TransactionHistory:
+    """
+    Append-only, per-account transaction log.
+
+    Every transaction is appended to the history of both its source and
+    destination account, so each account's history stays in time order.
+    Settled batches are recorded from their columns: each account gets a
+    single chunk referencing its rows of the batch instead of one
+    Transaction per row. Pages are served newest-first and cost
+    O(log chunks + page size) regardless of how long the history is. A
+    cursor is the history position where the next (older) page ends.
+    """
+
+    def __init__(self):
+        self.histories = HashTable()
+        self._lock = threading.Lock()
+
+    def append(self, transaction) -> None:
+        with self._lock:
+            self._append_locked(transaction)
+
+    def append_many(self, transactions) -> None:
+        with self._lock:
+            for transaction in transactions:
+                self._append_locked(transaction)
+
+    def _log(self, account_number) -> _AccountLog:
+        log = self.histories.get(account_number, None)
+        if log is None:
+            log = _AccountLog()
+            self.histories.insert(account_number, log)
+        return log
+
+    def _append_locked(self, transaction) -> None:
+        source = transaction.from_account
+        target = transaction.to_account
+
+        if source is not None:
+            self._log(source).add(transaction, 1)
+        if target is not None and target != source:
+            self._log(target).add(transaction, 1)
+
+    def append_batch(self, numbers, src, dst, amounts) -> BatchRecord:
+        """
+        Record settled transfers given as columns
+
+        Args:
+            numbers (Sequence[str]): Account numbers indexed by src/dst ids
+            src, dst (np.ndarray): Source and destination ids per row
+            amounts (np.ndarray): Amount per row
+
+        Returns:
+            BatchRecord: The stored batch
+        """
+        batch = BatchRecord(numbers, src, dst, amounts)
+        count = len(batch)
+        if not count:
+            return batch
+
+        # Rows touching each account, in row order, from one sort
+        rows = np.arange(count)
+        touched = np.concatenate([src, dst])
+        row_refs = np.concatenate([rows, rows])
+        order = np.lexsort((row_refs, touched))
+        touched = touched[order]
+        row_refs = row_refs[order]
+
+        bounds = np.flatnonzero(touched[1:] != touched[:-1]) + 1
+        starts = np.r_[0, bounds].tolist()
+        stops = np.r_[bounds, len(touched)].tolist()
+
+        with self._lock:
+            for account_id, start, stop in zip(touched[starts].tolist(), starts, stops):
+                self._log(numbers[account_id]).add((batch, row_refs[start:stop]), stop - start)
+        return batch
+
+    def count(self, account_number) -> int:
+        log = self.histories.get(account_number, None)
+        return len(log) if log is not None else 0
+
+    def page(self, account_number, limit=10, cursor=None):
+        """
+        One page of an account's history, newest first
+
+        Args:
+            account_number (str): Account to read
+            limit (int): Maximum number of transactions
+            cursor (Optional[int]): Cursor from the previous page, or None
+                for the most recent transactions
+
+        Returns:
+            tuple: (transactions, next_cursor); next_cursor is None once the
+            oldest transaction has been returned
+        """
+        log = self.histories.get(account_number, None)
+        if log is None or limit <= 0:
+            return [], None
+
+        with self._lock:
+            total = len(log)
+            end = total if cursor is None else min(cursor, total)
+            start = max(0, end - limit)
+
+            page = []
+            chunk_index = bisect_right(log.ends, end - 1)
+            position = end
+            while position > start:
+                chunk = log.chunks[chunk_index]
+                chunk_start = log.ends[chunk_index - 1] if chunk_index else 0
+                low = max(start, chunk_start)
+
+                if isinstance(chunk, tuple):
+                    batch, rows = chunk
+                    for row in rows[low - chunk_start:position - chunk_start][::-1].tolist():
+                        page.append(batch.transaction(row))
+                else:
+                    page.append(chunk)
+
+                position = low
+                chunk_index -= 1
+
+        return page, (start if start > 0 else None)
+
+    def latest(self, account_number, limit=10):
+        return self.page(account_number, limit)[0]
@@ -0,0 +1,142 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded key-value cache with per-entry expiry and LRU eviction.
+
+    Entries expire lazily: an expired entry is dropped when it is next
+    read, when it reaches the LRU end during eviction, or by an explicit
+    purge_expired(). Once maxsize entries are held, inserting another
+    evicts the least recently used one, so memory stays capped no matter
+    how many keys pass through. All operations are O(1) except purge.
+
+    on_evict(key, value) is called for every entry that leaves the cache
+    other than by an explicit pop() of a live entry; it runs after the
+    cache lock has been released, so it may safely call back into the
+    cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float = 300.0,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if maxsize <= 0:
+            raise ValueError('maxsize must be positive')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.clock = clock
+
+        # key -> (expires_at, value), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING, touch=False) is not _MISSING
+
+    def _notify(self, evicted: List[Tuple[Hashable, Any]]) -> None:
+        if self.on_evict is not None:
+            for key, value in evicted:
+                self.on_evict(key, value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Insert or replace an entry
+
+        Args:
+            key (Hashable): Entry key
+            value (Any): Entry value
+            ttl (Optional[float]): Lifetime in seconds (defaults to self.ttl)
+        """
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        evicted = []
+
+        with self._lock:
+            entries = self._entries
+            if key in entries:
+                entries.move_to_end(key)
+            entries[key] = (expires_at, value)
+
+            while len(entries) > self.maxsize:
+                old_key, (_, old_value) = entries.popitem(last=False)
+                evicted.append((old_key, old_value))
+
+        self._notify(evicted)
+
+    def get(self, key: Hashable, default: Any = None, touch: bool = True) -> Any:
+        """
+        Value for key, or default if missing or expired
+
+        Args:
+            key (Hashable): Entry key
+            default (Any): Returned when the key is absent
+            touch (bool): Mark the entry as most recently used
+        """
+        evicted = None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            if entry[0] <= self.clock():
+                del self._entries[key]
+                evicted = [(key, entry[1])]
+            elif touch:
+                self._entries.move_to_end(key)
+
+        if evicted is not None:
+            self._notify(evicted)
+            return default
+        return entry[1]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove an entry and return its value (default if missing or expired)
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return default
+        if entry[0] <= self.clock():
+            self._notify([(key, entry[1])])
+            return default
+        return entry[1]
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry
+
+        Returns:
+            int: Number of entries removed
+        """
+        now = self.clock()
+        with self._lock:
+            evicted = [
+                (key, value)
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at <= now
+            ]
+            for key, _ in evicted:
+                del self._entries[key]
+
+        self._notify(evicted)
+        return len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,172 @@
+import threading
+from typing import Dict, Hashable, List, Sequence
+
+from src.data_structures.hash_table import HashTable
+
+
+class UnionFind:
+    """
+    Disjoint sets over arbitrary hashable keys with per-set aggregates.
+
+    Keys are mapped to dense integer ids; parent/rank/size/volume live in
+    flat lists indexed by id. find() uses full path compression and
+    union() links by rank, so every operation is effectively constant
+    time. Each set also threads its members through a circular "next"
+    list that union() splices in O(1), so members() costs O(set size)
+    without any per-set containers.
+    """
+
+    def __init__(self):
+        self.ids = HashTable()
+        self.keys: List[Hashable] = []
+        self.parent: List[int] = []
+        self.rank: List[int] = []
+        self.size: List[int] = []
+        self.volume: List[float] = []
+        self.edges: List[int] = []
+        self.next: List[int] = []
+        self.set_count = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key) -> bool:
+        return self.ids.contains(key)
+
+    def _id(self, key) -> int:
+        """
+        Dense id of key, creating a singleton set for new keys
+        """
+        node = self.ids.get(key, None)
+        if node is None:
+            node = len(self.keys)
+            self.ids.insert(key, node)
+            self.keys.append(key)
+            self.parent.append(node)
+            self.rank.append(0)
+            self.size.append(1)
+            self.volume.append(0.0)
+            self.edges.append(0)
+            self.next.append(node)
+            self.set_count += 1
+        return node
+
+    def _find(self, node: int) -> int:
+        parent = self.parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+
+        # Point every node on the path straight at the root
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def add(self, key) -> None:
+        with self._lock:
+            self._id(key)
+
+    def find(self, key):
+        """
+        Representative key of key's set (key itself if unknown)
+        """
+        with self._lock:
+            node = self.ids.get(key, None)
+            return key if node is None else self.keys[self._find(node)]
+
+    def union(self, a, b, amount: float = 0.0) -> None:
+        """
+        Record an edge between a and b, merging their sets
+
+        Args:
+            a, b: Keys (added if new)
+            amount (float): Added to the merged set's volume
+        """
+        with self._lock:
+            self._union(self._id(a), self._id(b), amount)
+
+    def union_many(self, sources: Sequence, targets: Sequence, amounts: Sequence[float]) -> None:
+        """
+        union() for many edges; each distinct key is resolved to its id
+        once per call, so batches over few accounts skip most lookups
+        """
+        with self._lock:
+            nodes = {}
+            for key in (*sources, *targets):
+                if key not in nodes:
+                    nodes[key] = self._id(key)
+            for a, b, amount in zip(sources, targets, amounts):
+                self._union(nodes[a], nodes[b], amount)
+
+    def _union(self, a: int, b: int, amount: float) -> None:
+        root_a, root_b = self._find(a), self._find(b)
+
+        if root_a != root_b:
+            rank = self.rank
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
+            elif rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
+
+            self.parent[root_b] = root_a
+            self.size[root_a] += self.size[root_b]
+            self.volume[root_a] += self.volume[root_b]
+            self.edges[root_a] += self.edges[root_b]
+
+            # Splice the two circular member lists together
+            following = self.next
+            following[root_a], following[root_b] = following[root_b], following[root_a]
+            self.set_count -= 1
+
+        self.volume[root_a] += amount
+        self.edges[root_a] += 1
+
+    def connected(self, a, b) -> bool:
+        with self._lock:
+            node_a, node_b = self.ids.get(a, None), self.ids.get(b, None)
+            if node_a is None or node_b is None:
+                return a == b
+            return self._find(node_a) == self._find(node_b)
+
+    def component_size(self, key) -> int:
+        with self._lock:
+            node = self.ids.get(key, None)
+            return 1 if node is None else self.size[self._find(node)]
+
+    def component_volume(self, key) -> float:
+        with self._lock:
+            node = self.ids.get(key, None)
+            return 0.0 if node is None else self.volume[self._find(node)]
+
+    def members(self, key) -> List:
+        """
+        Every key in key's set
+        """
+        with self._lock:
+            start = self.ids.get(key, None)
+            if start is None:
+                return [key]
+
+            members, node = [], start
+            while True:
+                members.append(self.keys[node])
+                node = self.next[node]
+                if node == start:
+                    return members
+
+    def summary(self, key) -> Dict:
+        """
+        Aggregates of key's set
+        """
+        with self._lock:
+            node = self.ids.get(key, None)
+            if node is None:
+                return {'representative': key, 'size': 1, 'volume': 0.0, 'transactions': 0}
+            root = self._find(node)
+            return {
+                'representative': self.keys[root],
+                'size': self.size[root],
+                'volume': self.volume[root],
+                'transactions': self.edges[root]
+            }
@@ -0,0 +1,218 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Mapping, Sequence
+
+
+class Rule(ABC):
+    """
+    One check on a field value; subclasses compile their state once
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+
+    @abstractmethod
+    def passes(self, value: str, record: Mapping) -> bool:
+        """
+        Whether value (of record) satisfies the rule
+        """
+
+    def failures(
+        self,
+        values: List[str],
+        columns: Mapping[str, List[str]],
+        indices: List[int]
+    ) -> List[int]:
+        """
+        Indices (among indices) whose value fails the rule
+        """
+        return [i for i in indices if not self.passes(values[i], None)]
+
+
+class Required(Rule):
+    def passes(self, value, record):
+        return bool(value)
+
+    def failures(self, values, columns, indices):
+        return [i for i in indices if not values[i]]
+
+
+class MinLength(Rule):
+    def __init__(self, length: int, message: str):
+        super().__init__(message)
+        self.length = length
+
+    def passes(self, value, record):
+        return len(value) >= self.length
+
+    def failures(self, values, columns, indices):
+        length = self.length
+        return [i for i in indices if len(values[i]) < length]
+
+
+class MaxLength(Rule):
+    def __init__(self, length: int, message: str):
+        super().__init__(message)
+        self.length = length
+
+    def passes(self, value, record):
+        return len(value) <= self.length
+
+    def failures(self, values, columns, indices):
+        length = self.length
+        return [i for i in indices if len(values[i]) > length]
+
+
+class Pattern(Rule):
+    """
+    Regex rule; the whole value must match, or with search=True the
+    pattern must occur somewhere in it
+    """
+
+    def __init__(self, pattern: str, message: str, search: bool = False):
+        super().__init__(message)
+        compiled = re.compile(pattern)
+        self.test = compiled.search if search else compiled.fullmatch
+
+    def passes(self, value, record):
+        return self.test(value) is not None
+
+    def failures(self, values, columns, indices):
+        test = self.test
+        return [i for i in indices if test(values[i]) is None]
+
+
+class OneOf(Rule):
+    def __init__(self, values: Sequence[str], message: str):
+        super().__init__(message)
+        self.values = frozenset(values)
+
+    def passes(self, value, record):
+        return value in self.values
+
+    def failures(self, values, columns, indices):
+        allowed = self.values
+        return [i for i in indices if values[i] not in allowed]
+
+
+class EqualsField(Rule):
+    def __init__(self, other: str, message: str):
+        super().__init__(message)
+        self.other = other
+
+    def passes(self, value, record):
+        return value == _text(record.get(self.other))
+
+    def failures(self, values, columns, indices):
+        other = columns.get(self.other) or [''] * len(values)
+        return [i for i in indices if values[i] != other[i]]
+
+
+class Field:
+    """
+    Named field with rules checked in order; the first failing rule is
+    the field's error. Optional fields skip their rules when empty.
+    """
+
+    def __init__(self, name: str, *rules: Rule, optional: bool = False):
+        self.name = name
+        self.rules = rules
+        self.optional = optional
+
+
+def _text(value) -> str:
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+class Schema:
+    """
+    Declarative record validation.
+
+    validate() checks one record. validate_batch() checks many at once
+    column by column: each field's values are gathered into a list once
+    and every rule (and so every compiled regex) runs over that column in
+    a single pass, restricted to the rows that haven't already failed the
+    field.
+    """
+
+    def __init__(self, *fields: Field):
+        self.fields = fields
+        self.field_names = tuple(field.name for field in fields)
+
+    def validate(self, record: Mapping) -> Dict[str, str]:
+        """
+        Validate a single record
+
+        Returns:
+            Dict[str, str]: Field name -> error message (empty if valid)
+        """
+        errors = {}
+        for field in self.fields:
+            value = _text(record.get(field.name))
+            if field.optional and not value:
+                continue
+            for rule in field.rules:
+                if not rule.passes(value, record):
+                    errors[field.name] = rule.message
+                    break
+        return errors
+
+    def validate_batch(self, records: Sequence[Mapping]) -> Dict[int, Dict[str, str]]:
+        """
+        Validate many records column-wise
+
+        Returns:
+            Dict[int, Dict[str, str]]: Position in records -> field errors,
+            for invalid records only
+        """
+        columns = self._columns(records, self._referenced_fields())
+        return self.validate_columns(columns, len(records))
+
+    def validate_columns(
+        self,
+        columns: Mapping[str, List[str]],
+        count: int
+    ) -> Dict[int, Dict[str, str]]:
+        """
+        Validate data that is already held as columns of equal length
+        """
+        errors: Dict[int, Dict[str, str]] = {}
+        blank = [''] * count
+
+        for field in self.fields:
+            values = columns.get(field.name, blank)
+            pending = list(range(count))
+            if field.optional:
+                pending = [i for i in pending if values[i]]
+
+            for rule in field.rules:
+                if not pending:
+                    break
+                failed = rule.failures(values, columns, pending)
+                if not failed:
+                    continue
+
+                for i in failed:
+                    errors.setdefault(i, {})[field.name] = rule.message
+                failed_set = set(failed)
+                pending = [i for i in pending if i not in failed_set]
+
+        return dict(sorted(errors.items()))
+
+    def _referenced_fields(self) -> List[str]:
+        names = list(self.field_names)
+        for field in self.fields:
+            for rule in field.rules:
+                if isinstance(rule, EqualsField) and rule.other not in names:
+                    names.append(rule.other)
+        return names
+
+    @staticmethod
+    def _columns(records: Sequence[Mapping], names: Sequence[str]) -> Dict[str, List[str]]:
+        return {
+            name: [_text(record.get(name)) for record in records]
+            for name in names
+        }
+
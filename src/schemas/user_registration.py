@@ -1,6 +1,60 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
-import re
+
+from src.schemas.schema_engine import (
+    EqualsField,
+    Field,
+    MinLength,
+    OneOf,
+    Pattern,
+    Required,
+    Schema
+)
+
+# Roles a registration or import may ask for; elevated roles are granted
+# to existing users, never taken from submitted data
+REGISTRATION_ROLES = ('customer',)
+
+USER_REGISTRATION_SCHEMA = Schema(
+    Field(
+        'username',
+        Required('Username is required'),
+        MinLength(3, 'Username must be at least 3 characters'),
+        Pattern(r'[a-zA-Z0-9_]+', 'Username can only contain letters, numbers, and underscores')
+    ),
+    Field(
+        'password',
+        Required('Password is required'),
+        MinLength(8, 'Password must be at least 8 characters'),
+        Pattern(r'[A-Z]', 'Password must contain at least one uppercase letter', search=True),
+        Pattern(r'[0-9]', 'Password must contain at least one number', search=True),
+        Pattern(
+            r'[!@#$%^&*(),.?":{}|<>]',
+            'Password must contain at least one special character',
+            search=True
+        )
+    ),
+    Field(
+        'confirm_password',
+        EqualsField('password', 'Passwords do not match')
+    ),
+    Field(
+        'email',
+        Required('Email is required'),
+        Pattern(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', 'Invalid email format')
+    ),
+    Field(
+        'phone_number',
+        Pattern(r'\+?1?\d{10,14}', 'Invalid phone number format'),
+        optional=True
+    ),
+    Field(
+        'role',
+        OneOf(REGISTRATION_ROLES, 'Invalid role'),
+        optional=True
+    )
+)
+
 
 @dataclass
 class UserRegistrationSchema:
@@ -22,41 +76,6 @@ class UserRegistrationSchema:
         Returns:
             dict: Validation errors or empty dict if valid
         """
-        errors = {}
-
-        # Username validation
-        if not self.username:
-            errors['username'] = 'Username is required'
-        elif len(self.username) < 3:
-            errors['username'] = 'Username must be at least 3 characters'
-        elif not re.match(r'^[a-zA-Z0-9_]+$', self.username):
-            errors['username'] = 'Username can only contain letters, numbers, and underscores'
-
-        # Password validation
-        if not self.password:
-            errors['password'] = 'Password is required'
-        elif len(self.password) < 8:
-            errors['password'] = 'Password must be at least 8 characters'
-        elif not re.search(r'[A-Z]', self.password):
-            errors['password'] = 'Password must contain at least one uppercase letter'
-        elif not re.search(r'[0-9]', self.password):
-            errors['password'] = 'Password must contain at least one number'
-        elif not re.search(r'[!@#$%^&*(),.?":{}|<>]', self.password):
-            errors['password'] = 'Password must contain at least one special character'
-
-        # Password confirmation
-        if self.password != self.confirm_password:
-            errors['confirm_password'] = 'Passwords do not match'
-
-        # Email validation
-        if not self.email:
-            errors['email'] = 'Email is required'
-        elif not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', self.email):
-            errors['email'] = 'Invalid email format'
-
-        # Optional phone number validation
-        if self.phone_number:
-            if not re.match(r'^\+?1?\d{10,14}$', self.phone_number):
-                errors['phone_number'] = 'Invalid phone number format'
-
-        return errors
\ No newline at end of file
+        return USER_REGISTRATION_SCHEMA.validate(
+            {field.name: getattr(self, field.name) for field in fields(self)}
+        )
@@ -1,18 +1,76 @@
+from itertools import islice
 from typing import List, Optional
 from src.core.account import Account
 from src.data_structures.avl_tree import AVLTree
 from src.data_structures.hash_table import HashTable
-from src.algorithms.search_algorithms import SearchAlgorithms
+from src.data_structures.secondary_index import SecondaryIndex
+from src.data_structures.ngram_index import NGramIndex
+from src.data_structures.striped_lock import StripedLock
+from src.data_structures.account_store import (
+    ColumnarAccountStore, interest_cents, parse_amount, to_cents
+)
+from src.storage.records import account_to_record
 from src.algorithms.sort_algorithms import SortAlgorithms
 
 class AccountService:
-    def __init__(self):
+    MATCH_MODES = ('exact', 'prefix', 'substring')
+
+    def __init__(self, journal=None, columnar=False):
+        # Optional write-ahead log receiving every mutation
+        self.journal = journal
+
+        # Optional struct-of-arrays storage; accounts become row views
+        self.account_store = ColumnarAccountStore() if columnar else None
+
+        # Per-account lock striping guarding balance changes
+        self.account_locks = StripedLock()
+
         # Use AVL Tree for efficient account storage and retrieval
         self.account_tree = AVLTree()
         
         # Use Hash Table for fast account lookups
         self.account_cache = HashTable()
 
+        # Secondary indexes on Account fields, kept in sync on create/close
+        self.indexes = {}
+        for attribute in ('customer_id', 'account_type', 'is_active'):
+            self.add_index(attribute)
+
+        # N-gram indexes answering substring/prefix search on high-cardinality
+        # fields; low-cardinality ones are served by their secondary index
+        self.search_indexes = {}
+        for attribute in ('account_number', 'customer_id'):
+            self.add_search_field(attribute)
+
+    def add_index(self, attribute: str, key_func=None) -> SecondaryIndex:
+        """
+        Declare a secondary index on an Account field and backfill it
+        """
+        index = SecondaryIndex(attribute, key_func)
+        for account_number, account in self.account_tree.items():
+            index.add(account_number, account)
+
+        self.indexes[attribute] = index
+        return index
+
+    def add_search_field(self, name: str, key_func=None) -> NGramIndex:
+        """
+        Make a field (or derived value, e.g. a customer name) searchable
+        """
+        key_func = key_func or (lambda account: getattr(account, name))
+        search_index = NGramIndex(key_func=key_func)
+        for account_number, account in self.account_tree.items():
+            search_index.add(account_number, key_func(account))
+
+        self.search_indexes[name] = search_index
+        return search_index
+
+    def find_by_index(self, attribute: str, value) -> List[Account]:
+        """
+        Accounts whose indexed attribute equals value, by account number
+        """
+        return list(self.indexes[attribute].lookup(value))
+
     def create_account(
         self, 
         customer_id: str, 
@@ -22,28 +80,182 @@ class AccountService:
         """
         Create a new bank account using AVL Tree and Hash Table
         """
+        initial_balance = self._amount(initial_balance)
+
         # Create account
-        new_account = Account(
-            customer_id=customer_id,
-            account_type=account_type,
-            balance=initial_balance
-        )
+        if self.account_store is not None:
+            new_account = self.account_store.create(
+                customer_id=customer_id,
+                account_type=account_type,
+                balance=initial_balance
+            )
+        else:
+            new_account = Account(
+                customer_id=customer_id,
+                account_type=account_type,
+                balance=initial_balance
+            )
+
+        # Under the account's stripe so snapshots see it with its record
+        with self.account_locks.hold(new_account.account_number):
+            self.restore_account(new_account)
+
+            if self.journal:
+                self.journal.append(
+                    'create_account', account_to_record(new_account)
+                )
+
+        return new_account
+
+    def restore_account(self, account: Account) -> None:
+        """
+        Insert an existing account into every store and index (no logging)
+        """
+        if self.account_store is not None and isinstance(account, Account):
+            account = self.account_store.create(
+                account_number=account.account_number,
+                customer_id=account.customer_id,
+                account_type=account.account_type,
+                balance=account.balance,
+                created_at=account.created_at,
+                is_active=account.is_active,
+                overdraft_limit=account.overdraft_limit
+            )
 
         # Insert into AVL Tree (key: account number)
-        self.account_tree.insert_key(new_account.account_number, new_account)
+        self.account_tree.insert_key(account.account_number, account)
         
         # Cache in Hash Table
-        self.account_cache.insert(new_account.account_number, new_account)
+        self.account_cache.insert(account.account_number, account)
 
-        return new_account
+        for index in self.indexes.values():
+            index.add(account.account_number, account)
+
+        for search_index in self.search_indexes.values():
+            search_index.add(
+                account.account_number, search_index.key_func(account)
+            )
+
+    @staticmethod
+    def _amount(amount) -> float:
+        # Parsed to the cent as a Decimal; the float of a two-decimal
+        # Decimal converts back to the same cents exactly
+        return float(parse_amount(amount))
+
+    def deposit(self, account_number: str, amount: float) -> bool:
+        """
+        Deposit into an account and log the resulting balance
+        """
+        amount = self._amount(amount)
+        account = self.find_account(account_number)
+        if not account:
+            return False
+
+        with self.account_locks.hold(account_number):
+            if not account.deposit(amount):
+                return False
+
+            if self.journal:
+                self.journal.append('deposit', {
+                    'account_number': account_number,
+                    'amount': amount,
+                    'balance': account.balance
+                })
+        return True
+
+    def withdraw(self, account_number: str, amount: float) -> bool:
+        """
+        Withdraw from an account and log the resulting balance
+        """
+        amount = self._amount(amount)
+        account = self.find_account(account_number)
+        if not account:
+            return False
+
+        with self.account_locks.hold(account_number):
+            if not account.withdraw(amount):
+                return False
+
+            if self.journal:
+                self.journal.append('withdraw', {
+                    'account_number': account_number,
+                    'amount': amount,
+                    'balance': account.balance
+                })
+        return True
+
+    def apply_interest(self, rate: float, account_type: Optional[str] = None) -> float:
+        """
+        Credit interest to every active account with a positive balance
+
+        Runs behind a write barrier on all account locks and is logged as
+        one record holding every credited account's resulting balance, so
+        replay sets those balances instead of paying the interest again.
+
+        Returns:
+            float: Total interest paid
+        """
+        with self.account_locks.hold_all():
+            if self.account_store is not None:
+                paid, credited = self.account_store.apply_interest(
+                    rate, account_type, collect_balances=bool(self.journal)
+                )
+            else:
+                eligible = [
+                    account for account in self.account_tree.values()
+                    if account.is_active and account.balance > 0
+                    and account_type in (None, account.account_type)
+                ]
+                balances = [to_cents(account.balance) for account in eligible]
+                interest = interest_cents(balances, rate).tolist()
+                credited = {}
+                for account, cents, earned in zip(eligible, balances, interest):
+                    account.balance = (cents + earned) / 100
+                    credited[account.account_number] = account.balance
+                paid = sum(interest) / 100
+
+            if self.journal:
+                self.journal.append('apply_interest', {
+                    'rate': rate,
+                    'account_type': account_type,
+                    'paid': paid,
+                    'balances': credited
+                })
+        return paid
+
+    def close_account(self, account_number: str) -> bool:
+        """
+        Deactivate an account and update the indexes that depend on it
+        """
+        account = self.find_account(account_number)
+        if not account or not account.is_active:
+            return False
+
+        with self.account_locks.hold(account_number):
+            old_values = {
+                attribute: index.key_func(account)
+                for attribute, index in self.indexes.items()
+            }
+            account.is_active = False
+
+            for attribute, index in self.indexes.items():
+                index.reindex(account_number, account, old_values[attribute])
+
+            if self.journal:
+                self.journal.append('close_account', {
+                    'account_number': account_number
+                })
+
+        return True
 
     def find_account(self, account_number: str) -> Optional[Account]:
         """
         Find account using multiple search algorithms
         """
-        # First, check hash table for O(1) lookup
-        if self.account_cache.contains(account_number):
-            return self.account_cache.get(account_number)
+        # First, check hash table for O(1) single-probe lookup
+        account = self.account_cache.get(account_number, None)
+        if account is not None:
+            return account
 
         # Fallback to AVL Tree search
         avl_result = self.account_tree.find(account_number)
@@ -56,80 +268,77 @@ class AccountService:
         """
         Retrieve and sort customer accounts
         """
-        # Collect all accounts for the customer
-        customer_accounts = []
-        
-        # Traverse AVL Tree to find accounts
-        def collect_accounts(node):
-            if not node:
-                return
-            
-            if node.value.customer_id == customer_id:
-                customer_accounts.append(node.value)
-            
-            collect_accounts(node.left)
-            collect_accounts(node.right)
-
-        collect_accounts(self.account_tree.root)
-
-        # Sort accounts using merge sort
-        return SortAlgorithms.merge_sort(
+        # O(accounts per customer) via the customer_id index
+        customer_accounts = self.find_by_index('customer_id', customer_id)
+
+        # Sort accounts by balance (NumPy argsort for the numeric column)
+        return SortAlgorithms.sort_by(
             customer_accounts, 
             key=lambda x: x.balance
         )
 
+    # Frontend pages key accounts by the logged-in username
+    get_user_accounts = get_customer_accounts
+
     def search_accounts(
         self, 
         search_term: str, 
-        search_type: str = 'account_number'
+        search_type: str = 'account_number',
+        limit: Optional[int] = None,
+        match: str = 'exact'
     ) -> List[Account]:
         """
-        Advanced account search using multiple algorithms
+        Account search by field
+
+        Args:
+            search_term (str): Value to look for
+            search_type (str): Account field to search
+            limit (Optional[int]): Maximum number of results
+            match (str): 'exact' (default), or 'prefix' / 'substring' for a
+                ranked case-insensitive search
+
+        Returns:
+            List[Account]: Matching accounts
         """
-        all_accounts = []
-        
-        # Collect all accounts from AVL Tree
-        def collect_all_accounts(node):
-            if not node:
-                return
-            
-            all_accounts.append(node.value)
-            collect_all_accounts(node.left)
-            collect_all_accounts(node.right)
-
-        collect_all_accounts(self.account_tree.root)
-
-        # Sort accounts for binary search
-        sorted_accounts = SortAlgorithms.merge_sort(
-            all_accounts, 
-            key=lambda x: getattr(x, search_type)
-        )
+        if match not in self.MATCH_MODES:
+            raise ValueError(f'Unknown match mode: {match}')
 
-        # Perform different searches based on type
-        if search_type == 'account_number':
-            # Binary search for account number
-            binary_result = SearchAlgorithms.binary_search(
-                [a.account_number for a in sorted_accounts], 
-                search_term
-            )
-            
-            # Fallback to linear search
-            linear_result = SearchAlgorithms.linear_search(
-                [a.account_number for a in all_accounts], 
-                search_term
+        if match == 'exact':
+            if search_type == 'account_number':
+                account = self.find_account(search_term)
+                return [account] if account is not None else []
+            if search_type in self.indexes:
+                return list(islice(self.indexes[search_type].lookup(search_term), limit))
+            matches = self.account_tree.scan(
+                lambda account: getattr(account, search_type) == search_term
             )
+            return list(islice(matches, limit))
+
+        prefix = match == 'prefix'
+        search_index = self.search_indexes.get(search_type)
+        if search_index is not None:
+            return [
+                self.account_cache.get(account_number)
+                for account_number in search_index.search(
+                    search_term, limit=limit, prefix=prefix
+                )
+            ]
 
-            # Combine results
-            results = []
-            if binary_result is not None:
-                results.append(sorted_accounts[binary_result])
-            if linear_result is not None:
-                results.append(all_accounts[linear_result])
+        term = search_term.lower()
 
-            return results
+        def matches_term(value):
+            value = str(value).lower()
+            return value.startswith(term) if prefix else term in value
 
-        # Fallback to linear search for other attributes
-        return [
-            account for account in all_accounts 
-            if search_term.lower() in str(getattr(account, search_type)).lower()
-        ]
\ No newline at end of file
+        # Low-cardinality indexed fields: match the few distinct values
+        index = self.indexes.get(search_type)
+        if index is not None:
+            values = [value for value in index.distinct_values() if matches_term(value)]
+            matches = (account for value in values for account in index.lookup(value))
+            return list(islice(matches, limit))
+
+        # Unindexed attributes fall back to a linear scan
+        matches = self.account_tree.scan(
+            lambda account: matches_term(getattr(account, search_type))
+        )
+        return list(islice(matches, limit))
\ No newline at end of file
@@ -1,34 +1,104 @@
 import secrets
-import hashlib
-import hmac
-from typing import Optional
+import threading
+from typing import Collection, List, Optional
 from src.core.user import User
+from src.algorithms.encryption_utils import PasswordHasher
 from src.data_structures.avl_tree import AVLTree
+from src.data_structures.bloom_filter import ScalableBloomFilter
 from src.data_structures.hash_table import HashTable
+from src.data_structures.query_planner import QueryPlanner
+from src.data_structures.rate_limiter import TokenBucketLimiter
+from src.data_structures.ttl_cache import TTLCache
 from src.algorithms.search_algorithms import SearchAlgorithms
+from src.storage.records import user_to_record
+
+# Login limiter key shared by attempts that carry no client id
+ANONYMOUS_CLIENT = '<anonymous>'
+
+def login_client_id(
+    remote_address: Optional[str],
+    forwarded_for: Optional[str] = None,
+    trusted_proxies: Collection[str] = ()
+) -> str:
+    """
+    Login limiter key for a request
+
+    X-Forwarded-For is client-supplied, so it is only read when the
+    connection itself comes from a trusted proxy; the client is then the
+    nearest hop that is not one of those proxies. Requests without a known
+    address share ANONYMOUS_CLIENT.
+    """
+    address = remote_address
+    if address in trusted_proxies and forwarded_for:
+        for hop in reversed(forwarded_for.split(',')):
+            hop = hop.strip()
+            if not hop:
+                continue
+            address = hop
+            if hop not in trusted_proxies:
+                break
+    return address or ANONYMOUS_CLIENT
 
 class AuthenticationService:
-    def __init__(self):
+    def __init__(
+        self,
+        journal=None,
+        password_hasher: Optional[PasswordHasher] = None,
+        session_ttl: float = 1800.0,
+        max_sessions: int = 100000,
+        login_throttling: bool = True
+    ):
+        # Optional write-ahead log receiving every mutation
+        self.journal = journal
+
+        # Password KDF (inline by default, or on a shared process pool)
+        self.password_hasher = password_hasher or PasswordHasher()
+
         # User storage data structures
         self.user_cache = HashTable()  # Fast O(1) lookup
         self.user_tree = AVLTree()     # Efficient search and management
 
+        # Every stored username; a negative answer skips both stores
+        self.username_filter = ScalableBloomFilter()
+
+        # Indexed attribute queries over users, keyed by user_id
+        self.user_query = QueryPlanner()
+        self.user_query.add_index('role')
+        self.user_query.add_index('is_active')
+        self.user_query.add_index('email_domain', lambda user: user.email.rpartition('@')[2])
+        self.user_query.add_index('created_month', lambda user: (user.created_at or '')[:7])
+
+        # Issued session tokens (token -> username), expiring and LRU-capped;
+        # user_sessions lets all of a user's tokens be revoked at once
+        self.sessions = TTLCache(
+            maxsize=max_sessions,
+            ttl=session_ttl,
+            on_evict=self._forget_session
+        )
+        self.user_sessions = HashTable()
+        self._session_lock = threading.Lock()
+
+        # Login attempt budgets: a short burst per username, a larger one
+        # per client; either limiter may be replaced or set to None
+        self.user_login_limiter = None
+        self.client_login_limiter = None
+        if login_throttling:
+            self.user_login_limiter = TokenBucketLimiter(rate=1 / 12, capacity=5)
+            self.client_login_limiter = TokenBucketLimiter(rate=1.0, capacity=20)
+        self.login_counters = {'served': 0, 'throttled': 0}
+        self._counter_lock = threading.Lock()
+
     def hash_password(self, password: str, salt: str) -> str:
         """
-        Secure password hashing using HMAC
+        Secure password hashing using the configured KDF
         """
-        return hmac.new(
-            salt.encode(), 
-            password.encode(), 
-            hashlib.sha256
-        ).hexdigest()
+        return self.password_hasher.hash(password, salt)
 
     def verify_password(self, input_password: str, stored_hash: str, salt: str) -> bool:
         """
-        Constant-time password verification
+        Constant-time password verification (legacy HMAC hashes included)
         """
-        computed_hash = self.hash_password(input_password, salt)
-        return hmac.compare_digest(computed_hash, stored_hash)
+        return self.password_hasher.verify(input_password, stored_hash, salt)
 
     def register_user(
         self, 
@@ -59,105 +129,258 @@ class AuthenticationService:
             role=role
         )
 
-        # Store in AVL Tree and Hash Table
-        self.user_tree.insert_key(username, new_user)
-        self.user_cache.insert(username, new_user)
+        self.restore_user(new_user)
+
+        if self.journal:
+            self.journal.append('register_user', user_to_record(new_user))
 
         return new_user
 
-    def authenticate(self, username: str, password: str) -> Optional[User]:
+    def restore_user(self, user: User) -> None:
+        """
+        Insert an existing user into the stores (no logging)
+        """
+        # Store in AVL Tree and Hash Table
+        self.user_tree.update_key(user.username, user)
+        self.user_cache.insert(user.username, user)
+        self.username_filter.add(user.username)
+        self.user_query.add(user.user_id, user)
+
+    def add_users(self, users: List[User], update_tree: bool = True) -> None:
+        """
+        Bulk-insert users whose passwords are already hashed, logging each
+
+        Args:
+            users (List[User]): Users to add
+            update_tree (bool): Also load user_tree and the query indexes
+                now; bulk loaders that add many batches can pass False and
+                call load_user_trees() once at the end
+        """
+        if update_tree:
+            self.load_user_trees(users)
+        self.user_cache.update([(user.username, user) for user in users])
+        self.username_filter.update(user.username for user in users)
+
+        if self.journal and users:
+            # One durability wait for the whole batch
+            for user in users:
+                lsn = self.journal.append('register_user', user_to_record(user), wait=False)
+            self.journal.wait_durable(lsn)
+
+    def load_user_trees(self, users: List[User]) -> None:
+        """
+        Bulk-load users into the ordered tree and query indexes
+        """
+        self.user_tree.bulk_update((user.username, user) for user in users)
+        self.user_query.add_many((user.user_id, user) for user in users)
+
+    def authenticate(
+        self,
+        username: str,
+        password: str,
+        client_id: Optional[str] = None
+    ) -> Optional[User]:
         """
         Multi-strategy user authentication
         """
-        # Check cache first
-        if self.user_cache.contains(username):
-            user = self.user_cache.get(username)
-        else:
-            # Fallback to tree search
-            user = self.find_user(username)
+        # Reject over-budget attempts before spending any KDF work
+        if not self._allow_login(username, client_id):
+            return None
+
+        # Cache first, falling back to tree search
+        user = self.find_user(username)
 
         # Verify password
         if user and self.verify_password(password, user.password_hash, user.salt):
             # Update last login
             from datetime import datetime
             user.last_login = datetime.now().isoformat()
+
+            # Upgrade hashes made with legacy or outdated cost settings
+            if self.password_hasher.needs_rehash(user.password_hash):
+                self._set_password(user, password)
+
             return user
 
         return None
 
+    def _allow_login(self, username: str, client_id: Optional[str]) -> bool:
+        # Callers that can't identify the client share one budget
+        if client_id is None:
+            client_id = ANONYMOUS_CLIENT
+
+        allowed = (
+            (self.client_login_limiter is None
+             or self.client_login_limiter.allow(client_id))
+            and (self.user_login_limiter is None
+                 or self.user_login_limiter.allow(username))
+        )
+
+        with self._counter_lock:
+            self.login_counters['served' if allowed else 'throttled'] += 1
+        return allowed
+
+    def login_stats(self) -> dict:
+        """
+        Counts of served and throttled login attempts
+        """
+        with self._counter_lock:
+            return dict(self.login_counters)
+
     def find_user(self, username: str) -> Optional[User]:
         """
         Find user using multiple search strategies
         """
+        # Definitely unknown usernames never touch the stores
+        if not self.username_filter.might_contain(username):
+            return None
+
         # Hash Table lookup
-        if self.user_cache.contains(username):
-            return self.user_cache.get(username)
+        user = self.user_cache.get(username, None)
+        if user is not None:
+            return user
 
         # AVL Tree search
         user_node = self.user_tree.find(username)
-        return user_node.value if user_node else None
+        if user_node is None:
+            self.username_filter.record_false_positive()
+            return None
+        return user_node.value
 
     def change_password(
         self, 
         username: str, 
         old_password: str, 
-        new_password: str
+        new_password: str,
+        client_id: Optional[str] = None
     ) -> bool:
         """
         Secure password change process
         """
         # Authenticate current user
-        user = self.authenticate(username, old_password)
+        user = self.authenticate(username, old_password, client_id)
         
         if not user:
             return False
 
+        self._set_password(user, new_password)
+
+        # Sessions opened with the old password no longer count
+        self.revoke_user_sessions(username)
+        return True
+
+    def _set_password(self, user: User, password: str) -> None:
+        """
+        Store a fresh salt and hash for the user and log the change
+        """
         # Generate new salt
         new_salt = secrets.token_hex(16)
 
         # Hash new password
-        new_password_hash = self.hash_password(new_password, new_salt)
+        new_password_hash = self.hash_password(password, new_salt)
 
         # Update user credentials
         user.password_hash = new_password_hash
         user.salt = new_salt
 
         # Update in data structures
-        self.user_tree.update_key(username, user)
-        self.user_cache.insert(username, user)
+        self.user_tree.update_key(user.username, user)
+        self.user_cache.insert(user.username, user)
 
-        return True
+        if self.journal:
+            self.journal.append('change_password', {
+                'username': user.username,
+                'password_hash': new_password_hash,
+                'salt': new_salt
+            })
 
-    def list_users_by_role(self, role: str) -> list:
+    def issue_session(self, user: User) -> str:
         """
-        List users by role using tree traversal
+        Issue a session token for an authenticated user
+        """
+        token = secrets.token_urlsafe(32)
+        with self._session_lock:
+            self.user_sessions.setdefault(user.username, set()).add(token)
+        self.sessions.set(token, user.username)
+        return token
+
+    def validate_session(self, token: Optional[str]) -> Optional[User]:
         """
-        matching_users = []
+        User owning a live session token, without any password hashing
+        """
+        if not token:
+            return None
+
+        username = self.sessions.get(token)
+        if username is None:
+            return None
 
-        def collect_users(node):
-            if not node:
+        user = self.find_user(username)
+        if user is None or not user.is_active:
+            return None
+        return user
+
+    def revoke_session(self, token: str) -> bool:
+        """
+        End one session
+        """
+        username = self.sessions.pop(token)
+        self._forget_session(token, username)
+        return username is not None
+
+    def revoke_user_sessions(self, username: str) -> int:
+        """
+        End every session of a user
+
+        Returns:
+            int: Number of tokens revoked
+        """
+        with self._session_lock:
+            tokens = self.user_sessions.pop(username, None) or ()
+
+        for token in tokens:
+            self.sessions.pop(token)
+        return len(tokens)
+
+    def _forget_session(self, token: str, username: Optional[str]) -> None:
+        """
+        Drop an expired, evicted or revoked token from its user's set
+        """
+        if username is None:
+            return
+
+        with self._session_lock:
+            tokens = self.user_sessions.get(username, None)
+            if tokens is None:
                 return
-            
-            if node.value.role == role:
-                matching_users.append(node.value)
-            
-            collect_users(node.left)
-            collect_users(node.right)
+            tokens.discard(token)
+            if not tokens:
+                self.user_sessions.remove(username)
 
-        collect_users(self.user_tree.root)
-        return matching_users
+    def list_users_by_role(self, role: str) -> list:
+        """
+        List users by role using the role index
+        """
+        return self.user_query.query({'role': role})
 
     def two_factor_authentication(
         self, 
         username: str, 
-        password: str, 
-        additional_factor: str
+        password: Optional[str], 
+        additional_factor: str,
+        session_token: Optional[str] = None,
+        client_id: Optional[str] = None
     ) -> bool:
         """
         Two-factor authentication implementation
         """
-        # Standard authentication
-        user = self.authenticate(username, password)
+        # A live session for this user stands in for the password check
+        user = self.validate_session(session_token)
+        if user is None or user.username != username:
+            user = (
+                self.authenticate(username, password, client_id)
+                if password is not None else None
+            )
         
         if not user:
             return False
@@ -0,0 +1,274 @@
+import csv
+import json
+import os
+import secrets
+import time
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.algorithms.encryption_utils import PasswordHasher
+from src.core.user import User
+from src.schemas.user_registration import USER_REGISTRATION_SCHEMA
+from src.services.registration_service import RegistrationService
+
+REPORT_FIELDS = ('row', 'username', 'field', 'error')
+VERBATIM_FIELDS = frozenset(('password', 'confirm_password'))
+
+
+class ImportErrorReport:
+    """
+    Per-row import failures, streamed to a CSV file or kept in memory
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.rows: List[Dict] = []
+        self.failed_rows = 0
+        self._file = None
+        self._writer = None
+        if path:
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=REPORT_FIELDS)
+            self._writer.writeheader()
+
+    def add(self, row_number: int, username: str, errors: Dict[str, str]) -> None:
+        self.failed_rows += 1
+        for field, message in errors.items():
+            entry = {'row': row_number, 'username': username, 'field': field, 'error': message}
+            if self._writer is not None:
+                self._writer.writerow(entry)
+            else:
+                self.rows.append(entry)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class BulkImportService:
+    """
+    Streaming user import for partner-bank onboarding.
+
+    Rows are read lazily from CSV or JSON-lines files and handled in
+    fixed-size batches, so memory stays bounded by the batch size rather
+    than the file size. Each batch is validated, checked for duplicates,
+    hashed across a process pool and bulk-loaded into the authentication
+    and registration stores. Hashing of one batch overlaps with validation
+    of the next. The import hashes with the auth service's KDF settings
+    but always on a pool (hash_workers processes, default: the auth
+    hasher's pool size or one per CPU), even when logins hash inline.
+
+    Hash-table indexes are loaded batch by batch, so duplicate checks see
+    every earlier row; the ordered trees are merged once at the end, which
+    keeps tree maintenance linear in the import size.
+    """
+
+    FORMATS = ('csv', 'jsonl')
+
+    def __init__(
+        self,
+        registration_service: RegistrationService,
+        batch_size: int = 2000,
+        hash_workers: Optional[int] = None
+    ):
+        self.registration_service = registration_service
+        self.auth_service = registration_service.auth_service
+        self.batch_size = batch_size
+
+        login_hasher = self.auth_service.password_hasher
+        if hash_workers is None:
+            hash_workers = login_hasher.workers or os.cpu_count() or 1
+        self.password_hasher = PasswordHasher(
+            login_hasher.algorithm, login_hasher.parameters, workers=hash_workers
+        )
+
+    @staticmethod
+    def iter_rows(path: str, file_format: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+        """
+        Lazily yield (row_number, record) pairs from a CSV or JSONL file
+
+        Args:
+            path (str): Input file
+            file_format (Optional[str]): 'csv' or 'jsonl'; inferred from the
+                extension when omitted
+
+        Returns:
+            Iterator[Tuple[int, Dict]]: 1-based data row numbers and records
+        """
+        if file_format is None:
+            extension = os.path.splitext(path)[1].lower()
+            file_format = 'jsonl' if extension in ('.jsonl', '.ndjson') else 'csv'
+        if file_format not in BulkImportService.FORMATS:
+            raise ValueError(f'Unsupported import format: {file_format}')
+
+        with open(path, newline='', encoding='utf-8') as source:
+            if file_format == 'csv':
+                yield from enumerate(csv.DictReader(source), start=1)
+                return
+
+            for row_number, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                yield row_number, record if isinstance(record, dict) else {'__invalid__': line}
+
+    def import_file(
+        self,
+        path: str,
+        file_format: Optional[str] = None,
+        error_report_path: Optional[str] = None
+    ) -> Dict:
+        """
+        Import users from a file
+
+        Args:
+            path (str): CSV or JSONL file with username, password, email and
+                optionally confirm_password and role columns
+            file_format (Optional[str]): 'csv' or 'jsonl' (default: by extension)
+            error_report_path (Optional[str]): Write per-row errors to this CSV
+                instead of returning them
+
+        Returns:
+            Dict: Row counts, elapsed time and (without a report path) errors
+        """
+        return self.import_rows(self.iter_rows(path, file_format), error_report_path)
+
+    def import_rows(
+        self,
+        rows: Iterator[Tuple[int, Dict]],
+        error_report_path: Optional[str] = None
+    ) -> Dict:
+        """
+        Import users from (row_number, record) pairs
+        """
+        started = time.perf_counter()
+        report = ImportErrorReport(error_report_path)
+        total = 0
+        in_flight = None
+        loaded: List[User] = []
+
+        try:
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                total += len(batch)
+
+                # Validate this batch while the previous one is hashing
+                reserved = in_flight[1] if in_flight else ({}, {})
+                accepted = self._validate_batch(batch, reserved, report)
+
+                if in_flight is not None:
+                    loaded.extend(self._load(*in_flight))
+                in_flight = self._start_hashing(accepted) if accepted else None
+
+                if not batch:
+                    break
+        finally:
+            report.close()
+            self.password_hasher.close()
+            self.auth_service.load_user_trees(loaded)
+            self.registration_service.user_registry.bulk_update(
+                (user.user_id, user) for user in loaded
+            )
+
+        result = {
+            'rows': total,
+            'imported': len(loaded),
+            'failed': report.failed_rows,
+            'elapsed': time.perf_counter() - started
+        }
+        if error_report_path:
+            result['error_report'] = error_report_path
+        else:
+            result['errors'] = report.rows
+        return result
+
+    def _validate_batch(
+        self,
+        batch: List[Tuple[int, Dict]],
+        reserved: Tuple[Dict, Dict],
+        report: ImportErrorReport
+    ) -> List[Tuple[int, Dict]]:
+        """
+        Rows that pass validation and collide with no stored, in-flight or
+        earlier-in-batch username or email
+        """
+        reserved_usernames, reserved_emails = reserved
+        usernames, emails = {}, {}
+        accepted = []
+
+        # CSV puts surplus cells under a None key; JSON may hold numbers.
+        # Passwords are taken verbatim: whitespace in them is significant
+        records = []
+        for row_number, record in batch:
+            if '__invalid__' in record:
+                report.add(row_number, '', {'row': 'Malformed JSON record'})
+                continue
+            record = {
+                key: str(value) if key in VERBATIM_FIELDS else str(value).strip()
+                for key, value in record.items()
+                if key is not None and value is not None
+            }
+            record.setdefault('confirm_password', record.get('password'))
+            records.append((row_number, record))
+
+        invalid = USER_REGISTRATION_SCHEMA.validate_batch([record for _, record in records])
+
+        for position, (row_number, record) in enumerate(records):
+            username = record.get('username') or ''
+            email = record.get('email') or ''
+
+            errors = invalid.get(position)
+            if not errors:
+                errors = {}
+                if (username in usernames or username in reserved_usernames
+                        or self.auth_service.find_user(username)):
+                    errors['username'] = 'Username already exists'
+                if (email in emails or email in reserved_emails
+                        or self.registration_service._find_user_by_email(email)):
+                    errors['email'] = 'Email already registered'
+
+            if errors:
+                report.add(row_number, username, errors)
+                continue
+
+            usernames[username] = row_number
+            emails[email] = row_number
+            accepted.append((row_number, record))
+
+        return accepted
+
+    def _start_hashing(self, accepted: List[Tuple[int, Dict]]):
+        salts = [secrets.token_hex(16) for _ in accepted]
+        futures = self.password_hasher.submit_many(
+            [record['password'] for _, record in accepted], salts
+        )
+        reserved = (
+            {record['username']: row for row, record in accepted},
+            {record['email']: row for row, record in accepted}
+        )
+        return accepted, reserved, salts, futures
+
+    def _load(self, accepted, reserved, salts, futures) -> List[User]:
+        """
+        Wait for a batch's hashes and bulk-load its users
+        """
+        hashes = [encoded for future in futures for encoded in future.result()]
+
+        users = [
+            User(
+                username=record['username'],
+                password_hash=password_hash,
+                salt=salt,
+                email=record['email'],
+                role=record.get('role') or 'customer'
+            )
+            for (_, record), salt, password_hash in zip(accepted, salts, hashes)
+        ]
+
+        self.auth_service.add_users(users, update_tree=False)
+        self.registration_service.index_users(users, update_registry=False)
+        return users
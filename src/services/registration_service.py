@@ -1,36 +1,10 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from src.core.user import User
 from src.services.authentication_service import AuthenticationService
 from src.data_structures.avl_tree import AVLTree
+from src.data_structures.bloom_filter import ScalableBloomFilter
 from src.data_structures.hash_table import HashTable
-
-class UserRegistrationSchema:
-    @staticmethod
-    def validate(registration_data: Dict) -> Dict:
-        """
-        Validate user registration data
-        """
-        errors = {}
-
-        # Username validation
-        username = registration_data.get('username', '')
-        if not username or len(username) < 3:
-            errors['username'] = 'Username must be at least 3 characters'
-
-        # Password validation
-        password = registration_data.get('password', '')
-        confirm_password = registration_data.get('confirm_password', '')
-        if not password or len(password) < 8:
-            errors['password'] = 'Password must be at least 8 characters'
-        elif password != confirm_password:
-            errors['confirm_password'] = 'Passwords do not match'
-
-        # Email validation
-        email = registration_data.get('email', '')
-        if not email or '@' not in email:
-            errors['email'] = 'Invalid email address'
-
-        return errors
+from src.schemas.user_registration import USER_REGISTRATION_SCHEMA
 
 class RegistrationService:
     def __init__(self, auth_service: AuthenticationService):
@@ -39,13 +13,14 @@ class RegistrationService:
         # Additional data structures for user management
         self.user_registry = AVLTree()
         self.email_index = HashTable()
+        self.email_filter = ScalableBloomFilter()
 
     def register_user(self, registration_data: Dict) -> Dict:
         """
         User registration process
         """
         # Validate registration data
-        validation_errors = UserRegistrationSchema.validate(registration_data)
+        validation_errors = USER_REGISTRATION_SCHEMA.validate(registration_data)
         if validation_errors:
             return {
                 'success': False,
@@ -78,9 +53,7 @@ class RegistrationService:
         )
 
         if new_user:
-            # Additional indexing
-            self.user_registry.insert_key(new_user.user_id, new_user)
-            self.email_index.insert(email, new_user)
+            self.index_user(new_user)
 
             return {
                 'success': True,
@@ -93,36 +66,55 @@ class RegistrationService:
             'errors': {'registration': 'User registration failed'}
         }
 
+    def index_user(self, user: User) -> None:
+        """
+        Add a user to the registry and email index
+        """
+        self.user_registry.update_key(user.user_id, user)
+        self.email_index.insert(user.email, user)
+        self.email_filter.add(user.email)
+
+    def index_users(self, users: List[User], update_registry: bool = True) -> None:
+        """
+        Add many users to the registry and email index at once
+        """
+        if update_registry:
+            self.user_registry.bulk_update((user.user_id, user) for user in users)
+        self.email_index.update([(user.email, user) for user in users])
+        self.email_filter.update(user.email for user in users)
+
     def _find_user_by_email(self, email: str) -> Optional[User]:
         """
         Find user by email using email index
         """
-        return self.email_index.get(email) if self.email_index.contains(email) else None
+        if not self.email_filter.might_contain(email):
+            return None
+
+        user = self.email_index.get(email, None)
+        if user is None:
+            self.email_filter.record_false_positive()
+        return user
+
+    def uniqueness_filter_stats(self) -> Dict:
+        """
+        Size and false-positive rates of the username and email filters
+        """
+        return {
+            'username': self.auth_service.username_filter.stats(),
+            'email': self.email_filter.stats()
+        }
 
     def get_users_by_criteria(self, criteria: Dict) -> list:
         """
         Retrieve users based on various criteria
         """
-        matching_users = []
-
-        def search_users(node):
-            if not node:
-                return
-            
-            user = node.value
-            match = all(
-                str(getattr(user, key, '')).lower() == str(value).lower()
-                for key, value in criteria.items()
-            )
-            
-            if match:
-                matching_users.append(user)
-            
-            search_users(node.left)
-            search_users(node.right)
-
-        search_users(self.user_registry.root)
-        return matching_users
+        return self.auth_service.user_query.query(criteria)
+
+    def explain_users_by_criteria(self, criteria: Dict) -> str:
+        """
+        Query plan get_users_by_criteria would use for criteria
+        """
+        return self.auth_service.user_query.explain(criteria)
 
 # Example usage
 def main():
@@ -0,0 +1,122 @@
+import os
+import threading
+from typing import Optional
+
+from src.algorithms.encryption_utils import PasswordHasher
+from src.services.account_service import AccountService
+from src.services.authentication_service import AuthenticationService
+from src.services.registration_service import RegistrationService
+from src.services.transaction_service import TransactionService
+
+
+class ServiceContainer:
+    """
+    Process-wide owner of the banking services.
+
+    Streamlit re-executes page scripts on every interaction, but imported
+    modules live for the whole server process. Resolving services from one
+    container keeps a single set of stores, indexes and caches hot across
+    reruns and sessions instead of rebuilding empty ones each time.
+
+    Password hashing runs on hash_workers processes (default: one per CPU)
+    so the KDF neither holds the GIL nor stalls the page thread; 0 hashes
+    inline.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None, hash_workers: Optional[int] = None):
+        self.data_dir = data_dir
+        self.hash_workers = (os.cpu_count() or 1) if hash_workers is None else hash_workers
+        self.persistence = None
+        self._lock = threading.RLock()
+        self._ready = False
+
+        self._auth_service = None
+        self._registration_service = None
+        self._account_service = None
+        self._transaction_service = None
+
+    def _ensure_ready(self) -> None:
+        # Fast path once initialised; the lock is only taken on first use
+        if self._ready:
+            return
+
+        with self._lock:
+            if self._ready:
+                return
+
+            auth_service = AuthenticationService(
+                password_hasher=PasswordHasher(workers=self.hash_workers)
+            )
+            registration_service = RegistrationService(auth_service)
+            account_service = AccountService()
+            transaction_service = TransactionService(account_service)
+
+            if self.data_dir:
+                from src.storage.persistence_manager import PersistenceManager
+                self.persistence = PersistenceManager(self.data_dir)
+                self.persistence.attach(
+                    account_service, auth_service, registration_service
+                )
+                self.persistence.recover()
+
+            self._auth_service = auth_service
+            self._registration_service = registration_service
+            self._account_service = account_service
+            self._transaction_service = transaction_service
+            self._ready = True
+
+    def warm_up(self) -> 'ServiceContainer':
+        """
+        Build the services (and recover persisted state) ahead of traffic
+        """
+        self._ensure_ready()
+        return self
+
+    @property
+    def auth_service(self) -> AuthenticationService:
+        self._ensure_ready()
+        return self._auth_service
+
+    @property
+    def registration_service(self) -> RegistrationService:
+        self._ensure_ready()
+        return self._registration_service
+
+    @property
+    def account_service(self) -> AccountService:
+        self._ensure_ready()
+        return self._account_service
+
+    @property
+    def transaction_service(self) -> TransactionService:
+        self._ensure_ready()
+        return self._transaction_service
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._auth_service is not None:
+                self._auth_service.password_hasher.close()
+            if self.persistence is not None:
+                self.persistence.close()
+                self.persistence = None
+
+
+_container = None
+_container_lock = threading.Lock()
+
+
+def get_container() -> ServiceContainer:
+    """
+    The shared container for this process; BANKING_DATA_DIR enables
+    durable storage and BANKING_HASH_WORKERS sizes the hashing pool
+    """
+    global _container
+    if _container is None:
+        with _container_lock:
+            if _container is None:
+                workers = os.environ.get('BANKING_HASH_WORKERS')
+                _container = ServiceContainer(
+                    os.environ.get('BANKING_DATA_DIR'),
+                    hash_workers=int(workers) if workers else None
+                )
+    return _container
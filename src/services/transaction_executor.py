@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.core.transaction import Transaction
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyStats:
+    """
+    Count and a bounded window of recent latencies for one priority class
+    """
+
+    def __init__(self, window: int = 10000):
+        self.count = 0
+        self.failed = 0
+        self.samples = deque(maxlen=window)
+
+    def record(self, latency: float, succeeded: bool) -> None:
+        self.count += 1
+        if not succeeded:
+            self.failed += 1
+        self.samples.append(latency)
+
+    def summary(self) -> Dict:
+        samples = sorted(self.samples)
+        if not samples:
+            return {'count': self.count, 'failed': self.failed}
+
+        def percentile(fraction):
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000
+
+        return {
+            'count': self.count,
+            'failed': self.failed,
+            'mean_ms': sum(samples) / len(samples) * 1000,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': samples[-1] * 1000
+        }
+
+
+class TransactionExecutor:
+    """
+    Drains TransactionService.transaction_queue concurrently.
+
+    Workers always pop the highest-priority pending transaction, so
+    INTERNATIONAL and then high-value transfers keep going first under
+    load. Runs either as a pool of threads or as coroutines on an asyncio
+    event loop hosted in a background thread; the coroutines hand the
+    blocking dequeue and settlement calls to a thread pool through
+    run_in_executor, so the loop itself never blocks. A transaction whose
+    settlement raises is logged and counted as failed; the worker carries
+    on with the queue.
+    """
+
+    MODES = ('thread', 'asyncio')
+
+    def __init__(
+        self,
+        transaction_service,
+        workers: int = 4,
+        mode: str = 'thread',
+        high_value_threshold: float = 10000.0,
+        poll_interval: float = 0.05
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f'Unknown executor mode: {mode}')
+
+        self.transaction_service = transaction_service
+        self.workers = workers
+        self.mode = mode
+        self.high_value_threshold = high_value_threshold
+        self.poll_interval = poll_interval
+
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._drain = True
+        self._threads = []
+
+    def priority_class(self, transaction: Transaction) -> str:
+        if transaction.transaction_type == 'INTERNATIONAL':
+            return 'INTERNATIONAL'
+        if transaction.amount >= self.high_value_threshold:
+            return 'HIGH_VALUE'
+        return 'STANDARD'
+
+    def start(self) -> 'TransactionExecutor':
+        if self._threads:
+            raise RuntimeError('Executor already started')
+
+        self._stopping.clear()
+        if self.mode == 'thread':
+            self._threads = [
+                threading.Thread(
+                    target=self._thread_worker,
+                    name=f'transaction-worker-{i}',
+                    daemon=True
+                )
+                for i in range(self.workers)
+            ]
+        else:
+            self._threads = [
+                threading.Thread(
+                    target=self._run_event_loop,
+                    name='transaction-event-loop',
+                    daemon=True
+                )
+            ]
+
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def _process(self, transaction: Transaction, enqueued_at: Optional[float]) -> None:
+        try:
+            succeeded = self.transaction_service.execute_transaction(transaction)
+        except Exception:
+            logger.exception(
+                'Settling transaction %s failed', transaction.transaction_id
+            )
+            transaction.status = 'FAILED'
+            succeeded = False
+
+        if enqueued_at is not None:
+            latency = time.monotonic() - enqueued_at
+            priority_class = self.priority_class(transaction)
+            with self._stats_lock:
+                stats = self._stats.get(priority_class)
+                if stats is None:
+                    stats = self._stats[priority_class] = LatencyStats()
+                stats.record(latency, succeeded)
+
+    def _should_exit(self) -> bool:
+        if not self._stopping.is_set():
+            return False
+        return not self._drain or self.transaction_service.transaction_queue.is_empty()
+
+    def _thread_worker(self) -> None:
+        while not self._should_exit():
+            taken = self.transaction_service.take_timed_transaction(
+                timeout=self.poll_interval
+            )
+            if taken is not None:
+                self._process(*taken)
+
+    def _run_event_loop(self) -> None:
+        loop = asyncio.new_event_loop()
+        pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='transaction-io'
+        )
+
+        async def run_workers():
+            await asyncio.gather(*(
+                self._async_worker(loop, pool) for _ in range(self.workers)
+            ))
+
+        try:
+            loop.run_until_complete(run_workers())
+        finally:
+            pool.shutdown(wait=True)
+            loop.close()
+
+    async def _async_worker(self, loop, pool) -> None:
+        take = self.transaction_service.take_timed_transaction
+        while not self._should_exit():
+            # Both calls block (queue wait, account locks, log fsync), so
+            # they run on the pool while the loop serves other coroutines
+            taken = await loop.run_in_executor(pool, take, self.poll_interval)
+            if taken is not None:
+                await loop.run_in_executor(pool, self._process, *taken)
+
+    def shutdown(self, wait: bool = True, drain: bool = True,
+                 timeout: Optional[float] = None) -> None:
+        """
+        Stop the workers
+
+        Args:
+            wait (bool): Join the worker threads before returning
+            drain (bool): Finish every queued transaction before exiting
+            timeout (Optional[float]): Per-thread join timeout
+        """
+        self._drain = drain
+        self._stopping.set()
+
+        if wait:
+            for thread in self._threads:
+                thread.join(timeout)
+            self._threads = []
+
+    def stats(self) -> Dict:
+        """
+        Latency summary per priority class
+        """
+        with self._stats_lock:
+            return {name: stats.summary() for name, stats in self._stats.items()}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
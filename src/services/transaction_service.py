@@ -1,99 +1,575 @@
-from typing import List, Optional
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from src.core.transaction import Transaction
+from src.data_structures.account_store import amounts_to_cents, parse_amount, to_cents
 from src.data_structures.priority_queue import PriorityQueue
 from src.data_structures.graph import Graph
-from src.algorithms.sort_algorithms import SortAlgorithms
+from src.data_structures.ring_detector import RingDetector
+from src.data_structures.transaction_history import TransactionHistory
+from src.data_structures.union_find import UnionFind
 
 class TransactionService:
-    def __init__(self):
+    def __init__(
+        self,
+        account_service,
+        max_queue_depth=None,
+        compact_rebuild_edges: int = 10000,
+        compact_max_age: float = 60.0
+    ):
+        # Resolves accounts and owns their locks for settlement; required,
+        # since no transfer can settle without real balances behind it
+        if account_service is None:
+            raise ValueError('TransactionService requires an account service')
+        self.account_service = account_service
+
         # Priority Queue for managing transactions
         self.transaction_queue = PriorityQueue()
+
+        # Guards the queue; producers wait here when it is full
+        self.queue_condition = threading.Condition()
+        self.max_queue_depth = max_queue_depth
+        self.enqueue_times = {}
+        self._queue_listeners = []
         
         # Graph to track transaction networks
         self.transaction_graph = Graph()
 
+        # Connected account groups, updated with every graph edge
+        self.account_components = UnionFind()
+
+        # Round-tripping rings closed by recently settled transfers
+        self.ring_detector = RingDetector()
+
+        # Per-account append-only history of real transactions
+        self.transaction_history = TransactionHistory()
+
+        # CSR snapshot for fast reachability queries. It is rebuilt once
+        # compact_rebuild_edges edge changes or compact_max_age seconds
+        # have piled up since it was taken, not on every change
+        self.compact_graph = None
+        self.compact_graph_version = None
+        self.compact_graph_removals = 0
+        self.compact_graph_built_at = 0.0
+        self.compact_rebuild_edges = compact_rebuild_edges
+        self.compact_max_age = compact_max_age
+
     def process_transaction(
         self, 
         from_account: str, 
         to_account: str, 
-        amount: float
+        amount: float,
+        transaction_type: str = 'TRANSFER',
+        timeout: Optional[float] = None
     ) -> Optional[Transaction]:
         """
         Process transaction using Priority Queue and Graph
+
+        Blocks while the queue is at max_queue_depth; returns None if no
+        room frees up within timeout seconds.
         """
+        amount = self._amount(amount)
+
         # Create transaction
         transaction = Transaction.create_transaction(
-            from_account, to_account, amount
+            from_account, to_account, amount, transaction_type
         )
 
         # Calculate transaction priority
         priority = self._calculate_transaction_priority(transaction)
 
-        # Add to priority queue
-        self.transaction_queue.push(transaction, priority)
+        # Add to priority queue, applying backpressure when full
+        with self.queue_condition:
+            if not self.queue_condition.wait_for(self._has_capacity, timeout):
+                return None
+            self.transaction_queue.push(transaction, priority)
+            self.enqueue_times[transaction.transaction_id] = time.monotonic()
+            self.queue_condition.notify_all()
+        self._notify_queue_listeners()
 
-        # Add to transaction graph
+        # Add to transaction graph, components and account histories
         self.transaction_graph.add_edge(from_account, to_account, amount)
+        self.account_components.union(from_account, to_account, amount)
+        self.transaction_history.append(transaction)
 
         return transaction
 
-    def _calculate_transaction_priority(self, transaction: Transaction) -> float:
+    def _has_capacity(self) -> bool:
+        return (
+            self.max_queue_depth is None
+            or self.transaction_queue.size() < self.max_queue_depth
+        )
+
+    def add_queue_listener(self, callback) -> None:
         """
-        Calculate transaction priority based on amount and type
+        Register a callable invoked (without arguments) after enqueues
         """
-        base_priority = transaction.amount
-        
-        # Add priority based on transaction type
-        if transaction.transaction_type == 'INTERNATIONAL':
-            base_priority *= 1.5
-        
-        return base_priority
+        self._queue_listeners.append(callback)
+
+    def remove_queue_listener(self, callback) -> None:
+        self._queue_listeners.remove(callback)
+
+    def _notify_queue_listeners(self) -> None:
+        for callback in list(self._queue_listeners):
+            callback()
+
+    def take_transaction(self, timeout: Optional[float] = None) -> Optional[Transaction]:
+        """
+        Pop the highest-priority pending transaction
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for one (None blocks,
+                0 polls)
+
+        Returns:
+            Optional[Transaction]: Transaction, or None on timeout
+        """
+        taken = self.take_timed_transaction(timeout)
+        return taken[0] if taken else None
+
+    def take_timed_transaction(
+        self,
+        timeout: Optional[float] = None
+    ) -> Optional[Tuple[Transaction, Optional[float]]]:
+        """
+        Like take_transaction, also returning the monotonic time the
+        transaction was enqueued (its entry in enqueue_times is dropped)
+        """
+        with self.queue_condition:
+            if not self.queue_condition.wait_for(
+                lambda: not self.transaction_queue.is_empty(), timeout
+            ):
+                return None
+            transaction = self.transaction_queue.pop()
+            enqueued_at = self.enqueue_times.pop(transaction.transaction_id, None)
+            self.queue_condition.notify_all()
+            return transaction, enqueued_at
+
+    def transfer(
+        self,
+        from_account: str,
+        to_account: str,
+        amount: float
+    ) -> Transaction:
+        """
+        Move money between two accounts atomically; the amount is rounded
+        half-up to the cent
+
+        Returns:
+            Transaction: Marked COMPLETED or FAILED
+
+        Raises:
+            ValueError: If amount is not a finite number
+        """
+        amount = self._amount(amount)
+        transaction = Transaction.create_transaction(
+            from_account, to_account, amount
+        )
+
+        if self.execute_transaction(transaction):
+            self.transaction_graph.add_edge(from_account, to_account, amount)
+            self.account_components.union(from_account, to_account, amount)
+        self.transaction_history.append(transaction)
+
+        return transaction
+
+    def execute_transaction(self, transaction: Transaction) -> bool:
+        """
+        Settle a transaction: debit and credit under both accounts' lock
+        stripes, taken in a fixed order so concurrent transfers between
+        disjoint accounts run in parallel without deadlocking
+        """
+        from_number = transaction.from_account
+        to_number = transaction.to_account
+        amount = transaction.amount = self._amount(transaction.amount)
+
+        source = self.account_service.find_account(from_number)
+        target = self.account_service.find_account(to_number)
+        if (
+            amount <= 0
+            or from_number == to_number
+            or source is None or target is None
+        ):
+            transaction.status = 'FAILED'
+            return False
+
+        with self.account_service.account_locks.hold(from_number, to_number):
+            if not (source.is_active and target.is_active) or not source.withdraw(amount):
+                transaction.status = 'FAILED'
+                return False
+
+            target.deposit(amount)
+            transaction.complete_transaction()
+
+            journal = self.account_service.journal
+            if journal:
+                journal.append('transfer', {
+                    'transaction_id': transaction.transaction_id,
+                    'from_account': from_number,
+                    'to_account': to_number,
+                    'amount': amount,
+                    'from_balance': source.balance,
+                    'to_balance': target.balance
+                })
+
+        # Only money that actually moved can close a ring. Queued transfers
+        # settle out of creation order, so the detector stamps the edge
+        # with the settlement time itself
+        self.ring_detector.add_transfer(
+            from_number, to_number, amount, transaction.transaction_id
+        )
+        return True
+
+    @staticmethod
+    def _amount(amount) -> float:
+        # Rounded half-up to the cent, as AccountService does for deposits
+        return float(parse_amount(amount))
+
+    def process_batch(
+        self,
+        from_accounts: Sequence[str],
+        to_accounts: Sequence[str],
+        amounts: Sequence[float],
+        settle: bool = True
+    ) -> Dict:
+        """
+        Validate and apply a columnar batch of transfers in one call
+
+        Amounts are rounded half-up to the cent, and amount, account and
+        funds checks run as vectorised integer-cent array operations.
+        Funds are checked against each source's balance plus overdraft at
+        the start of the batch; rows are debited in input
+        order, and credits received within the batch only become available
+        once it has settled. With settle=False valid rows are queued as
+        pending transactions instead.
+
+        Returns:
+            Dict: 'success' (bool array), 'errors' (reason or None per
+            row), 'completed' and 'failed' counts
+        """
+        from_accounts = list(from_accounts)
+        to_accounts = list(to_accounts)
+        amount_array = np.asarray(amounts, dtype=np.float64)
+        rows = len(amount_array)
+        if not (len(from_accounts) == len(to_accounts) == rows):
+            raise ValueError('Batch columns must have the same length')
+
+        # Settle in whole cents; everything recorded sees the rounded amounts
+        cents = amounts_to_cents(amount_array)
+        amount_array = cents / 100
+
+        errors = np.full(rows, None, dtype=object)
+
+        # Intern account numbers to dense ids
+        ids = {}
+        src = np.fromiter(
+            (ids.setdefault(n, len(ids)) for n in from_accounts),
+            dtype=np.int64, count=rows
+        )
+        dst = np.fromiter(
+            (ids.setdefault(n, len(ids)) for n in to_accounts),
+            dtype=np.int64, count=rows
+        )
+        numbers = list(ids)
+
+        valid = np.isfinite(amount_array) & (cents > 0)
+        errors[~valid] = 'INVALID_AMOUNT'
+
+        same = valid & (src == dst)
+        errors[same] = 'SAME_ACCOUNT'
+        valid &= ~same
+
+        accounts = [self.account_service.find_account(n) for n in numbers]
+        known = np.fromiter(
+            (a is not None for a in accounts), dtype=bool, count=len(numbers)
+        )
+        active = np.fromiter(
+            (a is not None and a.is_active for a in accounts),
+            dtype=bool, count=len(numbers)
+        )
+
+        unknown = valid & ~(known[src] & known[dst])
+        errors[unknown] = 'UNKNOWN_ACCOUNT'
+        valid &= ~unknown
+
+        inactive = valid & ~(active[src] & active[dst])
+        errors[inactive] = 'INACTIVE_ACCOUNT'
+        valid &= ~inactive
+
+        if not settle:
+            return self._enqueue_batch(
+                from_accounts, to_accounts, amount_array, valid, errors
+            )
+
+        with self.account_service.account_locks.hold(*numbers):
+            success = self._settle_batch(
+                accounts, numbers, src, dst, cents, valid, errors
+            )
+
+        rows_ok = np.flatnonzero(success).tolist()
+        edge_sources = [from_accounts[i] for i in rows_ok]
+        edge_targets = [to_accounts[i] for i in rows_ok]
+        edge_amounts = amount_array[success].tolist()
+        self.transaction_graph.add_edges(edge_sources, edge_targets, edge_amounts)
+        self.account_components.union_many(edge_sources, edge_targets, edge_amounts)
+
+        # History keeps the batch columns; Transactions are built on read
+        settled = self.transaction_history.append_batch(
+            numbers, src[success], dst[success], amount_array[success]
+        )
+
+        # One ring-detection pass for the batch, under the detector's
+        # per-batch budget and stamped with the settlement time
+        self.ring_detector.add_batch(
+            edge_sources, edge_targets, edge_amounts, settled.transaction_ids()
+        )
+
+        completed = len(rows_ok)
+        return {
+            'success': success,
+            'errors': errors.tolist(),
+            'completed': completed,
+            'failed': rows - completed
+        }
+
+    def _settle_batch(self, accounts, numbers, src, dst, amounts, valid, errors):
+        """
+        Funds check and balance update for a batch, all in int64 cents
+        (caller holds the locks)
+        """
+        account_count = len(accounts)
+        balances = np.array(
+            [to_cents(a.balance) if a is not None else 0 for a in accounts],
+            dtype=np.int64
+        )
+        available = balances + np.array(
+            [to_cents(a.overdraft_limit) if a is not None else 0 for a in accounts],
+            dtype=np.int64
+        )
+
+        # Running debit per source account, in row order
+        candidate_rows = np.flatnonzero(valid)
+        order = candidate_rows[np.argsort(src[candidate_rows], kind='stable')]
+        sorted_src = src[order]
+        running = np.cumsum(amounts[order])
+        group_start = np.r_[True, sorted_src[1:] != sorted_src[:-1]]
+        offsets = np.where(group_start, running - amounts[order], 0)
+        running -= np.maximum.accumulate(offsets)
+
+        success = valid.copy()
+        covered = running <= available[sorted_src]
+        success[order[~covered]] = False
+
+        # Past an account's first uncovered row, later (smaller) debits may
+        # still fit: settle those accounts greedily row by row
+        short_accounts = np.unique(sorted_src[~covered])
+        if len(short_accounts):
+            remaining = dict(zip(short_accounts.tolist(), available[short_accounts].tolist()))
+            short_rows = candidate_rows[np.isin(src[candidate_rows], short_accounts)]
+            for row, account_id in zip(short_rows.tolist(), src[short_rows].tolist()):
+                amount = amounts[row]
+                if amount <= remaining[account_id]:
+                    remaining[account_id] -= amount
+                    success[row] = True
+                else:
+                    success[row] = False
+
+        errors[valid & ~success] = 'INSUFFICIENT_FUNDS'
+
+        debits = np.zeros(account_count, dtype=np.int64)
+        credits = np.zeros(account_count, dtype=np.int64)
+        np.add.at(debits, src[success], amounts[success])
+        np.add.at(credits, dst[success], amounts[success])
+        new_balances = (balances - debits + credits) / 100
+
+        touched = np.flatnonzero((debits != 0) | (credits != 0)).tolist()
+        for account_id in touched:
+            accounts[account_id].balance = float(new_balances[account_id])
+
+        journal = self.account_service.journal
+        if journal and touched:
+            journal.append('batch_transfer', {
+                'rows': int(success.sum()),
+                'balances': {
+                    numbers[account_id]: float(new_balances[account_id])
+                    for account_id in touched
+                }
+            })
+
+        return success
+
+    def _enqueue_batch(self, from_accounts, to_accounts, amounts, valid, errors):
+        """
+        Queue the valid rows of a batch as pending transactions
+        """
+        rows_ok = np.flatnonzero(valid).tolist()
+        transactions = [
+            Transaction.create_transaction(
+                from_accounts[i], to_accounts[i], float(amounts[i])
+            )
+            for i in rows_ok
+        ]
+        # Bulk enqueues are admitted whole and do not wait for capacity
+        with self.queue_condition:
+            self.transaction_queue.push_many(
+                transactions,
+                [self._calculate_transaction_priority(t) for t in transactions]
+            )
+            now = time.monotonic()
+            for t in transactions:
+                self.enqueue_times[t.transaction_id] = now
+            self.queue_condition.notify_all()
+        self._notify_queue_listeners()
+        edge_sources = [t.from_account for t in transactions]
+        edge_targets = [t.to_account for t in transactions]
+        edge_amounts = [t.amount for t in transactions]
+        self.transaction_graph.add_edges(edge_sources, edge_targets, edge_amounts)
+        self.account_components.union_many(edge_sources, edge_targets, edge_amounts)
+        self.transaction_history.append_many(transactions)
+
+        return {
+            'success': valid,
+            'errors': errors.tolist(),
+            'transactions': transactions,
+            'completed': 0,
+            'failed': len(amounts) - len(rows_ok)
+        }
+
+    def _calculate_transaction_priority(self, transaction: Transaction) -> Tuple[int, float]:
+        """
+        Calculate transaction priority based on type, then amount
+
+        INTERNATIONAL transfers form a higher tier, so every one of them
+        goes ahead of any domestic transfer regardless of amount.
+        """
+        tier = 1 if transaction.transaction_type == 'INTERNATIONAL' else 0
+        return tier, transaction.amount
 
     def get_account_transactions(
         self, 
         account_number: str, 
-        limit: int = 10
+        limit: int = 10,
+        cursor: Optional[int] = None
     ) -> List[Transaction]:
         """
-        Retrieve and analyze account transactions
+        Most recent transactions of an account, newest first
         """
-        # Collect transactions from graph
-        transactions = []
-        
-        # Find all transactions related to the account
-        for vertex in self.transaction_graph.vertices:
-            if vertex == account_number:
-                for neighbor, weight in self.transaction_graph.get_neighbors(vertex):
-                    # Create a mock transaction for demonstration
-                    transaction = Transaction.create_transaction(
-                        vertex, neighbor, weight
-                    )
-                    transactions.append(transaction)
-
-        # Sort transactions using multiple sorting algorithms
-        sorted_by_amount = SortAlgorithms.quick_sort(
-            transactions, 
-            key=lambda x: x.amount
-        )
+        return self.transaction_history.page(account_number, limit, cursor)[0]
 
-        sorted_by_timestamp = SortAlgorithms.merge_sort(
-            transactions, 
-            key=lambda x: x.timestamp
+    def get_account_transaction_page(
+        self,
+        account_number: str,
+        limit: int = 10,
+        cursor: Optional[int] = None
+    ) -> Dict:
+        """
+        Cursor-paginated account history for statements and dashboards
+        """
+        transactions, next_cursor = self.transaction_history.page(
+            account_number, limit, cursor
         )
-
-        return sorted_by_amount[:limit]
+        return {
+            'transactions': transactions,
+            'next_cursor': next_cursor,
+            'total': self.transaction_history.count(account_number)
+        }
 
     def analyze_transaction_network(self, start_account: str):
         """
         Analyze transaction network using graph algorithms
         """
-        # Perform depth-first search on transaction graph
-        network_connections = self.transaction_graph.depth_first_search(start_account)
+        # Accounts linked by transfers in either direction, from the
+        # incrementally maintained components instead of a fresh traversal
+        component = self.get_account_component(start_account)
 
         # Calculate shortest paths
         shortest_paths = self.transaction_graph.dijkstra(start_account)
 
         return {
-            'connected_accounts': list(network_connections),
+            'connected_accounts': component['accounts'],
+            'component_size': component['size'],
+            'component_volume': component['volume'],
             'path_distances': shortest_paths
-        }
\ No newline at end of file
+        }
+
+    def are_accounts_connected(self, account_a: str, account_b: str) -> bool:
+        """
+        Whether a chain of transfers (in any direction) links two accounts
+        """
+        return self.account_components.connected(account_a, account_b)
+
+    def get_account_component(self, account_number: str) -> Dict:
+        """
+        Accounts linked to account_number and their aggregate activity
+        """
+        summary = self.account_components.summary(account_number)
+        summary['accounts'] = self.account_components.members(account_number)
+        return summary
+
+    def rebuild_components(self) -> UnionFind:
+        """
+        Recompute components from the transaction graph in one pass over
+        its edges, e.g. after loading edges straight into the graph
+        """
+        components = UnionFind()
+        for source, edges in list(self.transaction_graph.graph.items()):
+            for target, amount in edges:
+                components.union(source, target, amount)
+        for vertex in list(self.transaction_graph.vertices):
+            components.add(vertex)
+
+        self.account_components = components
+        return components
+
+    def get_flagged_rings(self, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Rings closed by recent transfers, newest first
+        """
+        return self.ring_detector.recent_alerts(limit)
+
+    def detect_rings(self, min_size: int = 2) -> List[List[str]]:
+        """
+        Groups of accounts in which money can flow in a cycle, from a full
+        strongly connected components pass over the transaction graph
+        """
+        components = self.transaction_graph.strongly_connected_components(min_size)
+        return sorted(components, key=len, reverse=True)
+
+    def compact_transaction_graph(self):
+        """
+        Rebuild the CSR snapshot of the transaction graph
+        """
+        graph = self.transaction_graph
+        version, removals = graph.version, graph.removals
+        self.compact_graph = graph.compact()
+        self.compact_graph_version = version
+        self.compact_graph_removals = removals
+        self.compact_graph_built_at = time.monotonic()
+        return self.compact_graph
+
+    def is_reachable(self, from_account: str, to_account: str) -> bool:
+        """
+        Check whether money can flow from one account to another
+
+        Answered from the CSR snapshot while it is current. Between
+        rebuilds, a path in the snapshot still exists if no edge has been
+        removed since; other queries fall back to a breadth-first search
+        of the live graph that stops at the target.
+        """
+        graph = self.transaction_graph
+        compact = self.compact_graph
+        if compact is None:
+            compact = self.compact_transaction_graph()
+        elif self.compact_graph_version != graph.version and (
+                graph.version - self.compact_graph_version >= self.compact_rebuild_edges
+                or time.monotonic() - self.compact_graph_built_at >= self.compact_max_age):
+            compact = self.compact_transaction_graph()
+
+        if self.compact_graph_version == graph.version:
+            return compact.is_reachable(from_account, to_account)
+
+        if (self.compact_graph_removals == graph.removals
+                and compact.is_reachable(from_account, to_account)):
+            return True
+        return graph.is_reachable(from_account, to_account)
\ No newline at end of file
@@ -0,0 +1,265 @@
+import contextlib
+import os
+from typing import Dict, Optional
+
+from src.core.id_generator import ACCOUNT_IDS, USER_IDS
+from src.data_structures.bloom_filter import ScalableBloomFilter
+from src.storage.records import (
+    account_from_record,
+    account_to_record,
+    user_from_record,
+    user_to_record
+)
+from src.storage.snapshot import SnapshotStore
+from src.storage.write_ahead_log import WriteAheadLog
+
+
+class PersistenceManager:
+    """
+    Durable local storage for the banking services.
+
+    Mutations are appended to a write-ahead log by the services
+    themselves; snapshots periodically capture the full state so that
+    recovery only has to replay the log tail. Log records carry resulting
+    state (e.g. the balance after a deposit), which makes replay
+    idempotent. Account state and the snapshot LSN are captured together
+    behind a write barrier on the account locks, so the image holds
+    exactly the account changes logged up to its LSN.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        group_commit_size: int = 512,
+        group_commit_interval: float = 0.01,
+        fsync: bool = True,
+        snapshot_every: Optional[int] = None
+    ):
+        self.data_dir = data_dir
+        self.wal = WriteAheadLog(
+            os.path.join(data_dir, 'wal'),
+            group_commit_size=group_commit_size,
+            group_commit_interval=group_commit_interval,
+            fsync=fsync
+        )
+        self.snapshots = SnapshotStore(os.path.join(data_dir, 'snapshots'))
+        self.snapshot_every = snapshot_every
+
+        self.account_service = None
+        self.auth_service = None
+        self.registration_service = None
+        self._last_snapshot_lsn = 0
+
+    def attach(
+        self,
+        account_service=None,
+        auth_service=None,
+        registration_service=None
+    ) -> None:
+        """
+        Route service mutations into the write-ahead log
+        """
+        if account_service is not None:
+            self.account_service = account_service
+            account_service.journal = self.wal
+        if auth_service is not None:
+            self.auth_service = auth_service
+            auth_service.journal = self.wal
+        if registration_service is not None:
+            self.registration_service = registration_service
+
+    def _capture_accounts(self):
+        """
+        Accounts with their mutable state as of now (caller holds the
+        write barrier); static fields are read later while writing
+        """
+        if self.account_service is None:
+            return []
+        return [
+            (account, account.balance, account.is_active)
+            for account in self.account_service.account_tree.values()
+        ]
+
+    def _entities(self, accounts):
+        for account, balance, is_active in accounts:
+            record = account_to_record(account)
+            record['balance'] = balance
+            record['is_active'] = is_active
+            yield {'type': 'account', **record}
+
+        if self.auth_service is not None:
+            for user in self.auth_service.user_tree.values():
+                yield {'type': 'user', **user_to_record(user)}
+
+    def _write_barrier(self):
+        if self.account_service is None:
+            return contextlib.nullcontext()
+        return self.account_service.account_locks.hold_all()
+
+    def snapshot(self) -> str:
+        """
+        Write a snapshot and drop log segments it makes redundant
+
+        Returns:
+            str: Path of the snapshot file
+        """
+        # No account writer can run between reading the LSN and capturing
+        # the balances, so the two agree
+        with self._write_barrier():
+            lsn = self.wal.sync()
+            accounts = self._capture_accounts()
+        self.wal.rotate()
+
+        path = self.snapshots.write(lsn, self._entities(accounts))
+        for name, bloom in self._filters():
+            self.snapshots.write_blob(lsn, name, bloom.to_bytes())
+        self._last_snapshot_lsn = lsn
+
+        # Keep enough log to recover from the oldest retained snapshot
+        oldest = self.snapshots.snapshots()[0]
+        self.wal.truncate_before(self.snapshots.snapshot_lsn(oldest) + 1)
+
+        return path
+
+    def _filters(self):
+        """
+        (name, filter) for each attached uniqueness filter
+        """
+        if self.auth_service is not None:
+            yield 'usernames', self.auth_service.username_filter
+        if self.registration_service is not None:
+            yield 'emails', self.registration_service.email_filter
+
+    def _load_filters(self, lsn: int) -> None:
+        """
+        Merge filters saved with the snapshot into the live ones, keeping
+        keys added before recovery; restored entities then only add keys
+        the image is missing
+        """
+        for name, live in list(self._filters()):
+            data = self.snapshots.read_blob(lsn, name)
+            if data is None:
+                continue
+            try:
+                live.merge(ScalableBloomFilter.from_bytes(data))
+            except ValueError:
+                continue  # Rebuilt from the entities instead
+
+    def maybe_snapshot(self) -> Optional[str]:
+        """
+        Snapshot once snapshot_every records have accumulated
+        """
+        if self.snapshot_every is None:
+            return None
+        if self.wal.next_lsn - 1 - self._last_snapshot_lsn < self.snapshot_every:
+            return None
+        return self.snapshot()
+
+    def recover(self) -> Dict:
+        """
+        Load the latest snapshot and replay the log tail into the attached
+        services (journaling stays off while replaying)
+
+        Returns:
+            Dict: Counts of restored entities and replayed records
+        """
+        journals = self._detach_journals()
+        stats = {'snapshot_lsn': 0, 'accounts': 0, 'users': 0, 'replayed': 0}
+
+        try:
+            latest = self.snapshots.latest()
+            if latest is not None:
+                lsn, path = latest
+                stats['snapshot_lsn'] = lsn
+                self._last_snapshot_lsn = lsn
+                self._load_filters(lsn)
+
+                for entity in self.snapshots.read(path):
+                    if entity['type'] == 'account':
+                        self._restore_account(entity)
+                        stats['accounts'] += 1
+                    elif entity['type'] == 'user':
+                        self._restore_user(entity)
+                        stats['users'] += 1
+
+            for record in self.wal.replay(stats['snapshot_lsn']):
+                self.apply(record)
+                stats['replayed'] += 1
+        finally:
+            self._reattach_journals(journals)
+
+        return stats
+
+    def _detach_journals(self):
+        journals = []
+        for service in (self.account_service, self.auth_service):
+            if service is not None:
+                journals.append((service, service.journal))
+                service.journal = None
+        return journals
+
+    @staticmethod
+    def _reattach_journals(journals) -> None:
+        for service, journal in journals:
+            service.journal = journal
+
+    def _restore_account(self, record: Dict) -> None:
+        if self.account_service is None:
+            return
+        existing = self.account_service.find_account(record['account_number'])
+        if existing is None:
+            ACCOUNT_IDS.observe((record['account_number'],))
+            self.account_service.restore_account(account_from_record(record))
+        else:
+            existing.balance = record['balance']
+
+    def _restore_user(self, record: Dict) -> None:
+        if self.auth_service is None:
+            return
+        user = user_from_record(record)
+        USER_IDS.observe((user.user_id,))
+        self.auth_service.restore_user(user)
+        if self.registration_service is not None:
+            self.registration_service.index_user(user)
+
+    def apply(self, record: Dict) -> None:
+        """
+        Redo one logged mutation against the attached services
+        """
+        op = record['op']
+        accounts = self.account_service
+
+        if op == 'create_account':
+            self._restore_account(record)
+        elif op in ('deposit', 'withdraw'):
+            account = accounts.find_account(record['account_number']) if accounts else None
+            if account is not None:
+                account.balance = record['balance']
+        elif op == 'transfer':
+            for number, balance in (
+                (record['from_account'], record['from_balance']),
+                (record['to_account'], record['to_balance'])
+            ):
+                account = accounts.find_account(number) if accounts else None
+                if account is not None:
+                    account.balance = balance
+        elif op in ('batch_transfer', 'apply_interest'):
+            for number, balance in record['balances'].items():
+                account = accounts.find_account(number) if accounts else None
+                if account is not None:
+                    account.balance = balance
+        elif op == 'close_account':
+            if accounts is not None:
+                accounts.close_account(record['account_number'])
+        elif op == 'register_user':
+            self._restore_user(record)
+        elif op == 'change_password':
+            user = self.auth_service.find_user(record['username']) if self.auth_service else None
+            if user is not None:
+                user.password_hash = record['password_hash']
+                user.salt = record['salt']
+        else:
+            raise ValueError(f'Unknown log record type: {op}')
+
+    def close(self) -> None:
+        self.wal.close()
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Dict
+
+from src.core.account import Account
+from src.core.user import User
+
+USER_FIELDS = (
+    'user_id', 'username', 'password_hash', 'salt', 'email',
+    'role', 'is_active', 'last_login', 'created_at'
+)
+
+
+def account_to_record(account) -> Dict:
+    """
+    JSON-serialisable image of an account
+    """
+    return {
+        'account_number': account.account_number,
+        'customer_id': account.customer_id,
+        'account_type': account.account_type,
+        'balance': account.balance,
+        'created_at': account.created_at.isoformat(),
+        'is_active': account.is_active,
+        'overdraft_limit': account.overdraft_limit
+    }
+
+
+def account_from_record(record: Dict) -> Account:
+    return Account(
+        account_number=record['account_number'],
+        customer_id=record['customer_id'],
+        account_type=record['account_type'],
+        balance=record['balance'],
+        created_at=datetime.fromisoformat(record['created_at']),
+        is_active=record['is_active'],
+        overdraft_limit=record['overdraft_limit']
+    )
+
+
+def user_to_record(user: User) -> Dict:
+    """
+    JSON-serialisable image of a user (hash and salt, never a password)
+    """
+    return {name: getattr(user, name) for name in USER_FIELDS}
+
+
+def user_from_record(record: Dict) -> User:
+    return User(**{name: record[name] for name in USER_FIELDS})
@@ -0,0 +1,147 @@
+import json
+import os
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from src.storage.write_ahead_log import fsync_directory
+
+SNAPSHOT_PREFIX = 'snapshot-'
+SNAPSHOT_SUFFIX = '.jsonl'
+SNAPSHOT_VERSION = 1
+BLOB_SUFFIX = '.bin'
+
+
+class SnapshotStore:
+    """
+    Compact point-in-time images of service state.
+
+    A snapshot is a JSON-lines file: a header carrying the LSN it covers,
+    followed by one line per entity. Files are written to a temporary
+    name, fsynced and atomically renamed, so a crash never leaves a
+    half-written snapshot behind.
+    """
+
+    def __init__(self, directory: str, keep: int = 2):
+        self.directory = directory
+        self.keep = keep
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, lsn: int) -> str:
+        return os.path.join(
+            self.directory, f'{SNAPSHOT_PREFIX}{lsn:020d}{SNAPSHOT_SUFFIX}'
+        )
+
+    def snapshots(self):
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)
+        )
+        return [os.path.join(self.directory, name) for name in names]
+
+    @staticmethod
+    def snapshot_lsn(path: str) -> int:
+        name = os.path.basename(path)
+        return int(name[len(SNAPSHOT_PREFIX):-len(SNAPSHOT_SUFFIX)])
+
+    def write(self, lsn: int, entities: Iterable[Dict]) -> str:
+        """
+        Write a snapshot covering every log record up to lsn
+
+        Args:
+            lsn (int): Highest LSN reflected in the entities
+            entities (Iterable[Dict]): Records with a 'type' key
+
+        Returns:
+            str: Path of the new snapshot
+        """
+        path = self._path(lsn)
+        temporary = path + '.tmp'
+
+        with open(temporary, 'w', encoding='utf-8') as snapshot:
+            header = {'type': 'header', 'lsn': lsn, 'version': SNAPSHOT_VERSION}
+            snapshot.write(json.dumps(header) + '\n')
+            for entity in entities:
+                snapshot.write(json.dumps(entity, separators=(',', ':')) + '\n')
+            snapshot.write(json.dumps({'type': 'footer'}) + '\n')
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+
+        os.replace(temporary, path)
+        fsync_directory(self.directory)
+        self._prune()
+        return path
+
+    def _blob_path(self, lsn: int, name: str) -> str:
+        return os.path.join(self.directory, f'{SNAPSHOT_PREFIX}{lsn:020d}.{name}{BLOB_SUFFIX}')
+
+    def write_blob(self, lsn: int, name: str, data: bytes) -> str:
+        """
+        Store auxiliary binary state (e.g. a filter image) next to the
+        snapshot for lsn; it is pruned together with that snapshot
+        """
+        path = self._blob_path(lsn, name)
+        temporary = path + '.tmp'
+
+        with open(temporary, 'wb') as blob:
+            blob.write(data)
+            blob.flush()
+            os.fsync(blob.fileno())
+
+        os.replace(temporary, path)
+        fsync_directory(self.directory)
+        return path
+
+    def read_blob(self, lsn: int, name: str) -> Optional[bytes]:
+        try:
+            with open(self._blob_path(lsn, name), 'rb') as blob:
+                return blob.read()
+        except FileNotFoundError:
+            return None
+
+    def _prune(self) -> None:
+        for path in self.snapshots()[:-self.keep]:
+            os.remove(path)
+
+            # Auxiliary blobs share the snapshot's file-name stem
+            stem = os.path.basename(path)[:-len(SNAPSHOT_SUFFIX)] + '.'
+            for name in os.listdir(self.directory):
+                if name.startswith(stem) and name.endswith(BLOB_SUFFIX):
+                    os.remove(os.path.join(self.directory, name))
+
+    def latest(self) -> Optional[Tuple[int, str]]:
+        """
+        (lsn, path) of the newest complete snapshot, or None
+        """
+        for path in reversed(self.snapshots()):
+            header = self._header(path)
+            if header is not None and self._is_complete(path):
+                return header['lsn'], path
+        return None
+
+    @staticmethod
+    def _header(path: str) -> Optional[Dict]:
+        with open(path, encoding='utf-8') as snapshot:
+            try:
+                header = json.loads(snapshot.readline())
+            except ValueError:
+                return None
+        return header if header.get('type') == 'header' else None
+
+    @staticmethod
+    def _is_complete(path: str) -> bool:
+        with open(path, 'rb') as snapshot:
+            snapshot.seek(0, os.SEEK_END)
+            snapshot.seek(max(0, snapshot.tell() - 64))
+            return snapshot.read().rstrip().endswith(b'{"type": "footer"}')
+
+    @staticmethod
+    def read(path: str) -> Iterator[Dict]:
+        """
+        Stream the entities of a snapshot (header and footer excluded)
+        """
+        with open(path, encoding='utf-8') as snapshot:
+            snapshot.readline()
+            for line in snapshot:
+                entity = json.loads(line)
+                if entity.get('type') == 'footer':
+                    return
+                yield entity
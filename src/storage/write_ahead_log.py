@@ -0,0 +1,303 @@
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+SEGMENT_PREFIX = 'wal-'
+SEGMENT_SUFFIX = '.log'
+
+
+def _encode(record: Dict) -> bytes:
+    """
+    One log line: CRC32 of the JSON body, a tab, the body, a newline
+    """
+    body = json.dumps(record, separators=(',', ':')).encode()
+    return b'%08x\t%s\n' % (zlib.crc32(body), body)
+
+
+def _decode(line: bytes) -> Optional[Dict]:
+    """
+    Parse a log line, returning None if it is torn or corrupt
+    """
+    if not line.endswith(b'\n') or len(line) < 10 or line[8:9] != b'\t':
+        return None
+
+    body = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(body):
+            return None
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def fsync_directory(directory: str) -> None:
+    """
+    Persist directory entries (new, renamed or deleted files)
+    """
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class WriteAheadLog:
+    """
+    Append-only, segmented write-ahead log with group commit.
+
+    With fsync enabled, append() returns only once its record is durable.
+    One fsync covers every record written before it, so concurrent
+    writers that queue behind a sync are committed together by the next
+    one. Bulk writers can append with wait=False and call wait_durable()
+    once for the last LSN. Without fsync, records are flushed to the OS in
+    batches by size, by age or through sync().
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        group_commit_size: int = 512,
+        group_commit_interval: float = 0.01,
+        fsync: bool = True
+    ):
+        self.directory = directory
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+        self.fsync = fsync
+
+        self.lock = threading.RLock()
+        self._pending = 0
+        self._oldest_pending = 0.0
+        self._closed = False
+
+        os.makedirs(directory, exist_ok=True)
+        self.next_lsn = self._recover_next_lsn()
+        self.durable_lsn = self.next_lsn - 1
+        self._file = None
+        self._open_segment()
+
+        # Bounds commit latency for writers that stop appending mid-batch
+        self._flusher_wakeup = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name='wal-flusher', daemon=True
+        )
+        self._flusher.start()
+
+    def segments(self) -> List[str]:
+        """
+        Segment paths ordered by their first LSN
+        """
+        names = sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+        return [os.path.join(self.directory, name) for name in names]
+
+    @staticmethod
+    def _segment_start(path: str) -> int:
+        name = os.path.basename(path)
+        return int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+    def _recover_next_lsn(self) -> int:
+        last_lsn = 0
+        segments = self.segments()
+        if segments:
+            last_lsn = self._segment_start(segments[-1]) - 1
+            for record in self._read_segment(
+                segments[-1], tolerate_torn_tail=True, truncate=True
+            ):
+                last_lsn = record['lsn']
+        return last_lsn + 1
+
+    def _open_segment(self) -> None:
+        path = os.path.join(
+            self.directory,
+            f'{SEGMENT_PREFIX}{self.next_lsn:020d}{SEGMENT_SUFFIX}'
+        )
+        self._file = open(path, 'ab')
+        fsync_directory(self.directory)
+
+    def append(self, op: str, payload: Dict, wait: bool = True) -> int:
+        """
+        Append a mutation record
+
+        Args:
+            op (str): Operation name, e.g. 'deposit'
+            payload (Dict): JSON-serialisable operation data
+            wait (bool): With fsync enabled, return only once the record
+                is durable
+
+        Returns:
+            int: Log sequence number assigned to the record
+        """
+        with self.lock:
+            if self._closed:
+                raise ValueError('Write-ahead log is closed')
+
+            lsn = self.next_lsn
+            self.next_lsn += 1
+
+            record = dict(payload)
+            record['lsn'] = lsn
+            record['op'] = op
+            self._file.write(_encode(record))
+
+            if not self._pending:
+                self._oldest_pending = time.monotonic()
+                self._flusher_wakeup.set()
+            self._pending += 1
+
+            if self._pending >= self.group_commit_size:
+                self._sync_locked()
+
+        if wait and self.fsync:
+            self.wait_durable(lsn)
+        return lsn
+
+    def wait_durable(self, lsn: int) -> None:
+        """
+        Block until every record up to lsn is durable
+        """
+        # Whoever gets the lock first syncs everything written so far;
+        # writers queued behind it usually find their record covered
+        with self.lock:
+            if self.durable_lsn < lsn:
+                self._sync_locked()
+
+    def sync(self) -> int:
+        """
+        Make every appended record durable
+
+        Returns:
+            int: Highest durable LSN
+        """
+        with self.lock:
+            self._sync_locked()
+            return self.durable_lsn
+
+    def _sync_locked(self) -> None:
+        if self._file is None:
+            return
+
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self.durable_lsn = self.next_lsn - 1
+
+    def _flush_loop(self) -> None:
+        while not self._closed:
+            self._flusher_wakeup.wait()
+            self._flusher_wakeup.clear()
+
+            while not self._closed:
+                with self.lock:
+                    if not self._pending:
+                        break
+                    remaining = (
+                        self._oldest_pending
+                        + self.group_commit_interval
+                        - time.monotonic()
+                    )
+                    if remaining <= 0:
+                        self._sync_locked()
+                        break
+                time.sleep(remaining)
+
+    def rotate(self) -> int:
+        """
+        Close the current segment and start a new one
+
+        Returns:
+            int: First LSN of the new segment
+        """
+        with self.lock:
+            self._sync_locked()
+            self._file.close()
+            self._open_segment()
+            return self.next_lsn
+
+    def truncate_before(self, lsn: int) -> int:
+        """
+        Delete segments holding only records with LSN < lsn
+
+        Returns:
+            int: Number of segments removed
+        """
+        with self.lock:
+            segments = self.segments()
+            removed = 0
+            for path, following in zip(segments, segments[1:]):
+                if self._segment_start(following) <= lsn:
+                    os.remove(path)
+                    removed += 1
+            if removed:
+                fsync_directory(self.directory)
+            return removed
+
+    def _read_segment(
+        self,
+        path: str,
+        tolerate_torn_tail: bool = False,
+        truncate: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Yield the records of a segment
+
+        Args:
+            path (str): Segment file
+            tolerate_torn_tail (bool): Treat an unreadable final line as a
+                write cut short by a crash and stop there (newest segment
+                only); anywhere else a bad line raises ValueError
+            truncate (bool): Cut a tolerated torn tail off the file
+        """
+        offset = 0
+        with open(path, 'rb') as segment:
+            size = os.fstat(segment.fileno()).st_size
+            for line in segment:
+                record = _decode(line)
+                if record is None:
+                    if tolerate_torn_tail and offset + len(line) == size:
+                        break
+                    raise ValueError(
+                        f'Corrupt write-ahead log record in {path} at byte {offset}'
+                    )
+                offset += len(line)
+                yield record
+
+        if truncate and offset < os.path.getsize(path):
+            with open(path, 'r+b') as segment:
+                segment.truncate(offset)
+
+    def replay(self, after_lsn: int = 0) -> Iterator[Dict]:
+        """
+        Yield records with LSN > after_lsn in log order
+        """
+        with self.lock:
+            self._sync_locked()
+            segments = self.segments()
+
+        for i, path in enumerate(segments):
+            # Skip whole segments that end before the requested position
+            if i + 1 < len(segments) and self._segment_start(segments[i + 1]) <= after_lsn + 1:
+                continue
+            newest = i + 1 == len(segments)
+            for record in self._read_segment(path, tolerate_torn_tail=newest):
+                if record['lsn'] > after_lsn:
+                    yield record
+
+    def close(self) -> None:
+        with self.lock:
+            if self._closed:
+                return
+            self._sync_locked()
+            self._closed = True
+            self._file.close()
+            self._file = None
+        self._flusher_wakeup.set()
+        self._flusher.join()
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from src.data_structures.avl_tree import AVLTree
+
+
+def assert_balanced(tree, node=None):
+    node = node or tree.root
+    if node is None:
+        return 0
+    left = assert_balanced(tree, node.left) if node.left else 0
+    right = assert_balanced(tree, node.right) if node.right else 0
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+@pytest.fixture
+def tree():
+    tree = AVLTree()
+    keys = list(range(0, 200, 2))
+    random.Random(7).shuffle(keys)
+    for key in keys:
+        tree.insert_key(key, f'v{key}')
+    return tree
+
+
+def test_iteration_is_in_key_order(tree):
+    assert list(tree) == list(range(0, 200, 2))
+    assert list(tree.values())[:2] == ['v0', 'v2']
+    assert len(tree) == 100
+    assert_balanced(tree)
+
+
+def test_range_is_half_open_and_lazy(tree):
+    assert [key for key, _ in tree.range(10, 20)] == [10, 12, 14, 16, 18]
+    assert [key for key, _ in tree.range(11, 15)] == [12, 14]
+    assert [key for key, _ in tree.range(hi=5)] == [0, 2, 4]
+    assert [key for key, _ in tree.range(195)] == [196, 198]
+    assert list(tree.range(50, 50)) == []
+
+    scan = tree.range(0)
+    assert next(scan) == (0, 'v0')
+
+
+def test_neighbours_and_bounds(tree):
+    assert tree.successor(10).key == 12
+    assert tree.successor(11).key == 12
+    assert tree.successor(198) is None
+    assert tree.predecessor(10).key == 8
+    assert tree.predecessor(0) is None
+    assert tree.min_node().key == 0
+    assert tree.max_node().key == 198
+    assert AVLTree().min_node() is None
+
+
+def test_prefix_scan():
+    tree = AVLTree()
+    for key in ['ACC2', 'ACC10', 'ACC1', 'BCC1', 'AC']:
+        tree.insert_key(key, key)
+    assert [key for key, _ in tree.prefix('ACC1')] == ['ACC1', 'ACC10']
+    assert [key for key, _ in tree.prefix('Z')] == []
+
+
+def test_delete_keeps_balance(tree):
+    for key in range(0, 200, 4):
+        assert tree.delete_key(key)
+    assert not tree.delete_key(0)
+    assert list(tree) == list(range(2, 200, 4))
+    assert len(tree) == 50
+    assert_balanced(tree)
+
+
+@pytest.mark.parametrize('batch_size', [3, 500])
+def test_bulk_update_merges_and_rebalances(tree, batch_size):
+    batch = [(key, f'new{key}') for key in range(1, batch_size * 2, 2)]
+    batch.append((10, 'first'))
+    batch.append((10, 'last'))
+    tree.bulk_update(batch)
+
+    expected = sorted(set(range(0, 200, 2)) | {key for key, _ in batch})
+    assert list(tree) == expected
+    assert len(tree) == len(expected)
+    assert tree.find(10).value == 'last'
+    assert tree.find(1).value == 'new1'
+    assert_balanced(tree)
+
+
+def test_update_key_and_scan(tree):
+    tree.update_key(4, 'four')
+    tree.update_key(5, 'five')
+    assert tree.find(4).value == 'four'
+    assert len(tree) == 101
+    assert list(tree.scan(lambda value: value.startswith('f'))) == ['four', 'five']
@@ -0,0 +1,166 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.data_structures.account_store import amounts_to_cents, to_cents
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+class RecordingJournal:
+    def __init__(self):
+        self.records = []
+
+    def append(self, op, payload, wait=True):
+        self.records.append((op, payload))
+        return len(self.records)
+
+
+@pytest.fixture(params=[False, True], ids=['objects', 'columnar'])
+def bank(request):
+    accounts = AccountService(columnar=request.param)
+    return accounts, TransactionService(accounts)
+
+
+def open_accounts(accounts, *balances):
+    return [
+        accounts.create_account(f'C{i}', initial_balance=balance).account_number
+        for i, balance in enumerate(balances)
+    ]
+
+
+def balance(accounts, number):
+    return accounts.find_account(number).balance
+
+
+def test_settles_valid_rows(bank):
+    accounts, transactions = bank
+    a, b, c = open_accounts(accounts, 100.0, 50.0, 0.0)
+    result = transactions.process_batch([a, b, a], [b, c, c], [10.0, 20.0, 30.0])
+
+    assert result['completed'] == 3 and result['failed'] == 0
+    assert result['success'].tolist() == [True, True, True]
+    assert result['errors'] == [None, None, None]
+    assert [balance(accounts, n) for n in (a, b, c)] == [60.0, 40.0, 50.0]
+
+
+def test_partial_failure_reports_each_row(bank):
+    accounts, transactions = bank
+    a, b, closed = open_accounts(accounts, 100.0, 10.0, 10.0)
+    accounts.close_account(closed)
+
+    result = transactions.process_batch(
+        [a, a, a, a, b, a, a],
+        [b, a, 'missing', closed, a, b, b],
+        [-1.0, 5.0, 5.0, 5.0, 50.0, float('nan'), 7.5]
+    )
+    assert result['errors'] == [
+        'INVALID_AMOUNT', 'SAME_ACCOUNT', 'UNKNOWN_ACCOUNT',
+        'INACTIVE_ACCOUNT', 'INSUFFICIENT_FUNDS', 'INVALID_AMOUNT', None
+    ]
+    assert result['completed'] == 1 and result['failed'] == 6
+    assert balance(accounts, a) == 92.5
+    assert balance(accounts, b) == 17.5
+
+
+def test_funds_are_checked_in_cents(bank):
+    accounts, transactions = bank
+    a, b = open_accounts(accounts, 0.30, 0.0)
+    result = transactions.process_batch([a, a], [b, b], [0.10, 0.20])
+
+    assert result['completed'] == 2
+    assert balance(accounts, a) == 0.0
+    assert balance(accounts, b) == 0.3
+
+
+def test_amounts_are_rounded_to_the_cent(bank):
+    accounts, transactions = bank
+    a, b = open_accounts(accounts, 1.0, 0.0)
+    result = transactions.process_batch([a, a], [b, b], [0.004, 0.285])
+
+    assert result['errors'] == ['INVALID_AMOUNT', None]
+    assert balance(accounts, a) == 0.71
+    assert balance(accounts, b) == 0.29
+    [transaction] = transactions.get_account_transactions(b)
+    assert transaction.amount == 0.29
+
+
+def test_later_smaller_debits_still_settle(bank):
+    accounts, transactions = bank
+    a, b = open_accounts(accounts, 10.0, 0.0)
+    result = transactions.process_batch([a, a, a], [b, b, b], [6.0, 5.0, 4.0])
+
+    assert result['errors'] == [None, 'INSUFFICIENT_FUNDS', None]
+    assert balance(accounts, a) == 0.0
+
+
+def test_credits_are_not_spendable_within_the_batch(bank):
+    accounts, transactions = bank
+    a, b, c = open_accounts(accounts, 10.0, 0.0, 0.0)
+    result = transactions.process_batch([a, b], [b, c], [10.0, 10.0])
+    assert result['errors'] == [None, 'INSUFFICIENT_FUNDS']
+
+
+def test_matches_sequential_transfers(bank):
+    accounts, transactions = bank
+    rng = random.Random(3)
+    numbers = open_accounts(accounts, *[rng.choice([0.0, 5.0, 25.0]) for _ in range(8)])
+    rows = [(rng.choice(numbers), rng.choice(numbers)) for _ in range(200)]
+    amounts = [round(rng.uniform(0.01, 10), 2) for _ in rows]
+
+    # Reference: debits in row order, credits only after the batch
+    funds = {n: to_cents(balance(accounts, n)) for n in numbers}
+    result = transactions.process_batch([s for s, _ in rows], [t for _, t in rows], amounts)
+
+    credits = dict.fromkeys(numbers, 0)
+    expected = []
+    for (source, target), amount in zip(rows, amounts):
+        cents = to_cents(amount)
+        ok = source != target and cents <= funds[source]
+        if ok:
+            funds[source] -= cents
+            credits[target] += cents
+        expected.append(ok)
+
+    assert result['success'].tolist() == expected
+    for n in numbers:
+        assert to_cents(balance(accounts, n)) == funds[n] + credits[n]
+
+
+def test_journals_resulting_balances(bank):
+    accounts, transactions = bank
+    a, b = open_accounts(accounts, 1.0, 0.0)
+    accounts.journal = RecordingJournal()
+    transactions.process_batch([a, a], [b, b], [0.1, 0.2])
+
+    [(op, payload)] = accounts.journal.records
+    assert op == 'batch_transfer'
+    assert payload == {'rows': 2, 'balances': {a: 0.7, b: 0.3}}
+
+
+def test_unsettled_batch_is_queued(bank):
+    accounts, transactions = bank
+    a, b = open_accounts(accounts, 1.0, 0.0)
+    result = transactions.process_batch([a, a], [b, a], [0.5, 0.5], settle=False)
+
+    assert result['errors'] == [None, 'SAME_ACCOUNT']
+    [queued] = result['transactions']
+    assert transactions.take_transaction(0) is queued
+    assert balance(accounts, a) == 1.0
+
+
+def test_rejects_ragged_columns(bank):
+    _, transactions = bank
+    with pytest.raises(ValueError):
+        transactions.process_batch(['a'], ['b', 'c'], [1.0])
+
+
+def test_amounts_to_cents_matches_to_cents():
+    rng = random.Random(11)
+    values = [0.285, 1.005, -0.285, 2.675, 0.1 + 0.2, 1e15 + 0.5, 123456789.125, 0.005]
+    values += [rng.uniform(-1e6, 1e6) for _ in range(5000)]
+    values += [round(rng.uniform(0, 1e4), 3) for _ in range(5000)]
+
+    assert amounts_to_cents(np.array(values)).tolist() == [to_cents(v) for v in values]
+    assert amounts_to_cents([float('nan'), float('inf')]).tolist() == [0, 0]
@@ -0,0 +1,107 @@
+import pytest
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.data_structures.bloom_filter import ScalableBloomFilter
+from src.services.authentication_service import AuthenticationService
+from src.services.registration_service import RegistrationService
+from src.storage.persistence_manager import PersistenceManager
+
+
+def test_no_false_negatives_as_stages_grow():
+    bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    keys = [f'user{i}' for i in range(1000)]
+    assert all(bloom.add(key) for key in keys[:10])
+    bloom.update(keys)
+
+    assert all(key in bloom for key in keys)
+    assert len(bloom.filters) > 1
+    assert not bloom.add('user1')
+
+
+def test_false_positive_rate_stays_bounded():
+    bloom = ScalableBloomFilter(initial_capacity=500, error_rate=0.01)
+    bloom.update(f'in{i}' for i in range(2000))
+    positives = sum(f'out{i}' in bloom for i in range(20000))
+
+    bound = bloom.error_rate / (1 - bloom.tightening)
+    assert positives / 20000 < bound
+    assert bloom.false_positive_rate() < bound
+
+
+def test_check_counters():
+    bloom = ScalableBloomFilter()
+    bloom.add('alice')
+    assert bloom.might_contain('alice')
+    assert not bloom.might_contain('bob')
+    bloom.record_false_positive()
+
+    stats = bloom.stats()
+    assert (stats['checks'], stats['negatives'], stats['false_positives']) == (2, 1, 1)
+    assert stats['observed_fp_rate'] == 0.5
+
+
+def test_serialisation_round_trip_and_corruption():
+    bloom = ScalableBloomFilter(initial_capacity=64)
+    bloom.update(range(200))
+    image = bloom.to_bytes()
+    restored = ScalableBloomFilter.from_bytes(image)
+
+    assert all(key in restored for key in range(200))
+    assert [s.count for s in restored.filters] == [s.count for s in bloom.filters]
+
+    with pytest.raises(ValueError):
+        ScalableBloomFilter.from_bytes(image[:-1] + bytes([image[-1] ^ 1]))
+
+
+def test_merge_is_a_union():
+    ours = ScalableBloomFilter(initial_capacity=64)
+    theirs = ScalableBloomFilter(initial_capacity=64)
+    ours.update(f'a{i}' for i in range(10))
+    theirs.update(f'b{i}' for i in range(300))
+
+    ours.merge(theirs)
+    assert all(f'a{i}' in ours for i in range(10))
+    assert all(f'b{i}' in ours for i in range(300))
+    assert len(ours.filters) == len(theirs.filters)
+
+    with pytest.raises(ValueError):
+        ours.merge(ScalableBloomFilter(initial_capacity=32))
+
+
+def registration(name, email=None):
+    return {
+        'username': name, 'password': 'Secret1!x',
+        'confirm_password': 'Secret1!x', 'email': email or f'{name}@bank.test'
+    }
+
+
+def open_services(data_dir):
+    auth = AuthenticationService(
+        password_hasher=PasswordHasher(SCRYPT, {'n': 2 ** 8, 'r': 8, 'p': 1}),
+        login_throttling=False
+    )
+    registration_service = RegistrationService(auth)
+    manager = PersistenceManager(str(data_dir), fsync=False)
+    manager.attach(auth_service=auth, registration_service=registration_service)
+    return manager, auth, registration_service
+
+
+def test_recovery_merges_saved_filters_with_live_keys(tmp_path):
+    manager, _, registration_service = open_services(tmp_path)
+    registration_service.register_user(registration('alice'))
+    manager.snapshot()
+    registration_service.register_user(registration('bob'))
+    manager.close()
+
+    manager, auth, registration_service = open_services(tmp_path)
+    auth.username_filter.add('live_only')
+    stats = manager.recover()
+    manager.close()
+
+    assert stats['users'] == 1 and stats['replayed'] == 1
+    assert all(name in auth.username_filter for name in ('alice', 'bob', 'live_only'))
+    assert auth.find_user('alice') is not None and auth.find_user('bob') is not None
+    assert 'bob@bank.test' in registration_service.email_filter
+
+    duplicate = registration_service.register_user(registration('alice2', 'alice@bank.test'))
+    assert not duplicate['success']
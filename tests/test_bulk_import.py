@@ -0,0 +1,131 @@
+import csv
+import json
+
+import pytest
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.services.authentication_service import AuthenticationService
+from src.services.bulk_import_service import BulkImportService
+from src.services.registration_service import RegistrationService
+
+FAST_SCRYPT = {'n': 2 ** 8, 'r': 8, 'p': 1}
+
+
+@pytest.fixture
+def services():
+    auth_service = AuthenticationService(password_hasher=PasswordHasher(SCRYPT, FAST_SCRYPT))
+    return auth_service, RegistrationService(auth_service)
+
+
+def import_rows(registration_service, records, **kwargs):
+    importer = BulkImportService(registration_service, hash_workers=0, **kwargs)
+    return importer.import_rows(iter(enumerate(records, start=1)))
+
+
+def test_imports_valid_rows(services):
+    auth_service, registration_service = services
+    result = import_rows(registration_service, [
+        {'username': 'alice', 'password': 'Secret1!x', 'email': 'alice@example.com'},
+        {'username': 'bob', 'password': 'Secret1!x', 'email': 'bob@example.com'}
+    ])
+    assert (result['rows'], result['imported'], result['failed']) == (2, 2, 0)
+    assert auth_service.authenticate('alice', 'Secret1!x') is not None
+    assert registration_service._find_user_by_email('bob@example.com') is not None
+    assert auth_service.user_tree.find('bob') is not None
+
+
+def test_reports_invalid_and_duplicate_rows(services):
+    auth_service, registration_service = services
+    auth_service.register_user('taken', 'Secret1!x', 'taken@example.com')
+    registration_service.index_user(auth_service.find_user('taken'))
+
+    result = import_rows(registration_service, [
+        {'username': 'okay', 'password': 'Secret1!x', 'email': 'ok@example.com'},
+        {'username': 'x', 'password': 'short', 'email': 'nope'},
+        {'username': 'okay', 'password': 'Secret1!x', 'email': 'other@example.com'},
+        {'username': 'fresh', 'password': 'Secret1!x', 'email': 'taken@example.com'},
+        {'username': 'taken', 'password': 'Secret1!x', 'email': 'new@example.com'}
+    ])
+    assert result['imported'] == 1
+    assert result['failed'] == 4
+    assert {(e['row'], e['field']) for e in result['errors']} == {
+        (2, 'username'), (2, 'password'), (2, 'email'),
+        (3, 'username'), (4, 'email'), (5, 'username')
+    }
+
+
+def test_duplicates_across_batches(services):
+    _, registration_service = services
+    records = [
+        {'username': f'user{i % 3}', 'password': 'Secret1!x', 'email': f'u{i}@example.com'}
+        for i in range(6)
+    ]
+    result = import_rows(registration_service, records, batch_size=2)
+    assert result['imported'] == 3
+    assert result['failed'] == 3
+
+
+def test_passwords_are_kept_verbatim(services):
+    auth_service, registration_service = services
+    import_rows(registration_service, [
+        {'username': ' alice ', 'password': ' Secret1! ', 'email': 'alice@example.com '}
+    ])
+    assert auth_service.authenticate('alice', ' Secret1! ') is not None
+    assert auth_service.authenticate('alice', 'Secret1!') is None
+
+
+def test_only_customer_role_is_accepted(services):
+    auth_service, registration_service = services
+    result = import_rows(registration_service, [
+        {'username': 'admin1', 'password': 'Secret1!x', 'email': 'a@example.com', 'role': 'admin'},
+        {'username': 'cust1', 'password': 'Secret1!x', 'email': 'c@example.com', 'role': 'customer'},
+        {'username': 'cust2', 'password': 'Secret1!x', 'email': 'd@example.com'}
+    ])
+    assert result['errors'] == [
+        {'row': 1, 'username': 'admin1', 'field': 'role', 'error': 'Invalid role'}
+    ]
+    assert auth_service.find_user('admin1') is None
+    assert auth_service.find_user('cust1').role == 'customer'
+    assert auth_service.find_user('cust2').role == 'customer'
+
+
+def test_hashes_on_a_pool_even_when_logins_hash_inline(services):
+    auth_service, registration_service = services
+    importer = BulkImportService(registration_service, hash_workers=2)
+    assert auth_service.password_hasher.workers == 0
+    assert importer.password_hasher.workers == 2
+    assert importer.password_hasher.parameters == FAST_SCRYPT
+
+    result = importer.import_rows(iter([
+        (1, {'username': 'pooled', 'password': 'Secret1!x', 'email': 'p@example.com'})
+    ]))
+    assert result['imported'] == 1
+    assert importer.password_hasher._pool is None
+    assert auth_service.authenticate('pooled', 'Secret1!x') is not None
+
+
+def test_import_file_formats(services, tmp_path):
+    _, registration_service = services
+    csv_path = tmp_path / 'users.csv'
+    with open(csv_path, 'w', newline='') as target:
+        writer = csv.writer(target)
+        writer.writerow(['username', 'password', 'email'])
+        writer.writerow(['csvuser', 'Secret1!x', 'csv@example.com'])
+
+    jsonl_path = tmp_path / 'users.jsonl'
+    jsonl_path.write_text(
+        json.dumps({'username': 'jsonuser', 'password': 'Secret1!x', 'email': 'j@example.com'})
+        + '\n\n{not json\n'
+    )
+
+    importer = BulkImportService(registration_service, hash_workers=0)
+    assert importer.import_file(str(csv_path))['imported'] == 1
+
+    report = tmp_path / 'errors.csv'
+    result = importer.import_file(str(jsonl_path), error_report_path=str(report))
+    assert (result['imported'], result['failed']) == (1, 1)
+    with open(report, newline='') as source:
+        assert [row['error'] for row in csv.DictReader(source)] == ['Malformed JSON record']
+
+    with pytest.raises(ValueError):
+        list(BulkImportService.iter_rows(str(csv_path), 'xml'))
@@ -0,0 +1,184 @@
+import random
+
+import pytest
+
+from src.data_structures.compact_graph import CompactGraph
+from src.data_structures.graph import Graph
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def random_graph(seed, vertices=15, edges=30):
+    rng = random.Random(seed)
+    graph = Graph()
+    for _ in range(edges):
+        graph.add_edge(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 9))
+    graph.vertices.update(range(vertices))
+    return graph
+
+
+def test_shortest_path():
+    graph = Graph()
+    graph.add_edges(['a', 'a', 'b', 'c'], ['b', 'c', 'd', 'd'], [1, 5, 10, 1])
+    assert graph.shortest_path('a', 'd') == (6, ['a', 'c', 'd'])
+    assert graph.shortest_path('d', 'a') == (float('infinity'), [])
+    assert graph.dijkstra('a', max_distance=5) == {'a': 0, 'b': 1, 'c': 5}
+
+
+def bellman_ford(graph, start):
+    distances = {start: 0}
+    for _ in range(len(graph.vertices)):
+        for u, edges in list(graph.graph.items()):
+            if u not in distances:
+                continue
+            for v, weight in edges:
+                if distances[u] + weight < distances.get(v, float('infinity')):
+                    distances[v] = distances[u] + weight
+    return distances
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_dijkstra_matches_bellman_ford(seed):
+    graph = random_graph(seed)
+    expected = bellman_ford(graph, 0)
+    assert graph.dijkstra(0) == expected
+
+    for target, distance in expected.items():
+        length, path = graph.shortest_path(0, target)
+        assert length == distance
+        assert path[0] == 0 and path[-1] == target
+        assert sum(
+            min(w for v, w in graph.graph[u] if v == nxt)
+            for u, nxt in zip(path, path[1:])
+        ) == distance
+
+
+def test_dijkstra_stops_at_target_and_supports_many_sources():
+    graph = Graph()
+    graph.add_edges(['a', 'b', 'c', 'x'], ['b', 'c', 'd', 'c'], [1, 1, 1, 1])
+    assert 'd' not in graph.dijkstra('a', target='c')
+
+    distances, predecessors = graph.multi_source_dijkstra(['a', 'x'])
+    assert distances == {'a': 0, 'x': 0, 'b': 1, 'c': 1, 'd': 2}
+    assert predecessors['c'] == 'x'
+    assert predecessors['a'] is None
+
+
+def test_deep_chain_does_not_recurse():
+    graph = Graph()
+    chain = list(range(50000))
+    graph.add_edges(chain[:-1], chain[1:], [1] * (len(chain) - 1))
+    assert len(graph.depth_first_search(0)) == len(chain)
+    assert graph.is_reachable(0, 49999)
+
+
+def test_version_counts_edge_changes():
+    graph = Graph()
+    graph.add_edge('a', 'b')
+    graph.add_edges(['b', 'c'], ['c', 'd'], [1, 1])
+    assert graph.version == 3
+    graph.remove_edge('a', 'b')
+    assert (graph.version, graph.removals) == (4, 1)
+    assert not graph.has_edge('a', 'b')
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_reachability_matches_traversal(seed):
+    graph = random_graph(seed)
+    compact = graph.compact()
+    for start in range(15):
+        reachable = graph.breadth_first_search(start)
+        assert set(graph.depth_first_search(start)) == reachable
+        assert compact.breadth_first_search(start) == reachable
+        assert set(compact.depth_first_search(start)) == reachable
+        for target in range(15):
+            assert graph.is_reachable(start, target) == (target in reachable)
+            assert compact.is_reachable(start, target) == (target in reachable)
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_strongly_connected_components(seed):
+    graph = random_graph(seed)
+    reach = {v: graph.breadth_first_search(v) for v in graph.vertices}
+    components = graph.strongly_connected_components()
+
+    assert sorted(v for c in components for v in c) == sorted(graph.vertices)
+    for component in components:
+        first = component[0]
+        assert set(component) == {v for v in reach[first] if first in reach[v]}
+    assert all(len(c) >= 2 for c in graph.strongly_connected_components(min_size=2))
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_compact_components_match_undirected_reachability(seed):
+    graph = random_graph(seed)
+    compact = graph.compact()
+    undirected = Graph()
+    for u, edges in graph.graph.items():
+        for v, _ in edges:
+            undirected.add_edge(u, v)
+            undirected.add_edge(v, u)
+
+    labels = compact.connected_components()
+    for vertex in graph.vertices:
+        expected = undirected.breadth_first_search(vertex)
+        assert set(compact.component_members(vertex, labels)) == expected
+
+
+def test_compact_from_edges():
+    compact = CompactGraph.from_edges(['a', 'a', 'b'], ['b', 'c', 'c'], [1.0, 2.0, 3.0], ['z'])
+    assert compact.vertex_count == 4 and compact.edge_count == 3
+    assert sorted(compact.get_neighbors('a')) == [('b', 1.0), ('c', 2.0)]
+    assert compact.get_neighbors('z') == []
+    assert compact.bfs_levels('a').tolist() == [-1, 0, 1, 1]
+    assert not compact.is_reachable('a', 'missing')
+
+
+@pytest.fixture
+def service():
+    accounts = AccountService()
+    numbers = [
+        accounts.create_account(f'C{i}', initial_balance=100.0).account_number
+        for i in range(4)
+    ]
+    return TransactionService(accounts, compact_rebuild_edges=3), numbers
+
+
+def test_snapshot_is_not_rebuilt_per_edge(service):
+    transactions, (a, b, c, _) = service
+    transactions.transfer(a, b, 1.0)
+    assert transactions.is_reachable(a, b)
+    snapshot = transactions.compact_graph
+
+    transactions.transfer(b, c, 1.0)
+    assert transactions.is_reachable(a, c)
+    assert not transactions.is_reachable(c, a)
+    assert transactions.compact_graph is snapshot
+
+    transactions.transfer(c, a, 1.0)
+    transactions.transfer(a, c, 1.0)
+    assert transactions.is_reachable(c, b)
+    assert transactions.compact_graph is not snapshot
+    assert transactions.compact_graph_version == transactions.transaction_graph.version
+
+
+def test_stale_snapshot_honours_removals(service):
+    transactions, (a, b, c, _) = service
+    transactions.transfer(a, b, 1.0)
+    transactions.transfer(b, c, 1.0)
+    assert transactions.is_reachable(a, c)
+
+    transactions.transaction_graph.remove_edge(b, c)
+    assert not transactions.is_reachable(a, c)
+
+
+def test_snapshot_rebuilt_after_max_age(service):
+    transactions, (a, b, c, _) = service
+    transactions.compact_max_age = 0.0
+    transactions.transfer(a, b, 1.0)
+    transactions.is_reachable(a, b)
+    snapshot = transactions.compact_graph
+
+    transactions.transfer(b, c, 1.0)
+    assert transactions.is_reachable(a, c)
+    assert transactions.compact_graph is not snapshot
@@ -0,0 +1,98 @@
+import pytest
+
+from src.data_structures.hash_table import HashTable
+
+
+class Collider:
+    """Distinct keys sharing one hash, to exercise probing"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, Collider) and other.name == self.name
+
+
+def test_insert_get_and_overwrite():
+    table = HashTable()
+    table.insert('a', 1)
+    table['b'] = 2
+    table.insert('a', 3)
+
+    assert len(table) == 2
+    assert table.get('a') == 3
+    assert table['b'] == 2
+    assert table.get('missing', None) is None
+    with pytest.raises(KeyError):
+        table.get('missing')
+
+
+def test_grows_and_shrinks_with_load():
+    table = HashTable()
+    for i in range(1000):
+        table.insert(i, i * i)
+    assert table.size >= 1000 / table.max_load
+    assert all(table.get(i) == i * i for i in range(1000))
+
+    grown = table.size
+    for i in range(990):
+        table.remove(i)
+    assert table.size < grown
+    assert sorted(table.keys()) == list(range(990, 1000))
+
+
+def test_deleted_slots_are_reused_by_probing():
+    table = HashTable()
+    keys = [Collider(str(i)) for i in range(5)]
+    for i, key in enumerate(keys):
+        table.insert(key, i)
+
+    assert table.pop(keys[1]) == 1
+    assert keys[1] not in table
+    assert table.get(keys[4]) == 4
+
+    table.insert(keys[1], 'back')
+    assert table.get(keys[1]) == 'back'
+    assert len(table) == 5
+
+
+def test_churn_does_not_grow_without_bound():
+    table = HashTable()
+    for i in range(10000):
+        table.insert(i, i)
+        table.remove(i)
+    assert len(table) == 0
+    assert table.size == 8
+
+
+def test_iteration_follows_insertion_order():
+    table = HashTable()
+    for key in 'dbca':
+        table.insert(key, key.upper())
+    del table['b']
+
+    assert list(table) == ['d', 'c', 'a']
+    assert table.values() == ['D', 'C', 'A']
+    assert table.items() == [('d', 'D'), ('c', 'C'), ('a', 'A')]
+
+
+def test_setdefault_pop_update_and_clear():
+    table = HashTable()
+    assert table.setdefault('k', []) == []
+    table.setdefault('k', ['ignored']).append(1)
+    assert table.get('k') == [1]
+
+    assert table.pop('nope', 'default') == 'default'
+    with pytest.raises(KeyError):
+        table.pop('nope')
+
+    table.update({'x': 1, 'y': 2})
+    table.update((str(i), i) for i in range(100))
+    assert len(table) == 103
+
+    table.clear()
+    assert len(table) == 0
+    assert not table.contains('x')
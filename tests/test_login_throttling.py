@@ -0,0 +1,97 @@
+import pytest
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.data_structures.rate_limiter import TokenBucketLimiter
+from src.services.authentication_service import (
+    ANONYMOUS_CLIENT,
+    AuthenticationService,
+    login_client_id
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def auth(clock):
+    service = AuthenticationService(
+        password_hasher=PasswordHasher(SCRYPT, {'n': 2 ** 8, 'r': 8, 'p': 1})
+    )
+    service.user_login_limiter = TokenBucketLimiter(rate=1 / 12, capacity=5, clock=clock)
+    service.client_login_limiter = TokenBucketLimiter(rate=1.0, capacity=20, clock=clock)
+    service.register_user('alice', 'Secret1!x', 'alice@example.com')
+    return service
+
+
+def test_token_bucket_refills(clock):
+    limiter = TokenBucketLimiter(rate=2.0, capacity=3, clock=clock)
+    assert [limiter.allow('k') for _ in range(4)] == [True, True, True, False]
+    clock.now = 0.5
+    assert limiter.allow('k')
+    assert not limiter.allow('k')
+    assert limiter.allow('other')
+
+
+def test_invalid_limiter_settings():
+    with pytest.raises(ValueError):
+        TokenBucketLimiter(rate=0, capacity=5)
+
+
+def test_username_budget(auth, clock):
+    results = [auth.authenticate('alice', 'wrong', 'c1') for _ in range(5)]
+    assert results == [None] * 5
+    # Budget spent: even the right password is refused until it refills
+    assert auth.authenticate('alice', 'Secret1!x', 'c1') is None
+    clock.now = 12.0
+    assert auth.authenticate('alice', 'Secret1!x', 'c1') is not None
+    assert auth.login_stats() == {'served': 6, 'throttled': 1}
+
+
+def test_client_budget_spans_usernames(auth):
+    allowed = [auth._allow_login(f'user{i}', '10.0.0.1') for i in range(25)]
+    assert allowed.count(True) == 20
+    assert auth._allow_login('someone', '10.0.0.2')
+
+
+def test_requests_without_client_share_one_budget(auth):
+    allowed = [auth._allow_login(f'user{i}', None) for i in range(25)]
+    assert allowed.count(True) == 20
+    assert not auth._allow_login('fresh', None)
+    assert not auth.client_login_limiter.allow(ANONYMOUS_CLIENT)
+
+
+def test_throttling_can_be_disabled():
+    service = AuthenticationService(login_throttling=False)
+    assert service.user_login_limiter is None and service.client_login_limiter is None
+    assert all(service._allow_login('alice', None) for _ in range(50))
+
+
+def test_client_id_is_the_remote_address():
+    assert login_client_id('203.0.113.7') == '203.0.113.7'
+    assert login_client_id(None) == ANONYMOUS_CLIENT
+    assert login_client_id('') == ANONYMOUS_CLIENT
+
+
+def test_forwarded_for_is_ignored_from_untrusted_peers():
+    assert login_client_id('203.0.113.7', '198.51.100.1') == '203.0.113.7'
+    assert login_client_id('203.0.113.7', '198.51.100.1', {'10.0.0.1'}) == '203.0.113.7'
+    assert login_client_id(None, '198.51.100.1') == ANONYMOUS_CLIENT
+
+
+def test_forwarded_for_is_read_behind_trusted_proxies():
+    proxies = {'10.0.0.1', '10.0.0.2'}
+    # A spoofed leading hop is skipped: the client is the last untrusted hop
+    forwarded = '1.2.3.4, 198.51.100.9, 10.0.0.2'
+    assert login_client_id('10.0.0.1', forwarded, proxies) == '198.51.100.9'
+    assert login_client_id('10.0.0.1', ' , 198.51.100.9', proxies) == '198.51.100.9'
+    assert login_client_id('10.0.0.1', None, proxies) == '10.0.0.1'
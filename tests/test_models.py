@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from src.core.account import Account
+from src.core.customer import Customer
+from src.core.id_generator import IdGenerator
+from src.core.transaction import Transaction
+from src.core.user import User
+from src.services.account_service import AccountService
+
+
+@pytest.mark.parametrize('model', [Account, Customer, Transaction, User])
+def test_models_are_slotted(model):
+    instance = model()
+    assert not hasattr(instance, '__dict__')
+    with pytest.raises(AttributeError):
+        instance.unexpected = 1
+
+
+def test_detail_tuples_follow_detail_fields():
+    account = Account(customer_id='ann', balance=5.0)
+    transaction = Transaction.create_transaction('A', 'B', 2.5)
+    details = account.get_account_details()
+    assert account.as_tuple() == tuple(details[name] for name in Account.DETAIL_FIELDS)
+
+    details = transaction.get_transaction_details()
+    assert transaction.as_tuple() == tuple(details[name] for name in Transaction.DETAIL_FIELDS)
+
+
+def test_columnar_rows_expose_the_same_details():
+    accounts = AccountService(columnar=True)
+    row = accounts.create_account('ann', initial_balance=7.25)
+    assert row.as_tuple() == tuple(
+        row.get_account_details()[name] for name in Account.DETAIL_FIELDS
+    )
+
+
+def test_defaults_are_per_instance():
+    first, second = Customer(), Customer()
+    first.add_account('A1')
+    assert not first.add_account('A1')
+    assert second.accounts == []
+    assert first.remove_account('A1') and not first.remove_account('A1')
+    assert User().created_at and User(user_id='').user_id
+
+
+def test_ids_are_unique_and_sort_by_creation():
+    ids = [Account().account_number for _ in range(100)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 100
+
+
+def test_ids_stay_unique_across_threads():
+    generator = IdGenerator(prefix='T')
+    issued = []
+
+    def draw():
+        issued.extend(generator.next_id() for _ in range(500))
+
+    threads = [threading.Thread(target=draw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(issued)) == 2000
+
+
+def test_blocks_reservations_and_preallocation():
+    generator = IdGenerator(prefix='X')
+    block = generator.allocate_block(3)
+    first = int(block[0][1:], 16)
+    assert block == [generator.format(value) for value in range(first, first + 3)]
+
+    start = generator.reserve(2)
+    assert generator.format(start) > block[-1]
+
+    generator.preallocate(5)
+    pooled = generator.next_id()
+    assert pooled > generator.format(start + 1)
+
+
+def test_observe_skips_past_loaded_ids():
+    generator = IdGenerator(prefix='X')
+    generator.preallocate(10)
+    loaded = generator.format(generator.reserve(1) + 1000)
+    generator.observe([loaded, 'other-prefix', 'Xnot-hex'])
+
+    assert generator.next_id() > loaded
+
+
+def test_id_space_exhaustion_raises():
+    generator = IdGenerator(width=1, burst_bits=0)
+    generator._next = 15
+    generator.next_id()
+    with pytest.raises(OverflowError):
+        generator.next_id()
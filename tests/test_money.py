@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+import pytest
+
+from src.core.account import Account
+from src.data_structures.account_store import parse_amount, to_cents
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+@pytest.mark.parametrize('amount, expected', [
+    (0.285, Decimal('0.29')),
+    (1.005, Decimal('1.01')),
+    (2.675, Decimal('2.68')),
+    (-0.285, Decimal('-0.29')),
+    ('10', Decimal('10.00')),
+    (Decimal('0.004'), Decimal('0.00')),
+    (7, Decimal('7.00'))
+])
+def test_parse_amount_rounds_half_up(amount, expected):
+    assert parse_amount(amount) == expected
+
+
+@pytest.mark.parametrize('amount', [float('nan'), float('inf'), 'ten', None])
+def test_parse_amount_rejects_non_numbers(amount):
+    with pytest.raises(ValueError):
+        parse_amount(amount)
+
+
+def test_to_cents():
+    assert to_cents(0.1 + 0.2) == 30
+    assert to_cents(19.999) == 2000
+    assert to_cents(-0.005) == -1
+
+
+def test_account_balance_stays_on_the_cent():
+    account = Account(balance=0.30)
+    assert account.withdraw(0.10)
+    assert account.withdraw(0.20)
+    assert account.balance == 0.0
+
+    account.deposit(0.1)
+    account.deposit(0.2)
+    assert account.balance == 0.3
+
+
+def test_overdraft_is_compared_on_the_cent():
+    account = Account(balance=0.1, overdraft_limit=0.2)
+    assert account.withdraw(0.3)
+    assert account.balance == -0.2
+
+
+@pytest.fixture(params=[False, True], ids=['objects', 'columnar'])
+def bank(request):
+    accounts = AccountService(columnar=request.param)
+    a = accounts.create_account('A', initial_balance=0.30).account_number
+    b = accounts.create_account('B').account_number
+    return accounts, TransactionService(accounts), a, b
+
+
+def test_deposit_and_withdraw_round_amounts(bank):
+    accounts, _, a, _ = bank
+    assert accounts.deposit(a, 0.005)
+    assert accounts.find_account(a).balance == 0.31
+    assert accounts.withdraw(a, 0.3049)
+    assert accounts.find_account(a).balance == 0.01
+    with pytest.raises(ValueError):
+        accounts.deposit(a, float('nan'))
+
+
+def test_transfers_are_cent_exact(bank):
+    accounts, transactions, a, b = bank
+    assert transactions.transfer(a, b, 0.10).status == 'COMPLETED'
+    assert transactions.transfer(a, b, 0.20).status == 'COMPLETED'
+    assert accounts.find_account(a).balance == 0.0
+    assert accounts.find_account(b).balance == 0.3
+
+
+def test_transfer_rounds_sub_cent_amounts(bank):
+    accounts, transactions, a, b = bank
+    transaction = transactions.transfer(a, b, 0.105)
+    assert transaction.amount == 0.11
+    assert accounts.find_account(b).balance == 0.11
+    assert transactions.transfer(a, b, 0.004).status == 'FAILED'
+    with pytest.raises(ValueError):
+        transactions.transfer(a, b, float('inf'))
+
+
+def test_queued_transfers_round_amounts(bank):
+    accounts, transactions, a, b = bank
+    queued = transactions.process_transaction(a, b, 0.125)
+    assert queued.amount == 0.13
+    assert transactions.execute_transaction(transactions.take_transaction(0))
+    assert accounts.find_account(a).balance == 0.17
@@ -0,0 +1,74 @@
+import pytest
+
+from src.data_structures.ngram_index import NGramIndex
+from src.services.account_service import AccountService
+
+
+@pytest.fixture
+def index():
+    index = NGramIndex()
+    for doc_id, text in enumerate(['Alice', 'alicia', 'Bob', 'bobby', 'Carol', 'x']):
+        index.add(doc_id, text)
+    return index
+
+
+def brute_force(index, query, prefix):
+    query = query.lower()
+    return {
+        doc_id for doc_id in index.documents.iter_keys()
+        if (index.documents.get(doc_id).startswith(query) if prefix
+            else query in index.documents.get(doc_id))
+    }
+
+
+@pytest.mark.parametrize('query', ['a', 'b', 'x', 'z', 'ic', 'bo', 'ali', 'lic', 'alice', 'BOBB'])
+@pytest.mark.parametrize('prefix', [False, True], ids=['substring', 'prefix'])
+def test_search_matches_a_scan(index, query, prefix):
+    assert set(index.search(query, prefix=prefix)) == brute_force(index, query, prefix)
+
+
+def test_short_queries_use_postings_not_a_scan(index):
+    assert index._candidates('o', prefix=False) == {2, 3, 4}
+    assert index._candidates('b', prefix=True) == {2, 3}
+    assert index._candidates('ob', prefix=False) == {2, 3}
+    assert index._candidates('q', prefix=False) == set()
+
+
+def test_ranking_and_limit(index):
+    assert index.search('bob') == [2, 3]
+    assert index.search('a', prefix=True, limit=1) == [0]
+    assert index.search('') == []
+
+
+def test_remove_and_reindex(index):
+    index.add(2, 'Robert')
+    assert index.search('bo') == [3]
+    assert index.search('r', prefix=True) == [2]
+    assert index.remove(3)
+    assert not index.remove(3)
+    assert index.search('b') == [2]
+    assert len(index) == 5
+
+
+@pytest.mark.parametrize('columnar', [False, True], ids=['objects', 'columnar'])
+def test_account_search_modes(columnar):
+    accounts = AccountService(columnar=columnar)
+    first = accounts.create_account('alice', initial_balance=1.0)
+    second = accounts.create_account('malik', initial_balance=1.0)
+    accounts.create_account('bob', initial_balance=1.0)
+
+    def numbers(results):
+        return [account.account_number for account in results]
+
+    assert numbers(accounts.search_accounts('alice', 'customer_id')) == [first.account_number]
+    assert numbers(accounts.search_accounts('al', 'customer_id', match='prefix')) == [
+        first.account_number
+    ]
+    assert numbers(accounts.search_accounts('li', 'customer_id', match='substring')) == [
+        first.account_number, second.account_number
+    ]
+    assert first.account_number in numbers(accounts.search_accounts(
+        first.account_number[-2:], 'account_number', match='substring'
+    ))
+    with pytest.raises(ValueError):
+        accounts.search_accounts('a', 'customer_id', match='fuzzy')
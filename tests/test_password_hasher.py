@@ -0,0 +1,98 @@
+import pytest
+
+from src.algorithms import encryption_utils
+from src.algorithms.encryption_utils import (
+    PBKDF2,
+    SCRYPT,
+    EncryptionUtils,
+    PasswordHasher
+)
+from src.services.service_container import ServiceContainer
+
+FAST_SCRYPT = {'n': 2 ** 8, 'r': 8, 'p': 1}
+
+
+@pytest.fixture
+def pooled():
+    hashers = []
+
+    def make(workers=2, **kwargs):
+        hasher = PasswordHasher(SCRYPT, FAST_SCRYPT, workers=workers, **kwargs)
+        hashers.append(hasher)
+        return hasher
+
+    yield make
+    for hasher in hashers:
+        hasher.close()
+
+
+def test_inline_by_default():
+    hasher = PasswordHasher(SCRYPT, FAST_SCRYPT)
+    encoded = hasher.hash('Secret1!', 'salt')
+    assert hasher.verify('Secret1!', encoded, 'salt')
+    assert not hasher.verify('secret1!', encoded, 'salt')
+    assert hasher._pool is None
+
+
+def test_encoded_hash_records_settings():
+    encoded = PasswordHasher(SCRYPT, FAST_SCRYPT).hash('pw', 'salt')
+    algorithm, parameters, _ = EncryptionUtils.parse_hash(encoded)
+    assert algorithm == SCRYPT
+    assert parameters == FAST_SCRYPT
+
+
+def test_pool_is_shared_and_released(pooled):
+    first, second = pooled(), pooled()
+    assert first.verify('pw', second.hash('pw', 'salt'), 'salt')
+    assert first._pool is second._pool is encryption_utils._pool
+
+    first.close()
+    assert encryption_utils._pool is not None
+    second.close()
+    assert encryption_utils._pool is None
+
+    # A closed hasher picks the pool up again on its next call
+    assert second.hash('pw', 'salt') == first.hash('pw', 'salt')
+    assert encryption_utils._pool is not None
+
+
+def test_hash_many_matches_single_hashes(pooled):
+    hasher = pooled()
+    passwords = [f'pw{i}' for i in range(40)]
+    salts = [f'salt{i}' for i in range(40)]
+    hashes = hasher.hash_many(passwords, salts, chunk_size=7)
+    assert hashes == [hasher.hash(p, s) for p, s in zip(passwords, salts)]
+
+
+def test_hash_many_rejects_mismatched_columns():
+    with pytest.raises(ValueError):
+        PasswordHasher(SCRYPT, FAST_SCRYPT).hash_many(['a', 'b'], ['s'])
+
+
+def test_needs_rehash():
+    hasher = PasswordHasher(SCRYPT, FAST_SCRYPT)
+    assert not hasher.needs_rehash(hasher.hash('pw', 'salt'))
+    assert hasher.needs_rehash(PasswordHasher(SCRYPT, {'n': 2 ** 9, 'r': 8, 'p': 1}).hash('pw', 'salt'))
+    assert hasher.needs_rehash(PasswordHasher(PBKDF2, {'iterations': 1000}).hash('pw', 'salt'))
+    assert hasher.needs_rehash(EncryptionUtils.legacy_hash_password('pw', 'salt'))
+
+
+def test_verifies_legacy_hashes():
+    legacy = EncryptionUtils.legacy_hash_password('pw', 'salt')
+    assert PasswordHasher(SCRYPT, FAST_SCRYPT).verify('pw', legacy, 'salt')
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        PasswordHasher('md5')
+
+
+def test_container_hashes_on_a_pool():
+    container = ServiceContainer(hash_workers=2)
+    try:
+        hasher = container.auth_service.password_hasher
+        assert hasher.workers == 2
+    finally:
+        container.shutdown()
+    assert ServiceContainer().hash_workers >= 1
+    assert ServiceContainer(hash_workers=0).hash_workers == 0
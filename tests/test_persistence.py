@@ -0,0 +1,128 @@
+import glob
+import os
+
+import pytest
+
+from src.services.account_service import AccountService
+from src.storage.persistence_manager import PersistenceManager
+
+
+def open_bank(data_dir, columnar=False):
+    manager = PersistenceManager(str(data_dir), fsync=False)
+    accounts = AccountService(columnar=columnar)
+    manager.attach(account_service=accounts)
+    return manager, accounts
+
+
+def recovered_balances(data_dir, columnar=False):
+    manager, accounts = open_bank(data_dir, columnar)
+    manager.recover()
+    balances = {
+        account.account_number: account.balance
+        for account in accounts.account_tree.values()
+    }
+    manager.close()
+    return balances
+
+
+def newest_segment(data_dir):
+    return sorted(glob.glob(os.path.join(str(data_dir), 'wal', 'wal-*.log')))[-1]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    manager, accounts = open_bank(tmp_path)
+    first = accounts.create_account('C1', initial_balance=100.0).account_number
+    second = accounts.create_account('C2', initial_balance=50.0).account_number
+    accounts.deposit(first, 25.5)
+    accounts.withdraw(second, 10.0)
+    manager.close()
+    return tmp_path, first, second
+
+
+def test_replay_restores_logged_balances(ledger):
+    data_dir, first, second = ledger
+    assert recovered_balances(data_dir) == {first: 125.5, second: 40.0}
+
+
+def test_torn_tail_after_crash_is_dropped(ledger):
+    data_dir, first, second = ledger
+    with open(newest_segment(data_dir), 'ab') as segment:
+        segment.write(b'0badc0de\t{"op":"deposit","account_nu')
+
+    assert recovered_balances(data_dir) == {first: 125.5, second: 40.0}
+
+    # The torn bytes are cut off, so later appends start on a clean line
+    manager, accounts = open_bank(data_dir)
+    manager.recover()
+    accounts.deposit(first, 1.0)
+    manager.close()
+    assert recovered_balances(data_dir) == {first: 126.5, second: 40.0}
+
+
+def test_corruption_before_the_tail_is_an_error(ledger):
+    data_dir, _, _ = ledger
+    path = newest_segment(data_dir)
+    with open(path, 'rb') as segment:
+        lines = segment.readlines()
+    lines[1] = lines[1].replace(b'C2', b'C3')
+    with open(path, 'wb') as segment:
+        segment.writelines(lines)
+
+    with pytest.raises(ValueError, match='Corrupt write-ahead log record'):
+        recovered_balances(data_dir)
+
+
+def test_snapshot_plus_log_tail(tmp_path):
+    manager, accounts = open_bank(tmp_path)
+    number = accounts.create_account('C1', initial_balance=10.0).account_number
+    accounts.deposit(number, 5.0)
+    manager.snapshot()
+    accounts.deposit(number, 2.25)
+    manager.close()
+
+    manager, accounts = open_bank(tmp_path)
+    stats = manager.recover()
+    manager.close()
+
+    assert stats['accounts'] == 1
+    assert stats['replayed'] == 1
+    assert accounts.find_account(number).balance == 17.25
+
+
+@pytest.mark.parametrize('columnar', [False, True], ids=['objects', 'columnar'])
+def test_interest_replay_is_idempotent(tmp_path, columnar):
+    manager, accounts = open_bank(tmp_path, columnar)
+    saver = accounts.create_account('C1', initial_balance=1000.0).account_number
+    checking = accounts.create_account(
+        'C2', account_type='Checking', initial_balance=200.0
+    ).account_number
+    assert accounts.apply_interest(0.015, 'Savings') == 15.0
+    manager.close()
+
+    expected = {saver: 1015.0, checking: 200.0}
+    assert recovered_balances(tmp_path, columnar) == expected
+
+    # Replaying the interest record onto balances that already include it
+    # must not pay the interest again
+    manager, accounts = open_bank(tmp_path, columnar)
+    manager.recover()
+    for record in manager.wal.replay():
+        manager.apply(record)
+    assert accounts.find_account(saver).balance == 1015.0
+    manager.close()
+
+
+@pytest.mark.parametrize('columnar', [False, True], ids=['objects', 'columnar'])
+def test_interest_rounds_the_same_in_both_storage_modes(columnar):
+    accounts = AccountService(columnar=columnar)
+    numbers = [
+        accounts.create_account(f'C{i}', initial_balance=balance).account_number
+        for i, balance in enumerate((0.5, 1.0, 33.33, 100.01, 0.0))
+    ]
+    paid = accounts.apply_interest(0.015)
+
+    assert [accounts.find_account(n).balance for n in numbers] == [
+        0.51, 1.02, 33.83, 101.51, 0.0
+    ]
+    assert paid == 2.03
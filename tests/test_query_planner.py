@@ -0,0 +1,108 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from src.data_structures.query_planner import QueryPlanner
+
+ROLES = ['customer', 'admin', 'auditor']
+DOMAINS = ['example.com', 'bank.test']
+
+
+def make_people(count=200, seed=9):
+    rng = random.Random(seed)
+    return {
+        f'U{i:04d}': SimpleNamespace(
+            role=rng.choice(ROLES),
+            email=f'user{i}@{rng.choice(DOMAINS)}',
+            is_active=rng.random() < 0.8,
+            city=rng.choice(['Oslo', 'Lima'])
+        )
+        for i in range(count)
+    }
+
+
+@pytest.fixture
+def people():
+    return make_people()
+
+
+@pytest.fixture
+def planner(people):
+    planner = QueryPlanner()
+    planner.add_index('role')
+    planner.add_many(people.items())
+    planner.add_index('email_domain', lambda person: person.email.rpartition('@')[2])
+    planner.add_index('is_active')
+    return planner
+
+
+def brute_force(people, criteria):
+    def value(person, attribute):
+        if attribute == 'email_domain':
+            return person.email.rpartition('@')[2]
+        return getattr(person, attribute, '')
+
+    return [
+        person for _, person in sorted(people.items())
+        if all(str(value(person, a)).lower() == str(v).lower() for a, v in criteria.items())
+    ]
+
+
+@pytest.mark.parametrize('criteria', [
+    {'role': 'admin'},
+    {'role': 'ADMIN', 'is_active': True},
+    {'email_domain': 'bank.test', 'role': 'auditor', 'is_active': False},
+    {'role': 'customer', 'city': 'oslo'},
+    {'city': 'Lima'},
+    {'role': 'nobody'},
+    {'role': 'admin', 'email_domain': 'missing.test'},
+])
+def test_query_matches_a_scan(planner, people, criteria):
+    assert planner.query(criteria) == brute_force(people, criteria)
+
+
+def test_plan_drives_from_the_smallest_posting(planner):
+    plan = planner.plan({'is_active': True, 'role': 'admin', 'city': 'Oslo'})
+    ops = [(step['op'], step.get('index', step.get('attribute'))) for step in plan['steps']]
+
+    assert ops == [('index_scan', 'role'), ('intersect', 'is_active'), ('filter', 'city')]
+    assert plan['estimated_rows'] == planner.indexes['role'].count('admin')
+    assert planner.explain({'city': 'Oslo'}).startswith('full scan (200 rows)')
+
+
+def test_updates_keep_postings_in_sync(planner, people):
+    person = people['U0001']
+    person.role = 'director'
+    planner.reindex('U0001')
+    assert planner.query({'role': 'director'}) == [person]
+
+    assert planner.remove('U0001')
+    assert not planner.remove('U0001')
+    assert planner.query({'role': 'director'}) == []
+    assert len(planner) == 199
+
+    replacement = SimpleNamespace(role='admin', email='x@new.test', is_active=True, city='Oslo')
+    planner.add('U0002', replacement)
+    assert planner.query({'email_domain': 'new.test'}) == [replacement]
+    assert len(planner) == 199
+
+
+def test_registration_service_uses_the_planner():
+    from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+    from src.services.authentication_service import AuthenticationService
+    from src.services.registration_service import RegistrationService
+
+    auth = AuthenticationService(
+        password_hasher=PasswordHasher(SCRYPT, {'n': 2 ** 8, 'r': 8, 'p': 1})
+    )
+    registration = RegistrationService(auth)
+    for name in ('alice', 'bob'):
+        registration.register_user({
+            'username': name, 'password': 'Secret1!x',
+            'confirm_password': 'Secret1!x', 'email': f'{name}@bank.test'
+        })
+
+    users = registration.get_users_by_criteria({'email_domain': 'BANK.test', 'role': 'customer'})
+    assert sorted(user.username for user in users) == ['alice', 'bob']
+    assert 'index scan' in registration.explain_users_by_criteria({'role': 'customer'})
@@ -0,0 +1,204 @@
+import random
+
+import pytest
+
+from src.data_structures.ring_detector import RingDetector
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def brute_force_rings(edges, source, target, closed_at, window, hops):
+    """
+    Time-ordered paths target -> ... -> source of at most hops edges
+    """
+    out = {}
+    for timestamp, a, b in edges:
+        if closed_at - window <= timestamp <= closed_at:
+            out.setdefault(a, []).append((timestamp, b))
+
+    found = set()
+
+    def walk(vertex, path, arrived):
+        if len(path) - 1 >= hops:
+            return
+        for timestamp, following in out.get(vertex, ()):
+            if timestamp < arrived:
+                continue
+            if following == source:
+                found.add(tuple(path))
+            elif following not in path:
+                walk(following, path + [following], timestamp)
+
+    walk(target, [target], float('-inf'))
+    return found
+
+
+def unbounded(**kwargs):
+    return RingDetector(
+        max_rings_per_transfer=10 ** 9,
+        max_expansions=10 ** 9,
+        max_batch_expansions=10 ** 12,
+        max_alerts=10 ** 6,
+        **kwargs
+    )
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    accounts = rng.randint(3, 10)
+    max_length = rng.randint(2, 5)
+    window = rng.choice([5, 20, 1000])
+    detector = unbounded(window=window, max_length=max_length)
+
+    edges, now = [], 0
+    for i in range(rng.randint(1, 60)):
+        now += rng.choice([0, 1, 2])
+        source, target = rng.randrange(accounts), rng.randrange(accounts)
+        expected = (
+            brute_force_rings(edges, source, target, now, window, max_length - 1)
+            if source != target else set()
+        )
+        edges.append((now, source, target))
+
+        rings = detector.add_transfer(source, target, 1.0, i, now)
+        assert {tuple(ring['accounts'][:-1]) for ring in rings} == expected
+        assert len(rings) == len(expected)
+        for ring in rings:
+            assert ring['accounts'][-1] == source
+            assert ring['transactions'][-1] == i
+
+
+def test_two_party_ring():
+    detector = RingDetector(window=60)
+    assert detector.add_transfer('A', 'B', 100.0, 't1', 0.0) == []
+    [ring] = detector.add_transfer('B', 'A', 90.0, 't2', 5.0)
+    assert ring['accounts'] == ['A', 'B']
+    assert ring['transactions'] == ['t1', 't2']
+    assert ring['volume'] == 190.0
+    assert detector.recent_alerts() == [ring]
+
+
+def test_ring_must_be_time_ordered():
+    detector = RingDetector(window=60)
+    detector.add_transfer('B', 'C', 1.0, None, 0.0)
+    detector.add_transfer('A', 'B', 1.0, None, 1.0)
+    # A -> B -> C -> A needs B -> C after A -> B
+    assert detector.add_transfer('C', 'A', 1.0, None, 2.0) == []
+
+
+def test_edges_expire_from_the_window():
+    detector = RingDetector(window=10)
+    detector.add_transfer('A', 'B', 1.0, None, 0.0)
+    assert detector.add_transfer('B', 'A', 1.0, None, 20.0) == []
+    assert len(detector) == 1
+    assert detector.stats()['accounts_in_window'] == 2
+
+
+def test_out_of_order_timestamps_keep_the_window_sorted():
+    detector = RingDetector(window=10)
+    detector.add_transfer('A', 'B', 1.0, None, 100.0)
+    detector.add_transfer('C', 'D', 1.0, None, 50.0)
+    detector.add_transfer('E', 'F', 1.0, None, 105.0)
+
+    timestamps = [edge[0] for edge in detector.edges]
+    assert timestamps == sorted(timestamps)
+    assert min(timestamps) >= detector.newest - detector.window
+
+    # The late edge was recorded at 100, so it leaves with A -> B
+    detector.add_transfer('G', 'H', 1.0, None, 112.0)
+    assert [edge[1] for edge in detector.edges] == ['E', 'G']
+
+
+def test_out_of_order_transfer_still_closes_a_ring():
+    detector = RingDetector(window=60)
+    detector.add_transfer('A', 'B', 1.0, 'late-created', 100.0)
+    # Created before A -> B but settled after it
+    rings = detector.add_transfer('B', 'A', 1.0, 'early-created', 40.0)
+    assert [ring['transactions'] for ring in rings] == [['late-created', 'early-created']]
+    assert rings[0]['closed_at'] == 100.0
+
+
+def test_default_timestamp_comes_from_clock():
+    ticks = iter([5.0, 3.0])
+    detector = RingDetector(window=60, clock=lambda: next(ticks))
+    detector.add_transfer('A', 'B', 1.0)
+    detector.add_transfer('B', 'C', 1.0)
+    assert [edge[0] for edge in detector.edges] == [5.0, 5.0]
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_batch_matches_sequential_transfers(seed):
+    rng = random.Random(seed)
+    accounts = rng.randint(3, 10)
+    settings = {'window': 50, 'max_length': rng.randint(2, 5)}
+    batched, sequential = unbounded(**settings), unbounded(**settings)
+
+    now = 0
+    for batch in range(rng.randint(1, 6)):
+        now += rng.choice([0, 1, 30])
+        rows = [
+            (rng.randrange(accounts), rng.randrange(accounts))
+            for _ in range(rng.randint(0, 20))
+        ]
+        ids = [f'{batch}-{i}' for i in range(len(rows))]
+
+        rings = batched.add_batch(
+            [s for s, _ in rows], [t for _, t in rows], [1.0] * len(rows), ids, now
+        )
+        expected = []
+        for (source, target), transaction_id in zip(rows, ids):
+            expected += sequential.add_transfer(source, target, 1.0, transaction_id, now)
+        assert rings == expected
+
+
+def test_batch_budget_leaves_rows_unsearched():
+    detector = RingDetector(max_batch_expansions=5)
+    rows = list(range(100))
+    detector.add_batch(rows, [r + 1 for r in rows], [1.0] * 100, timestamp=0.0)
+    assert len(detector) == 100
+    assert detector.stats()['unsearched_transfers'] == 95
+
+
+def test_rejects_short_max_length():
+    with pytest.raises(ValueError):
+        RingDetector(max_length=1)
+
+
+@pytest.fixture
+def service():
+    accounts = AccountService()
+    numbers = [
+        accounts.create_account(f'C{i}', initial_balance=100.0).account_number
+        for i in range(3)
+    ]
+    return TransactionService(accounts), numbers
+
+
+def test_queued_transfers_feed_the_detector_once_settled(service):
+    transactions, (a, b, _) = service
+    transactions.process_transaction(a, b, 5.0)
+    transactions.process_transaction(b, a, 5.0)
+    assert transactions.ring_detector.transfers_seen == 0
+
+    while (transaction := transactions.take_transaction(0)) is not None:
+        transactions.execute_transaction(transaction)
+    assert transactions.ring_detector.transfers_seen == 2
+    assert len(transactions.get_flagged_rings()) == 1
+
+
+def test_failed_transfers_do_not_feed_the_detector(service):
+    transactions, (a, b, _) = service
+    assert transactions.transfer(a, b, 10 ** 6).status == 'FAILED'
+    assert transactions.ring_detector.transfers_seen == 0
+
+
+def test_settled_batch_feeds_the_detector(service):
+    transactions, (a, b, c) = service
+    result = transactions.process_batch([a, b, c], [b, c, a], [1.0, 1.0, 1.0])
+    assert result['completed'] == 3
+    [ring] = transactions.get_flagged_rings()
+    assert ring['length'] == 3
+
+    transactions.process_batch([a], [b], [1.0], settle=False)
+    assert transactions.ring_detector.transfers_seen == 3
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from src.schemas.schema_engine import (
+    EqualsField,
+    Field,
+    MaxLength,
+    MinLength,
+    OneOf,
+    Pattern,
+    Required,
+    Schema
+)
+from src.schemas.user_registration import USER_REGISTRATION_SCHEMA, UserRegistrationSchema
+
+VALID = {
+    'username': 'alice_1',
+    'password': 'Secret1!x',
+    'confirm_password': 'Secret1!x',
+    'email': 'alice@example.com',
+}
+
+
+@pytest.mark.parametrize('changes, field, message', [
+    ({'username': ''}, 'username', 'Username is required'),
+    ({'username': 'al'}, 'username', 'Username must be at least 3 characters'),
+    ({'username': 'al ice'}, 'username', 'Username can only contain letters, numbers, and underscores'),
+    ({'password': 'secret1!x', 'confirm_password': 'secret1!x'}, 'password',
+     'Password must contain at least one uppercase letter'),
+    ({'confirm_password': 'other'}, 'confirm_password', 'Passwords do not match'),
+    ({'email': 'alice@'}, 'email', 'Invalid email format'),
+    ({'phone_number': '12'}, 'phone_number', 'Invalid phone number format'),
+    ({'role': 'admin'}, 'role', 'Invalid role'),
+])
+def test_registration_rules(changes, field, message):
+    assert USER_REGISTRATION_SCHEMA.validate({**VALID, **changes}) == {field: message}
+
+
+def test_optional_fields_and_the_dataclass_front_end():
+    assert USER_REGISTRATION_SCHEMA.validate({**VALID, 'phone_number': '', 'role': None}) == {}
+    assert USER_REGISTRATION_SCHEMA.validate({**VALID, 'phone_number': '+15551234567'}) == {}
+    assert UserRegistrationSchema(**VALID).validate() == {}
+    assert UserRegistrationSchema(**{**VALID, 'email': 'x'}).validate() == {
+        'email': 'Invalid email format'
+    }
+
+
+def test_batch_matches_single_record_validation():
+    rng = random.Random(5)
+    choices = {
+        'username': ['', 'ab', 'alice', 'bad name', 'bob_2'],
+        'password': ['', 'short', 'Secret1!x', 'NoDigits!', 'Secret12x'],
+        'confirm_password': ['Secret1!x', 'other', None],
+        'email': ['', 'a@b.co', 'broken', 42],
+        'phone_number': [None, '', '5551234567', 'abc'],
+    }
+    records = [
+        {name: rng.choice(values) for name, values in choices.items()}
+        for _ in range(300)
+    ]
+    expected = {
+        i: errors for i, record in enumerate(records)
+        if (errors := USER_REGISTRATION_SCHEMA.validate(record))
+    }
+    assert USER_REGISTRATION_SCHEMA.validate_batch(records) == expected
+
+
+def test_first_failing_rule_wins_and_columns_can_be_passed_directly():
+    schema = Schema(
+        Field('code', Required('missing'), MaxLength(3, 'long'), OneOf(['ab', 'abc'], 'unknown')),
+        Field('copy', EqualsField('code', 'differs')),
+        Field('note', MinLength(2, 'short'), Pattern(r'\d', 'no digit', search=True), optional=True),
+    )
+    columns = {
+        'code': ['', 'abcd', 'xy', 'ab'],
+        'copy': ['', 'abcd', 'xy', 'zz'],
+        'note': ['', 'x', 'ok', 'v2'],
+    }
+    assert schema.validate_columns(columns, 4) == {
+        0: {'code': 'missing'},
+        1: {'code': 'long', 'note': 'short'},
+        2: {'code': 'unknown', 'note': 'no digit'},
+        3: {'copy': 'differs'},
+    }
+    assert schema.validate_batch([]) == {}
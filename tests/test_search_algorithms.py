@@ -0,0 +1,72 @@
+import bisect
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.algorithms.search_algorithms import SearchAlgorithms
+
+rng = random.Random(11)
+SORTED = sorted(rng.randrange(0, 200) for _ in range(100))
+TARGETS = [rng.randrange(-10, 210) for _ in range(50)]
+
+
+@pytest.mark.parametrize('haystack, targets', [
+    (SORTED, TARGETS),
+    (np.array(SORTED), np.array(TARGETS)),
+    ([Decimal(v) for v in SORTED], [Decimal(v) for v in TARGETS]),
+    ([Decimal(v) for v in SORTED], [Decimal(v) for v in sorted(TARGETS)] * 3),
+    (sorted(str(v) for v in SORTED), [str(v) for v in TARGETS]),
+], ids=['list', 'ndarray', 'objects', 'objects-dense-sorted', 'strings'])
+def test_batch_bounds_match_bisect(haystack, targets):
+    haystack_list = list(haystack)
+    assert list(SearchAlgorithms.batch_lower_bound(haystack, targets)) == [
+        bisect.bisect_left(haystack_list, t) for t in targets
+    ]
+    assert list(SearchAlgorithms.batch_upper_bound(haystack, targets)) == [
+        bisect.bisect_right(haystack_list, t) for t in targets
+    ]
+
+    found = SearchAlgorithms.batch_search(haystack, targets)
+    for target, index in zip(targets, found):
+        if target in haystack_list:
+            assert haystack_list[index] == target
+            assert index == haystack_list.index(target)
+        else:
+            assert index == -1
+
+
+def test_batch_search_on_empty_input():
+    assert list(SearchAlgorithms.batch_search([], [1, 2])) == [-1, -1]
+    assert list(SearchAlgorithms.batch_search([Decimal(1)], [])) == []
+
+
+def test_single_target_bounds_and_windows():
+    values = [1, 2, 2, 2, 5, 8]
+    assert SearchAlgorithms.lower_bound(values, 2) == 1
+    assert SearchAlgorithms.upper_bound(values, 2) == 4
+    assert SearchAlgorithms.lower_bound(values, 2, lo=2) == 2
+    assert SearchAlgorithms.upper_bound(values, 8, hi=3) == 3
+    assert SearchAlgorithms.equal_range(values, 2, 5) == range(1, 5)
+    assert SearchAlgorithms.equal_range(values, 6, 7) == range(5, 5)
+
+
+@pytest.mark.parametrize('search', [
+    SearchAlgorithms.binary_search,
+    SearchAlgorithms.exponential_search,
+    SearchAlgorithms.jump_search,
+    SearchAlgorithms.interpolation_search,
+])
+def test_point_searches(search):
+    values = list(range(0, 100, 3))
+    assert values[search(values, 42)] == 42
+    assert search(values, 43) is None
+    assert search(values, 0) == 0
+    assert search(values, 99) == len(values) - 1
+
+
+def test_binary_search_window():
+    values = [1, 3, 5, 7, 9]
+    assert SearchAlgorithms.binary_search(values, 7, lo=1, hi=4) == 3
+    assert SearchAlgorithms.binary_search(values, 9, hi=4) is None
@@ -0,0 +1,72 @@
+import pytest
+
+from src.data_structures.secondary_index import SecondaryIndex
+from src.services.account_service import AccountService
+
+
+@pytest.fixture(params=[False, True], ids=['objects', 'columnar'])
+def accounts(request):
+    return AccountService(columnar=request.param)
+
+
+def numbers(accounts):
+    return [account.account_number for account in accounts]
+
+
+def test_customer_accounts_come_from_the_index(accounts):
+    opened = [
+        accounts.create_account(customer, initial_balance=balance)
+        for customer, balance in [('ann', 30.0), ('bob', 5.0), ('ann', 10.0), ('ann', 20.0)]
+    ]
+    anns = [opened[0], opened[2], opened[3]]
+
+    assert numbers(accounts.find_by_index('customer_id', 'ann')) == sorted(numbers(anns))
+    assert [a.balance for a in accounts.get_customer_accounts('ann')] == [10.0, 20.0, 30.0]
+    assert accounts.get_customer_accounts('nobody') == []
+    assert accounts.indexes['customer_id'].count('ann') == 3
+
+
+def test_close_moves_the_account_between_postings(accounts):
+    first = accounts.create_account('ann', account_type='Checking')
+    second = accounts.create_account('ann')
+    assert accounts.close_account(first.account_number)
+    assert not accounts.close_account(first.account_number)
+
+    active = accounts.indexes['is_active']
+    assert numbers(active.lookup(True)) == [second.account_number]
+    assert numbers(active.lookup(False)) == [first.account_number]
+    assert numbers(accounts.search_accounts('Checking', 'account_type')) == [
+        first.account_number
+    ]
+    assert numbers(accounts.search_accounts('check', 'account_type', match='prefix')) == [
+        first.account_number
+    ]
+
+
+def test_added_index_is_backfilled(accounts):
+    accounts.create_account('ann', initial_balance=150.0)
+    accounts.create_account('bob', initial_balance=50.0)
+    index = accounts.add_index(
+        'tier', key_func=lambda account: 'gold' if account.balance >= 100 else 'basic'
+    )
+    accounts.create_account('cid', initial_balance=500.0)
+
+    assert [a.customer_id for a in index.lookup('gold')] == ['ann', 'cid']
+    assert index.count('basic') == 1
+
+
+def test_index_remove_drops_empty_postings():
+    class Item:
+        def __init__(self, colour):
+            self.colour = colour
+
+    index = SecondaryIndex('colour')
+    index.add(2, Item('red'))
+    index.add(1, Item('red'))
+    assert list(index.primary_keys('red')) == [1, 2]
+
+    assert index.remove(1, 'red')
+    assert not index.remove(1, 'red')
+    assert index.remove(2, 'red')
+    assert list(index.distinct_values()) == []
+    assert list(index.lookup('red')) == []
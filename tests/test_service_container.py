@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from src.services import service_container
+from src.services.service_container import ServiceContainer, get_container
+
+
+@pytest.fixture
+def container():
+    container = ServiceContainer(hash_workers=0)
+    yield container
+    container.shutdown()
+
+
+def test_services_are_built_once_and_wired_together(container):
+    accounts = container.account_service
+    assert container.account_service is accounts
+    assert container.transaction_service.account_service is accounts
+    assert container.registration_service.auth_service is container.auth_service
+
+
+def test_concurrent_first_use_builds_one_set(container):
+    seen = []
+    start = threading.Barrier(8)
+
+    def resolve():
+        start.wait()
+        seen.append(container.account_service)
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(service) for service in seen}) == 1
+
+
+def test_data_dir_state_survives_a_new_container(tmp_path):
+    first = ServiceContainer(str(tmp_path), hash_workers=0).warm_up()
+    number = first.account_service.create_account('ann', initial_balance=12.5).account_number
+    first.shutdown()
+
+    second = ServiceContainer(str(tmp_path), hash_workers=0)
+    try:
+        assert second.account_service.find_account(number).balance == 12.5
+    finally:
+        second.shutdown()
+
+
+def test_get_container_is_process_wide(monkeypatch, tmp_path):
+    monkeypatch.setattr(service_container, '_container', None)
+    monkeypatch.setenv('BANKING_DATA_DIR', str(tmp_path))
+    monkeypatch.setenv('BANKING_HASH_WORKERS', '0')
+
+    container = get_container()
+    assert get_container() is container
+    assert container.data_dir == str(tmp_path)
+    assert container.hash_workers == 0
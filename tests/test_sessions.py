@@ -0,0 +1,109 @@
+import pytest
+
+from src.algorithms.encryption_utils import SCRYPT, PasswordHasher
+from src.data_structures.ttl_cache import TTLCache
+from src.services.authentication_service import AuthenticationService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def auth(clock):
+    service = AuthenticationService(
+        password_hasher=PasswordHasher(SCRYPT, {'n': 2 ** 8, 'r': 8, 'p': 1}),
+        session_ttl=60.0,
+        max_sessions=3,
+        login_throttling=False
+    )
+    service.sessions.clock = clock
+    service.register_user('alice', 'Secret1!x', 'alice@example.com')
+    return service
+
+
+def test_entries_expire_lazily(clock):
+    evicted = []
+    cache = TTLCache(ttl=10.0, clock=clock, on_evict=lambda k, v: evicted.append(k))
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=30.0)
+
+    clock.now = 10.0
+    assert 'a' not in cache
+    assert cache.get('b') == 2
+    assert evicted == ['a']
+
+    clock.now = 30.0
+    assert cache.purge_expired() == 1
+    assert len(cache) == 0 and evicted == ['a', 'b']
+
+
+def test_lru_eviction_respects_reads(clock):
+    evicted = []
+    cache = TTLCache(maxsize=2, clock=clock, on_evict=lambda k, v: evicted.append(k))
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert evicted == ['b']
+    assert cache.get('a') == 1 and cache.get('c') == 3
+
+
+def test_pop_does_not_report_live_entries(clock):
+    evicted = []
+    cache = TTLCache(ttl=5.0, clock=clock, on_evict=lambda k, v: evicted.append(k))
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.pop('a') == 1
+    clock.now = 5.0
+    assert cache.pop('b', 'gone') == 'gone'
+    assert evicted == ['b']
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
+
+
+def test_session_lifecycle(auth, clock):
+    user = auth.authenticate('alice', 'Secret1!x')
+    token = auth.issue_session(user)
+    assert auth.validate_session(token) is user
+    assert auth.validate_session(None) is None
+    assert auth.validate_session('forged') is None
+
+    clock.now = 60.0
+    assert auth.validate_session(token) is None
+    assert auth.user_sessions.get('alice', None) is None
+
+
+def test_revocation_and_password_change(auth):
+    user = auth.authenticate('alice', 'Secret1!x')
+    first, second = auth.issue_session(user), auth.issue_session(user)
+
+    assert auth.revoke_session(first)
+    assert not auth.revoke_session(first)
+    assert auth.validate_session(second) is user
+
+    assert auth.change_password('alice', 'Secret1!x', 'Another2!y')
+    assert auth.validate_session(second) is None
+    assert auth.user_sessions.get('alice', None) is None
+
+
+def test_session_cap_evicts_oldest(auth):
+    user = auth.authenticate('alice', 'Secret1!x')
+    tokens = [auth.issue_session(user) for _ in range(4)]
+
+    assert auth.validate_session(tokens[0]) is None
+    assert all(auth.validate_session(token) is user for token in tokens[1:])
+    assert auth.user_sessions.get('alice') == set(tokens[1:])
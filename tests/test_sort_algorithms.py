@@ -0,0 +1,82 @@
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.algorithms.sort_algorithms import SortAlgorithms
+
+rng = random.Random(3)
+RECORDS = [(rng.randint(0, 9), i) for i in range(300)]
+
+
+@pytest.mark.parametrize('sort', [SortAlgorithms.merge_sort, SortAlgorithms.sort_by])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_stable_sorts_match_sorted(sort, reverse):
+    result = sort(RECORDS, key=lambda record: record[0], reverse=reverse)
+    assert result == sorted(RECORDS, key=lambda record: record[0], reverse=reverse)
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_quick_sort_orders_keys(reverse):
+    result = SortAlgorithms.quick_sort(RECORDS, key=lambda record: record[0], reverse=reverse)
+    assert [r[0] for r in result] == sorted((r[0] for r in RECORDS), reverse=reverse)
+    assert sorted(result) == sorted(RECORDS)
+
+
+@pytest.mark.parametrize('values', [[], [1], list(range(1000)), [5] * 50])
+def test_quick_and_merge_sort_edge_inputs(values):
+    assert SortAlgorithms.quick_sort(values) == sorted(values)
+    assert SortAlgorithms.merge_sort(values[::-1]) == sorted(values)
+
+
+def test_key_is_computed_once_per_item():
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return -value
+
+    assert SortAlgorithms.sort_by([3, 1, 2], key=key) == [3, 2, 1]
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize('values', [
+    [3.5, 1.0, 2.25, 1.0],
+    [datetime(2024, 1, 1) + timedelta(days=d) for d in (3, 1, 2, 1)],
+    ['c', 'a', 'b', 'a'],
+])
+def test_argsort_is_stable_in_both_directions(values):
+    ascending = list(SortAlgorithms.argsort(values))
+    descending = list(SortAlgorithms.argsort(values, reverse=True))
+
+    assert ascending == sorted(range(4), key=values.__getitem__)
+    assert descending == sorted(range(4), key=values.__getitem__, reverse=True)
+    # Ties keep their original order in both directions
+    assert ascending.index(1) < ascending.index(3)
+    assert descending.index(1) < descending.index(3)
+
+
+def test_argsort_uses_numpy_for_numeric_columns():
+    assert isinstance(SortAlgorithms.argsort([2, 1]), np.ndarray)
+    assert isinstance(SortAlgorithms.argsort(['b', 'a']), list)
+    assert isinstance(SortAlgorithms.argsort([True, False]), list)
+
+
+@pytest.mark.parametrize('reverse', [False, [False, True]])
+def test_multi_argsort_matches_tuple_sort(reverse):
+    primary = [r[0] for r in RECORDS]
+    secondary = [r[1] % 7 for r in RECORDS]
+    perm = SortAlgorithms.multi_argsort([primary, secondary], reverse)
+
+    flip = -1 if reverse else 1
+    expected = sorted(range(len(RECORDS)), key=lambda i: (primary[i], flip * secondary[i]))
+    assert list(perm) == expected
+
+
+def test_apply_permutation_keeps_container_type():
+    perm = SortAlgorithms.argsort([3, 1, 2])
+    assert SortAlgorithms.apply_permutation(['c', 'a', 'b'], perm) == ['a', 'b', 'c']
+    reordered = SortAlgorithms.apply_permutation(np.array([30, 10, 20]), perm)
+    assert isinstance(reordered, np.ndarray)
+    assert reordered.tolist() == [10, 20, 30]
@@ -0,0 +1,74 @@
+import pytest
+
+from src.services.account_service import AccountService
+from src.services.transaction_executor import TransactionExecutor
+from src.services.transaction_service import TransactionService
+
+
+@pytest.fixture
+def bank():
+    accounts = AccountService()
+    numbers = [
+        accounts.create_account(f'C{i}', initial_balance=1000.0).account_number
+        for i in range(4)
+    ]
+    return accounts, TransactionService(accounts), numbers
+
+
+def settled_count(stats):
+    return sum(summary['count'] for summary in stats.values())
+
+
+@pytest.mark.parametrize('mode', ['thread', 'asyncio'])
+def test_drains_the_queue(bank, mode):
+    accounts, transactions, numbers = bank
+    for i in range(40):
+        transactions.process_transaction(
+            numbers[i % 4], numbers[(i + 1) % 4], 1.0,
+            'INTERNATIONAL' if i % 5 == 0 else 'TRANSFER'
+        )
+
+    executor = TransactionExecutor(transactions, workers=3, mode=mode)
+    executor.start()
+    executor.shutdown()
+
+    assert transactions.transaction_queue.size() == 0
+    assert not transactions.enqueue_times
+    assert settled_count(executor.stats()) == 40
+    assert sum(accounts.find_account(n).balance for n in numbers) == 4000.0
+
+
+def test_higher_priority_is_taken_first(bank):
+    _, transactions, numbers = bank
+    transactions.process_transaction(numbers[0], numbers[1], 900.0)
+    transactions.process_transaction(numbers[0], numbers[1], 1.0, 'INTERNATIONAL')
+
+    assert transactions.take_transaction(0).transaction_type == 'INTERNATIONAL'
+
+
+@pytest.mark.parametrize('mode', ['thread', 'asyncio'])
+def test_settlement_error_is_counted_and_workers_keep_going(bank, monkeypatch, mode):
+    _, transactions, numbers = bank
+    queued = [
+        transactions.process_transaction(numbers[0], numbers[1], 1.0)
+        for _ in range(10)
+    ]
+    poisoned = queued[3].transaction_id
+    execute = transactions.execute_transaction
+
+    def flaky_execute(transaction):
+        if transaction.transaction_id == poisoned:
+            raise OSError('journal closed')
+        return execute(transaction)
+
+    monkeypatch.setattr(transactions, 'execute_transaction', flaky_execute)
+    executor = TransactionExecutor(transactions, workers=1, mode=mode)
+    executor.start()
+    executor.shutdown()
+
+    stats = executor.stats()
+    assert settled_count(stats) == 10
+    assert sum(summary['failed'] for summary in stats.values()) == 1
+    assert queued[3].status == 'FAILED'
+    assert all(t.status == 'COMPLETED' for t in queued if t.transaction_id != poisoned)
+    assert transactions.transaction_queue.size() == 0
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.core.transaction import Transaction
+from src.data_structures.transaction_history import TransactionHistory
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def read_all(history, account_number, limit):
+    pages, cursor = [], None
+    while True:
+        page, cursor = history.page(account_number, limit, cursor)
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def history():
+    history = TransactionHistory()
+    for i in range(5):
+        history.append(Transaction.create_transaction('A', 'B', float(i + 1)))
+    history.append_batch(
+        ['A', 'B', 'C'], np.array([0, 1, 0]), np.array([1, 2, 2]),
+        np.array([10.0, 20.0, 30.0])
+    )
+    history.append(Transaction.create_transaction('C', 'A', 99.0))
+    return history
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, 100])
+def test_cursor_pages_cover_history_newest_first(history, limit):
+    pages = read_all(history, 'A', limit)
+    amounts = [t.amount for page in pages for t in page]
+
+    assert amounts == [99.0, 30.0, 10.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    assert all(len(page) == limit for page in pages[:-1])
+    assert history.count('A') == 8
+
+
+def test_batch_rows_render_stable_ids(history):
+    first = [t.transaction_id for t in history.latest('C', 10)]
+    second = [t.transaction_id for t in history.latest('C', 10)]
+    assert first == second
+    assert len(set(first)) == 3
+    assert [t.from_account for t in history.latest('C', 10)] == ['C', 'A', 'B']
+
+
+def test_cursor_is_not_shifted_by_new_transactions(history):
+    page, cursor = history.page('B', 2)
+    history.append(Transaction.create_transaction('A', 'B', 123.0))
+    older, _ = history.page('B', 2, cursor)
+
+    assert [t.amount for t in page] == [20.0, 10.0]
+    assert [t.amount for t in older] == [5.0, 4.0]
+
+
+def test_unknown_account_and_empty_limit(history):
+    assert history.page('nobody') == ([], None)
+    assert history.page('A', 0) == ([], None)
+    assert history.count('nobody') == 0
+
+
+def test_service_pages_include_transfers_and_batches():
+    accounts = AccountService()
+    a, b = (
+        accounts.create_account(name, initial_balance=100.0).account_number
+        for name in ('ann', 'bob')
+    )
+    transactions = TransactionService(accounts)
+    transactions.transfer(a, b, 1.0)
+    transactions.process_batch([a, b], [b, a], [2.0, 3.0])
+    transactions.transfer(a, b, 500.0)
+
+    page = transactions.get_account_transaction_page(a, limit=2)
+    assert [t.amount for t in page['transactions']] == [500.0, 3.0]
+    assert [t.status for t in page['transactions']] == ['FAILED', 'COMPLETED']
+    assert page['total'] == 4
+
+    rest = transactions.get_account_transactions(a, limit=5, cursor=page['next_cursor'])
+    assert [t.amount for t in rest] == [2.0, 1.0]
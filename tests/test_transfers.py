@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from src.data_structures.striped_lock import StripedLock
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+@pytest.fixture(params=[False, True], ids=['objects', 'columnar'])
+def bank(request):
+    accounts = AccountService(columnar=request.param)
+    return accounts, TransactionService(accounts)
+
+
+def open_accounts(accounts, *balances):
+    return [
+        accounts.create_account(f'C{i}', initial_balance=balance).account_number
+        for i, balance in enumerate(balances)
+    ]
+
+
+def test_rejected_transfers_leave_balances_alone(bank):
+    accounts, transactions = bank
+    a, b, closed = open_accounts(accounts, 10.0, 0.0, 5.0)
+    accounts.close_account(closed)
+
+    for source, target, amount in [
+        (a, b, 10.01), (a, a, 1.0), (a, 'missing', 1.0),
+        (a, b, 0.0), (a, b, -1.0), (a, closed, 1.0), (closed, b, 1.0)
+    ]:
+        assert transactions.transfer(source, target, amount).status == 'FAILED'
+
+    assert accounts.find_account(a).balance == 10.0
+    assert accounts.find_account(b).balance == 0.0
+    assert accounts.find_account(closed).balance == 5.0
+    assert not transactions.transaction_graph.has_edge(a, b)
+
+
+def test_concurrent_opposite_transfers_conserve_money(bank):
+    accounts, transactions = bank
+    numbers = open_accounts(accounts, *[100.0] * 6)
+    start = threading.Barrier(6)
+
+    def churn(worker):
+        start.wait()
+        for i in range(300):
+            source = numbers[(worker + i) % 6]
+            target = numbers[(worker - i) % 6]
+            transactions.transfer(source, target, 1.25)
+
+    threads = [threading.Thread(target=churn, args=(w,)) for w in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+
+    balances = [accounts.find_account(n).balance for n in numbers]
+    assert sum(balances) == 600.0
+    assert min(balances) >= 0
+
+
+def test_striped_lock_orders_stripes():
+    locks = StripedLock(stripes=4)
+    with locks.hold('a', 'b', 'a'):
+        held = [index for index, lock in enumerate(locks._locks) if lock.locked()]
+        assert held == sorted({locks.stripe('a'), locks.stripe('b')})
+    assert not any(lock.locked() for lock in locks._locks)
+
+
+def test_hold_all_blocks_keyed_writers():
+    locks = StripedLock(stripes=8)
+    entered = threading.Event()
+
+    def writer():
+        with locks.hold('key'):
+            entered.set()
+
+    with locks.hold_all():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        assert not entered.wait(0.05)
+    thread.join(timeout=5)
+    assert entered.is_set()
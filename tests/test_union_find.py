@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from src.data_structures.union_find import UnionFind
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+
+
+def naive_components(edges, keys):
+    component = {key: {key} for key in keys}
+    for a, b, _ in edges:
+        if component[a] is not component[b]:
+            merged = component[a] | component[b]
+            for key in merged:
+                component[key] = merged
+    return component
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_matches_naive_merging(seed):
+    rng = random.Random(seed)
+    keys = [f'K{i}' for i in range(60)]
+    edges = [(rng.choice(keys), rng.choice(keys), rng.randint(1, 5)) for _ in range(50)]
+
+    forest = UnionFind()
+    for key in keys:
+        forest.add(key)
+    half = len(edges) // 2
+    for a, b, amount in edges[:half]:
+        forest.union(a, b, amount)
+    forest.union_many(*zip(*edges[half:]))
+
+    expected = naive_components(edges, keys)
+    assert forest.set_count == len({id(group) for group in expected.values()})
+    for key in keys:
+        assert set(forest.members(key)) == expected[key]
+        assert forest.component_size(key) == len(expected[key])
+        assert forest.find(key) in expected[key]
+
+    for a, b, _ in edges:
+        assert forest.connected(a, b)
+
+    volumes = {}
+    for a, _, amount in edges:
+        root = forest.find(a)
+        volumes[root] = volumes.get(root, 0) + amount
+    for root, volume in volumes.items():
+        assert forest.component_volume(root) == volume
+
+
+def test_unknown_keys_are_singletons():
+    forest = UnionFind()
+    forest.union('a', 'b', 2.0)
+    forest.union('a', 'b', 3.0)
+
+    assert forest.summary('a') == {
+        'representative': forest.find('a'), 'size': 2, 'volume': 5.0, 'transactions': 2
+    }
+    assert forest.summary('z') == {'representative': 'z', 'size': 1, 'volume': 0.0, 'transactions': 0}
+    assert forest.members('z') == ['z']
+    assert forest.connected('z', 'z') and not forest.connected('a', 'z')
+    assert 'z' not in forest and len(forest) == 2
+
+
+def test_long_chains_do_not_recurse():
+    forest = UnionFind()
+    for i in range(100000):
+        forest.union(i, i + 1)
+    assert forest.connected(0, 100000)
+    assert forest.component_size(50000) == 100001
+
+
+def test_service_tracks_components_incrementally():
+    accounts = AccountService()
+    a, b, c, d = (
+        accounts.create_account(f'C{i}', initial_balance=100.0).account_number
+        for i in range(4)
+    )
+    transactions = TransactionService(accounts)
+    transactions.transfer(a, b, 10.0)
+    transactions.process_batch([c], [b], [5.0])
+    transactions.transfer(d, a, 500.0)
+
+    assert transactions.are_accounts_connected(a, c)
+    assert not transactions.are_accounts_connected(a, d)
+    component = transactions.get_account_component(c)
+    assert sorted(component['accounts']) == sorted([a, b, c])
+    assert component['volume'] == 15.0
+
+    rebuilt = transactions.rebuild_components()
+    assert rebuilt.connected(a, c) and not rebuilt.connected(a, d)
+    assert rebuilt.component_volume(a) == 15.0